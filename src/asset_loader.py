@@ -0,0 +1,243 @@
+"""
+백그라운드 스레드에서 SVG 애셋을 래스터화하는 모듈
+
+래스터화(디스크 캐시 읽기, SVG 변환)는 로딩 스레드와 프로세스 풀에서 처리하고,
+완성된 RGBA 데이터는 큐를 통해 메인 스레드로 전달되어 Pygame 표면이 됩니다.
+"""
+import os
+import queue
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+from svg_utils import create_rasterizer_pool, rasterize_svg
+
+_DONE = object()  # 로딩 스레드 종료 표시
+
+
+class AssetLoader:
+    """매니페스트 애셋을 순서대로 래스터화해 큐로 보내는 백그라운드 로더 클래스"""
+
+    def __init__(self, asset_manager, names, max_workers=None):
+        """
+        백그라운드 로더 초기화
+
+        Args:
+            asset_manager (SVGAssetManager): SVG 애셋 관리자
+            names (list): 로드할 애셋 이름 (앞에 있는 것부터 먼저 로드)
+            max_workers (int, optional): SVG 변환 프로세스 수 (기본값: CPU 코어 수)
+        """
+        self.asset_manager = asset_manager
+        self.names = [name for name in dict.fromkeys(names)
+                      if name in asset_manager.manifest and name not in asset_manager.assets]
+        self.max_workers = max_workers
+        self.scale = asset_manager.scale  # 래스터화할 배율 (도중에 배율이 바뀌면 결과를 버림)
+        self.queue = queue.Queue()
+        self.loaded = 0  # 메인 스레드에서 처리한 애셋 수
+        self.finished = not self.names  # 로딩 스레드가 끝났고 큐도 비었는지 여부
+        self._stop = threading.Event()
+        self._fallback_groups = set()  # 이 로더가 대체 경로로 로드한 애셋 묶음 (로딩 스레드 전용)
+        self._thread = threading.Thread(target=self._run, name="asset-loader", daemon=True)
+
+    def start(self):
+        """로딩 스레드 시작"""
+        if not self.finished:
+            self._thread.start()
+
+    def stop(self):
+        """로딩 중단 (아직 시작하지 않은 애셋은 건너뜀)"""
+        self._stop.set()
+
+    def progress(self):
+        """
+        로딩 진행률
+
+        Returns:
+            float: 0~1 사이 진행률
+        """
+        return self.loaded / len(self.names) if self.names else 1.0
+
+    def _run(self):
+        """로딩 스레드 본문: 캐시에 있는 애셋을 먼저 보내고, 나머지는 프로세스 풀에서 변환"""
+        try:
+            specs = [self.asset_manager.manifest[name] for name in self.names]
+            # 원래 SVG 파일이 없는 애셋이 있는 묶음은 처음부터 대체 경로로 로드
+            for spec in self.asset_manager.manifest.values():
+                if (spec.fallback_path and spec.fallback_group is not None
+                        and not os.path.exists(self.asset_manager.preferred_path(spec))):
+                    self._fallback_groups.add(spec.fallback_group)
+            misses = []
+            for spec in specs:
+                if self._stop.is_set():
+                    return
+                result = self._fetch(self._path(spec), self._size(spec), cached_only=True)
+                if result is not None:
+                    self.queue.put((spec.name, result))
+                else:
+                    misses.append(spec)
+            if misses:
+                self._rasterize(misses)
+        finally:
+            self.queue.put(_DONE)
+
+    def _rasterize(self, specs):
+        """
+        캐시에 없는 애셋을 래스터화해 순서대로 큐에 보내기
+
+        Args:
+            specs (list): 래스터화할 AssetSpec 목록
+        """
+        pool = None
+        futures = {}
+        workers = min(len(specs), self.max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            try:
+                pool = create_rasterizer_pool(workers)
+                rasterizer = self.asset_manager.rasterizer.name
+                for spec in specs:
+                    path = self._path(spec)
+                    if os.path.exists(path):
+                        futures[spec.name] = (path, pool.submit(rasterize_svg, path, *self._size(spec), rasterizer))
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                print(f"Warning: Could not start rasterizer pool ({e}). Loading assets sequentially.")
+                futures = {}
+
+        try:
+            for spec in specs:
+                if self._stop.is_set():
+                    return
+                self.queue.put((spec.name, self._load(spec, futures.get(spec.name))))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _load(self, spec, submitted=None):
+        """
+        애셋 하나 래스터화 (실패하면 대체 경로 시도)
+
+        Args:
+            spec (AssetSpec): 매니페스트 항목
+            submitted (tuple, optional): 프로세스 풀에 보낸 (SVG 경로, 변환 중인 래스터 데이터 Future)
+
+        Returns:
+            tuple: (SVG 경로, 크기, RGBA 바이트) 또는 실패하면 None
+        """
+        for path in dict.fromkeys((self._path(spec), spec.fallback_path)):
+            if not path or not os.path.exists(path):
+                continue
+            try:
+                raster = None
+                if submitted is not None and path == submitted[0]:
+                    try:
+                        raster = submitted[1].result()
+                    except BrokenProcessPool:
+                        raster = None  # 작업자가 비정상 종료되면 직접 변환
+                result = self._fetch(path, self._size(spec), raster=raster)
+            except Exception as e:
+                print(f"Error loading SVG {path}: {e}")
+                continue
+            if path == spec.fallback_path and spec.fallback_group is not None:
+                self._switch_group(spec.fallback_group)
+            return result
+        return None
+
+    def _switch_group(self, group):
+        """
+        애셋 묶음을 대체 경로로 바꾸기
+
+        메인 스레드는 묶음의 다른 애셋(이미 보낸 것 포함)도 대체 경로로 다시 로드하므로,
+        그때 디스크 캐시에서 바로 읽을 수 있도록 로딩 스레드에서 미리 래스터화해 둡니다.
+
+        Args:
+            group (str): 애셋 묶음 이름
+        """
+        if group in self._fallback_groups:
+            return
+        self._fallback_groups.add(group)
+        for member in list(self.asset_manager.manifest.values()):
+            if member.fallback_group != group or not os.path.exists(member.fallback_path):
+                continue
+            try:
+                self._fetch(member.fallback_path, self._size(member))
+            except Exception as e:
+                print(f"Error loading SVG {member.fallback_path}: {e}")
+
+    def _path(self, spec):
+        """
+        애셋을 먼저 래스터화할 경로 (애셋 관리자가 등록할 때 사용할 경로와 같음)
+
+        같은 묶음의 애셋이 대체 경로로 바뀌었으면 메인 스레드에서 다시 래스터화하지 않도록
+        처음부터 대체 경로를 사용합니다.
+
+        Args:
+            spec (AssetSpec): 매니페스트 항목
+
+        Returns:
+            str: SVG 파일 경로
+        """
+        if spec.fallback_path and spec.fallback_group in self._fallback_groups:
+            return spec.fallback_path
+        return self.asset_manager.preferred_path(spec)
+
+    def _size(self, spec):
+        """로더를 만들 때의 배율로 래스터화할 (너비, 높이)"""
+        return self.asset_manager.target_size(spec, self.scale)
+
+    def _fetch(self, path, size, raster=None, cached_only=False):
+        """래스터 데이터를 (SVG 경로, 크기, RGBA 바이트) 형태로 가져오기"""
+        width, height = size
+        result = self.asset_manager.fetch_raster(path, width, height, raster, cached_only)
+        if result is None:
+            return None
+        return (path,) + tuple(result)
+
+    def poll(self, max_items=None):
+        """
+        로딩 스레드가 보낸 애셋을 애셋 관리자에 등록 (메인 스레드에서 매 프레임 호출)
+
+        Args:
+            max_items (int, optional): 이번에 처리할 최대 애셋 수
+
+        Returns:
+            list: 이번에 처리한 애셋 이름
+        """
+        names = []
+        while not self.finished and (max_items is None or len(names) < max_items):
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            name = self._handle(item)
+            if name is not None:
+                names.append(name)
+        return names
+
+    def wait(self):
+        """남은 애셋을 모두 받을 때까지 기다리며 등록"""
+        while not self.finished:
+            self._handle(self.queue.get())
+
+    def _handle(self, item):
+        """
+        큐에서 꺼낸 항목 처리
+
+        Args:
+            item: (애셋 이름, 래스터화 결과) 또는 종료 표시
+
+        Returns:
+            str: 처리한 애셋 이름 또는 종료 표시면 None
+        """
+        if item is _DONE:
+            self.finished = True
+            return None
+
+        name, result = item
+        if self.asset_manager.scale != self.scale:
+            pass  # 그사이 배율이 바뀌었으면 새 배율의 로더가 다시 래스터화
+        elif result is None:
+            # 래스터화에 실패한 애셋은 메인 스레드에서 다시 시도해 대체 이미지 생성
+            if name not in self.asset_manager.assets:
+                self.asset_manager.resolve(name)
+        else:
+            self.asset_manager.install_raster(name, *result)
+        self.loaded += 1
+        return name
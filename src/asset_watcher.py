@@ -0,0 +1,116 @@
+"""
+SVG 파일 변경을 감시해 바뀐 애셋만 다시 래스터화하는 모듈 (아트 작업용 핫 리로드)
+
+감시 스레드가 매니페스트에 등록된 SVG 파일의 수정 시각을 주기적으로 확인하고,
+바뀐 파일만 등록된 크기로 래스터화해 큐에 넣습니다. 메인 스레드는 프레임 사이에
+큐에 쌓인 결과를 한 번에 교체하므로 그리는 도중에 애셋이 바뀌지 않습니다.
+"""
+import os
+import queue
+import threading
+
+DEFAULT_WATCH_INTERVAL = 0.5  # 파일 확인 간격 (초)
+
+
+class AssetWatcher:
+    """매니페스트 SVG 파일을 폴링해 바뀐 애셋을 다시 래스터화하는 클래스"""
+
+    def __init__(self, asset_manager, interval=DEFAULT_WATCH_INTERVAL):
+        """
+        애셋 감시기 초기화
+
+        Args:
+            asset_manager (SVGAssetManager): SVG 애셋 관리자
+            interval (float): 파일 확인 간격 (초)
+        """
+        self.asset_manager = asset_manager
+        self.interval = interval
+        self.queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="asset-watcher", daemon=True)
+
+        # 감시할 파일 경로 -> 그 파일을 사용하는 애셋 이름
+        self._watched = {}
+        for spec in asset_manager.manifest.values():
+            for path in (spec.path, spec.fallback_path):
+                if path:
+                    self._watched.setdefault(path, []).append(spec.name)
+        self._stats = {path: self._stat(path) for path in self._watched}
+
+        # 통계
+        self.reloaded = 0  # 교체한 애셋 수
+
+    def start(self):
+        """감시 스레드 시작"""
+        self._thread.start()
+
+    def stop(self):
+        """감시 중단"""
+        self._stop.set()
+
+    @staticmethod
+    def _stat(path):
+        """파일의 (수정 시각, 크기) 또는 없으면 None"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _run(self):
+        """감시 스레드 본문"""
+        pending = {}  # 바뀐 것을 발견한 파일 -> 그때의 상태 (저장이 끝날 때까지 한 번 더 기다림)
+        while not self._stop.wait(self.interval):
+            for path in self._watched:
+                stat = self._stat(path)
+                if stat == self._stats[path]:
+                    pending.pop(path, None)
+                    continue
+                if pending.get(path) != stat:
+                    pending[path] = stat  # 편집기가 아직 쓰는 중일 수 있으므로 다음 확인까지 대기
+                    continue
+
+                del pending[path]
+                self._stats[path] = stat
+                if stat is not None:
+                    self._rasterize(path)
+
+    def _rasterize(self, path):
+        """
+        바뀐 파일을 사용하는 애셋들을 현재 배율의 등록된 크기로 래스터화해 큐에 보내기
+
+        Args:
+            path (str): 바뀐 SVG 파일 경로
+        """
+        manager = self.asset_manager
+        scale = manager.scale
+        for name in self._watched[path]:
+            if manager.source_path(name) != path:
+                continue  # 한글 버튼 대신 영어 버튼을 쓰는 경우처럼 이 파일을 사용하지 않는 애셋
+            width, height = manager.target_size(manager.manifest[name], scale)
+            try:
+                size, pixels = manager.fetch_raster(path, width, height)
+            except Exception as e:
+                print(f"Warning: Could not reload {path}: {e}")
+                continue
+            self.queue.put((name, scale, (path, size, pixels)))
+
+    def poll(self):
+        """
+        다시 래스터화된 애셋을 한 번에 교체 (메인 스레드에서 프레임 사이에 호출)
+
+        Returns:
+            list: 교체한 애셋 이름
+        """
+        names = []
+        while True:
+            try:
+                name, scale, result = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if scale == self.asset_manager.scale and self.asset_manager.reload_raster(name, *result):
+                names.append(name)
+        if names:
+            self.reloaded += len(names)
+            print("Reloaded assets: " + ", ".join(names))
+        return names
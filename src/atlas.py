@@ -0,0 +1,187 @@
+"""
+래스터화된 스프라이트를 하나의 표면으로 묶는 텍스처 아틀라스 모듈
+"""
+import json
+import os
+
+import pygame
+
+ATLAS_FORMAT_VERSION = 1
+DEFAULT_ATLAS_WIDTH = 512
+ATLAS_PADDING = 1  # 스프라이트 사이 여백 (픽셀)
+
+
+def pack_shelves(sizes, max_width=DEFAULT_ATLAS_WIDTH, padding=ATLAS_PADDING):
+    """
+    선반(shelf) 방식으로 사각형 배치 계산
+
+    높이가 큰 스프라이트부터 한 줄에 왼쪽에서 오른쪽으로 채우고,
+    너비를 넘으면 다음 줄로 넘어갑니다.
+
+    Args:
+        sizes (dict): 이름별 크기 (너비, 높이)
+        max_width (int): 아틀라스 최대 너비
+        padding (int): 스프라이트 사이 여백
+
+    Returns:
+        tuple: (이름별 pygame.Rect 딕셔너리, 아틀라스 크기 (너비, 높이))
+    """
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+    regions = {}
+    x = y = 0
+    shelf_height = 0
+    used_width = 0
+
+    for name in order:
+        width, height = sizes[name]
+        if width > max_width:
+            raise ValueError(f"Sprite {name} is wider than the atlas ({width} > {max_width})")
+
+        # 현재 줄에 들어가지 않으면 다음 줄로
+        if x > 0 and x + width > max_width:
+            y += shelf_height + padding
+            x = 0
+            shelf_height = 0
+
+        regions[name] = pygame.Rect(x, y, width, height)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+        used_width = max(used_width, x - padding)
+
+    return regions, (max(used_width, 1), max(y + shelf_height, 1))
+
+
+class TextureAtlas:
+    """여러 스프라이트를 담은 단일 표면과 배치 정보"""
+
+    def __init__(self, surface, regions, sources=None):
+        """
+        텍스처 아틀라스 초기화
+
+        Args:
+            surface (pygame.Surface): 모든 스프라이트가 그려진 표면
+            regions (dict): 이름별 아틀라스 내 영역 (pygame.Rect)
+            sources (dict, optional): 이름별 원본 정보 (캐시 검증용)
+        """
+        self.surface = surface
+        self.regions = regions
+        self.sources = sources or {}
+        self._subsurfaces = {}
+
+    @classmethod
+    def build(cls, surfaces, sources=None, max_width=DEFAULT_ATLAS_WIDTH):
+        """
+        표면들을 하나의 아틀라스로 묶기
+
+        Args:
+            surfaces (dict): 이름별 pygame.Surface
+            sources (dict, optional): 이름별 원본 정보
+            max_width (int): 아틀라스 최대 너비
+
+        Returns:
+            TextureAtlas: 생성된 아틀라스
+        """
+        regions, size = pack_shelves(
+            {name: surface.get_size() for name, surface in surfaces.items()}, max_width
+        )
+
+        atlas_surface = pygame.Surface(size, pygame.SRCALPHA)
+        for name, surface in surfaces.items():
+            atlas_surface.blit(surface, regions[name])
+
+        return cls(_to_display_format(atlas_surface), regions, sources)
+
+    def __contains__(self, name):
+        return name in self.regions
+
+    def get_region(self, name):
+        """
+        스프라이트 영역 가져오기
+
+        Args:
+            name (str): 스프라이트 이름
+
+        Returns:
+            tuple: (아틀라스 표면, pygame.Rect) 또는 없으면 None
+        """
+        rect = self.regions.get(name)
+        if rect is None:
+            return None
+        return self.surface, rect
+
+    def subsurface(self, name):
+        """
+        스프라이트를 아틀라스의 서브서피스로 가져오기
+
+        Args:
+            name (str): 스프라이트 이름
+
+        Returns:
+            pygame.Surface: 아틀라스와 픽셀을 공유하는 서브서피스
+        """
+        sprite = self._subsurfaces.get(name)
+        if sprite is None:
+            sprite = self.surface.subsurface(self.regions[name])
+            self._subsurfaces[name] = sprite
+        return sprite
+
+    def save(self, image_path, index_path):
+        """
+        아틀라스 이미지와 배치 정보를 파일로 저장
+
+        Args:
+            image_path (str): PNG 이미지 경로
+            index_path (str): JSON 배치 정보 경로
+        """
+        os.makedirs(os.path.dirname(image_path) or ".", exist_ok=True)
+        os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+
+        # 이미지를 먼저 교체하고 마지막에 색인을 교체해야 색인이 항상 완전한 이미지를 가리킴
+        tmp_image = image_path + ".tmp.png"
+        pygame.image.save(self.surface, tmp_image)
+        os.replace(tmp_image, image_path)
+
+        index = {
+            "version": ATLAS_FORMAT_VERSION,
+            "size": list(self.surface.get_size()),
+            "regions": {name: list(rect) for name, rect in self.regions.items()},
+            "sources": self.sources,
+        }
+        tmp_index = index_path + ".tmp"
+        with open(tmp_index, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+        os.replace(tmp_index, index_path)
+
+    @classmethod
+    def load(cls, image_path, index_path):
+        """
+        저장된 아틀라스 불러오기
+
+        Args:
+            image_path (str): PNG 이미지 경로
+            index_path (str): JSON 배치 정보 경로
+
+        Returns:
+            TextureAtlas: 불러온 아틀라스 또는 파일이 없거나 손상되었으면 None
+        """
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != ATLAS_FORMAT_VERSION:
+                return None
+            surface = pygame.image.load(image_path)
+        except (OSError, ValueError, pygame.error):
+            return None
+
+        if list(surface.get_size()) != index.get("size"):
+            return None
+
+        regions = {name: pygame.Rect(rect) for name, rect in index.get("regions", {}).items()}
+        return cls(_to_display_format(surface), regions, index.get("sources", {}))
+
+
+def _to_display_format(surface):
+    """디스플레이가 있으면 화면 형식(convert_alpha)으로 변환"""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
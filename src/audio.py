@@ -0,0 +1,185 @@
+"""
+효과음과 배경 음악을 관리하는 오디오 모듈
+
+효과음과 배경 음악은 백그라운드 스레드에서 미리 디코딩하고,
+효과음은 예약된 채널 풀에서 우선순위에 따라 재생합니다.
+채널이 모두 사용 중이면 우선순위가 낮은 소리를 끊고(보이스 스틸링),
+같은 효과음은 한 프레임에 정해진 횟수까지만 재생합니다.
+"""
+import threading
+from collections import namedtuple
+
+import pygame
+
+DEFAULT_AUDIO_CHANNELS = 8  # 효과음용으로 예약할 믹서 채널 수
+DEFAULT_MAX_PER_FRAME = 1  # 같은 효과음을 한 프레임에 재생할 수 있는 횟수
+
+# 효과음 항목 (이름, 파일 경로, 우선순위: 높을수록 다른 소리를 끊고 재생)
+SoundSpec = namedtuple("SoundSpec", ["name", "path", "priority"], defaults=(0,))
+
+
+class AudioSystem:
+    """효과음 채널 풀과 배경 음악을 관리하는 클래스"""
+
+    def __init__(self, sounds=(), music_path=None, num_channels=DEFAULT_AUDIO_CHANNELS,
+                 max_per_frame=DEFAULT_MAX_PER_FRAME):
+        """
+        오디오 시스템 초기화 (pygame.mixer가 초기화되지 않았으면 아무 소리도 내지 않음)
+
+        Args:
+            sounds (list): SoundSpec 목록
+            music_path (str, optional): 배경 음악 파일 경로
+            num_channels (int): 효과음용으로 예약할 채널 수
+            max_per_frame (int): 같은 효과음을 한 프레임에 재생할 수 있는 횟수
+        """
+        self.specs = {spec.name: spec for spec in sounds}
+        self.music_path = music_path
+        self.max_per_frame = max_per_frame
+        self.enabled = pygame.mixer.get_init() is not None
+
+        self._sounds = {}  # 이름 -> pygame.mixer.Sound (로딩 스레드가 채움)
+        self._music_ready = False
+        self._music_wanted = False  # 음악이 준비되기 전에 재생을 요청했는지 여부
+        self._thread = None
+
+        # 채널 풀 (채널별로 재생 중인 소리의 우선순위와 시작 순번)
+        self.channels = []
+        if self.enabled:
+            if pygame.mixer.get_num_channels() < num_channels:
+                pygame.mixer.set_num_channels(num_channels)
+            pygame.mixer.set_reserved(num_channels)
+            self.channels = [pygame.mixer.Channel(index) for index in range(num_channels)]
+        self._channel_priority = [0] * len(self.channels)
+        self._channel_started = [0] * len(self.channels)
+        self._play_count = 0
+        self._frame_counts = {}
+
+        # 통계
+        self.played = 0
+        self.stolen = 0  # 다른 소리를 끊고 재생한 횟수
+        self.dropped = 0  # 채널이 없어 재생하지 못한 횟수
+        self.rate_limited = 0  # 프레임당 제한으로 건너뛴 횟수
+
+    def preload(self):
+        """효과음과 배경 음악을 백그라운드 스레드에서 로드"""
+        if not self.enabled or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._load_all, name="audio-loader", daemon=True)
+        self._thread.start()
+
+    def wait(self):
+        """백그라운드 로딩이 끝날 때까지 대기"""
+        if self._thread is not None:
+            self._thread.join()
+
+    def _load_all(self):
+        """로딩 스레드 본문"""
+        for spec in self.specs.values():
+            try:
+                self._sounds[spec.name] = pygame.mixer.Sound(spec.path)
+            except (pygame.error, OSError, FileNotFoundError):
+                print(f"Warning: Could not load {spec.name} sound.")
+
+        if self.music_path:
+            try:
+                pygame.mixer.music.load(self.music_path)
+                self._music_ready = True
+            except (pygame.error, OSError, FileNotFoundError):
+                print("Warning: Could not load background music.")
+
+    def begin_frame(self):
+        """새 프레임 시작 (프레임당 재생 횟수 초기화, 대기 중인 음악 재생)"""
+        self._frame_counts.clear()
+        if self._music_wanted and self._music_ready:
+            self._music_wanted = False
+            pygame.mixer.music.play(-1)
+
+    def play(self, name):
+        """
+        효과음 재생
+
+        Args:
+            name (str): 효과음 이름
+
+        Returns:
+            bool: 재생했으면 True
+        """
+        sound = self._sounds.get(name)
+        if sound is None:
+            return False
+
+        # 같은 효과음이 한 프레임에 몰리면 건너뜀
+        count = self._frame_counts.get(name, 0)
+        if count >= self.max_per_frame:
+            self.rate_limited += 1
+            return False
+
+        priority = self.specs[name].priority
+        index = self._pick_channel(priority)
+        if index is None:
+            self.dropped += 1
+            return False
+
+        self._frame_counts[name] = count + 1
+        self._play_count += 1
+        self._channel_priority[index] = priority
+        self._channel_started[index] = self._play_count
+        self.channels[index].play(sound)
+        self.played += 1
+        return True
+
+    def _pick_channel(self, priority):
+        """
+        효과음을 재생할 채널 고르기
+
+        빈 채널이 있으면 사용하고, 없으면 우선순위가 가장 낮고 가장 오래된 소리를
+        새 소리의 우선순위가 같거나 높을 때만 끊습니다.
+
+        Args:
+            priority (int): 새 효과음의 우선순위
+
+        Returns:
+            int: 채널 번호 또는 사용할 채널이 없으면 None
+        """
+        victim = None
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+            key = (self._channel_priority[index], self._channel_started[index])
+            if victim is None or key < victim[0]:
+                victim = (key, index)
+
+        if victim is None or victim[0][0] > priority:
+            return None
+        self.channels[victim[1]].stop()
+        self.stolen += 1
+        return victim[1]
+
+    def play_music(self):
+        """배경 음악 반복 재생 (아직 로드 중이면 준비되는 대로 재생)"""
+        if not self.enabled or not self.music_path:
+            return
+        if self._music_ready:
+            pygame.mixer.music.play(-1)
+        else:
+            self._music_wanted = True
+
+    def stop_music(self):
+        """배경 음악 중지"""
+        self._music_wanted = False
+        if self._music_ready:
+            pygame.mixer.music.stop()
+
+    def stats(self):
+        """
+        재생 통계
+
+        Returns:
+            dict: 재생, 보이스 스틸링, 채널 부족, 프레임당 제한 횟수
+        """
+        return {
+            "played": self.played,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+            "rate_limited": self.rate_limited,
+        }
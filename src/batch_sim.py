@@ -0,0 +1,461 @@
+"""
+여러 게임을 NumPy 배열로 한 번에 진행하는 배치 시뮬레이션 모듈 (봇/에이전트 학습용)
+
+simulation.Simulation과 같은 규칙(플레이어 이동, 똥 생성/낙하, 점수, 충돌, 난이도 증가)을
+N개의 독립된 게임에 동시에 적용하며, gym 스타일의 reset()/step(actions) 인터페이스를 제공합니다.
+충돌 효과 타이머(깜빡임, 흔들림)는 화면 표시에만 쓰이므로 포함하지 않습니다.
+masks를 넘기면 사각형이 겹친 똥만 Simulation과 같은 픽셀 마스크로 다시 검사하며,
+넘기지 않으면 사각형만 검사하므로(pixel_collision이 False) 게임 화면보다 조금 더 자주 맞습니다.
+
+    env = BatchSimulation(num_envs=256, seed=0)
+    obs = env.reset()
+    obs, rewards, dones, info = env.step(actions)  # actions: 0=정지, 1=왼쪽, 2=오른쪽
+"""
+import argparse
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
+    INITIAL_POOP_SPEED, POOP_ACCELERATION, POOP_SPAWN_RATE,
+    PLAYER_SPEED, PLAYER_LIVES, POOP_SIZES, PLAYER_SIZE, POOP_SPRITE_SIZES,
+)
+
+# 행동
+ACTION_NOOP = 0
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+
+DEFAULT_POOP_CAPACITY = 16  # 게임당 동시에 떨어지는 똥 수 초기값 (부족하면 자동으로 늘림)
+DEFAULT_HIT_PENALTY = 1.0  # 똥에 맞을 때마다 보상에서 뺄 값
+
+
+def _round_coord(values):
+    """
+    pygame.Rect 좌표에 실수를 대입할 때와 같은 방식으로 정수화 (0.5는 0에서 먼 쪽으로 반올림)
+
+    Args:
+        values (numpy.ndarray): 실수 좌표
+
+    Returns:
+        numpy.ndarray: 정수 좌표
+    """
+    return np.trunc(values + np.copysign(0.5, values)).astype(np.int64)
+
+
+class BatchSimulation:
+    """N개의 게임을 같은 틱에 함께 진행하는 벡터화 시뮬레이션 클래스"""
+
+    def __init__(self, num_envs, seed=None, poop_capacity=DEFAULT_POOP_CAPACITY,
+                 auto_reset=True, hit_penalty=DEFAULT_HIT_PENALTY,
+                 poop_sizes=POOP_SPRITE_SIZES, player_size=PLAYER_SIZE, masks=None):
+        """
+        배치 시뮬레이션 초기화
+
+        Args:
+            num_envs (int): 동시에 진행할 게임 수
+            seed (int, optional): 난수 시드
+            poop_capacity (int): 게임당 똥 배열 초기 크기
+            auto_reset (bool): 게임 오버된 게임을 step 안에서 바로 새로 시작할지 여부
+            hit_penalty (float): 똥에 맞을 때마다 보상에서 뺄 값
+            poop_sizes (dict): 똥 크기 종류별 충돌 영역 크기
+            player_size (tuple): 플레이어 충돌 영역 크기
+            masks (SpriteMasks, optional): 픽셀 단위 충돌 검사에 사용할 마스크 (없으면 사각형만 검사)
+        """
+        self.num_envs = num_envs
+        self.auto_reset = auto_reset
+        self.hit_penalty = hit_penalty
+        self.rng = np.random.default_rng(seed)
+        self.dt = 1.0 / FPS
+        self.spawn_interval = 1.0 / POOP_SPAWN_RATE
+        self.masks = masks
+
+        # 똥 크기 종류별 크기 (POOP_SIZES 순서)
+        self.size_width = np.array([poop_sizes[size][0] for size in POOP_SIZES], dtype=np.int64)
+        self.size_height = np.array([poop_sizes[size][1] for size in POOP_SIZES], dtype=np.int64)
+        self.player_width, self.player_height = player_size
+        self.player_y = SCREEN_HEIGHT - 20 - self.player_height  # 바닥에서 약간 띄움
+
+        # 게임별 상태
+        self.clock_ticks = np.zeros(num_envs, dtype=np.int64)  # 시뮬레이션 시계 (새 게임에도 계속 진행)
+        self.player_x = np.zeros(num_envs, dtype=np.int64)
+        self.lives = np.zeros(num_envs, dtype=np.int64)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.speed = np.zeros(num_envs)  # 새로 생성되는 똥의 속도
+        self.last_spawn_time = np.zeros(num_envs)
+        self.ticks = np.zeros(num_envs, dtype=np.int64)  # 현재 게임의 진행 틱 수
+        self.done = np.zeros(num_envs, dtype=bool)
+
+        # 게임별 똥 배열 (alive가 False인 칸은 빈 칸)
+        self.poop_x = np.zeros((num_envs, poop_capacity), dtype=np.int64)
+        self.poop_y = np.zeros((num_envs, poop_capacity), dtype=np.int64)
+        self.poop_size = np.zeros((num_envs, poop_capacity), dtype=np.int8)
+        self.poop_speed = np.zeros((num_envs, poop_capacity))
+        self.poop_alive = np.zeros((num_envs, poop_capacity), dtype=bool)
+
+        self._reset_envs(np.arange(num_envs))
+
+    @property
+    def pixel_collision(self):
+        """픽셀 마스크로 충돌을 검사하는지 여부 (False면 사각형만 검사)"""
+        return self.masks is not None
+
+    @property
+    def poop_capacity(self):
+        """게임당 똥 배열 크기"""
+        return self.poop_x.shape[1]
+
+    def reset(self, seed=None):
+        """
+        모든 게임을 새로 시작
+
+        Args:
+            seed (int, optional): 새 난수 시드
+
+        Returns:
+            dict: 관측값 (observe 참고)
+        """
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset_envs(np.arange(self.num_envs))
+        return self.observe()
+
+    def _reset_envs(self, envs):
+        """
+        일부 게임을 새로 시작
+
+        Args:
+            envs (numpy.ndarray): 새로 시작할 게임 인덱스
+        """
+        self.player_x[envs] = SCREEN_WIDTH // 2 - self.player_width // 2
+        self.lives[envs] = PLAYER_LIVES
+        self.score[envs] = 0
+        self.speed[envs] = INITIAL_POOP_SPEED
+        self.last_spawn_time[envs] = self.clock_ticks[envs] * self.dt
+        self.ticks[envs] = 0
+        self.done[envs] = False
+        self.poop_alive[envs] = False
+
+    def observe(self):
+        """
+        현재 상태 관측값
+
+        Returns:
+            dict: 플레이어 x 좌표, 생명, 점수 (N,)와 똥 좌표/크기 종류/사용 여부 (N, 용량) 배열
+        """
+        return {
+            "player_x": self.player_x.copy(),
+            "lives": self.lives.copy(),
+            "score": self.score.copy(),
+            "poop_x": self.poop_x.copy(),
+            "poop_y": self.poop_y.copy(),
+            "poop_size": self.poop_size.copy(),
+            "poop_alive": self.poop_alive.copy(),
+        }
+
+    def _grow(self):
+        """똥 배열 크기를 두 배로 늘리기"""
+        capacity = self.poop_capacity
+        for name in ("poop_x", "poop_y", "poop_size", "poop_speed", "poop_alive"):
+            array = getattr(self, name)
+            grown = np.zeros((self.num_envs, capacity * 2), dtype=array.dtype)
+            grown[:, :capacity] = array
+            setattr(self, name, grown)
+
+    def _spawn(self, envs):
+        """
+        화면 위쪽 임의의 위치에 똥 생성
+
+        Args:
+            envs (numpy.ndarray): 똥을 생성할 게임 인덱스
+        """
+        if len(envs) == 0:
+            return
+        if self.poop_alive[envs].all(axis=1).any():
+            self._grow()
+
+        # 게임마다 첫 번째 빈 칸 사용
+        slots = np.argmin(self.poop_alive[envs], axis=1)
+        sizes, xs = self._draw_spawns(envs)
+
+        self.poop_x[envs, slots] = xs
+        self.poop_y[envs, slots] = -self.size_height[sizes]
+        self.poop_size[envs, slots] = sizes
+        self.poop_speed[envs, slots] = self.speed[envs]
+        self.poop_alive[envs, slots] = True
+
+    def _draw_spawns(self, envs):
+        """
+        새 똥의 크기 종류와 x 좌표 뽑기
+
+        Args:
+            envs (numpy.ndarray): 똥을 생성할 게임 인덱스
+
+        Returns:
+            tuple: (크기 종류 인덱스 배열, x 좌표 배열)
+        """
+        sizes = self.rng.integers(0, len(POOP_SIZES), size=len(envs))
+        xs = self.rng.integers(0, SCREEN_WIDTH - self.size_width[sizes] + 1)
+        return sizes, xs
+
+    def step(self, actions):
+        """
+        모든 게임을 한 틱 진행
+
+        Args:
+            actions (array-like): 게임별 행동 (ACTION_NOOP, ACTION_LEFT, ACTION_RIGHT)
+
+        Returns:
+            tuple: (관측값, 보상 (N,), 게임 오버 여부 (N,), 정보 dict)
+                   정보에는 이번 틱에 피한 똥 수 "dodged", 맞은 수 "hits",
+                   게임 오버된 게임의 최종 점수 "final_score"(나머지는 -1)가 들어 있습니다.
+        """
+        actions = np.asarray(actions)
+        active = ~self.done
+        now = self.clock_ticks * self.dt
+
+        # 플레이어 이동 및 화면 경계 처리
+        left = active & (actions == ACTION_LEFT)
+        right = active & (actions == ACTION_RIGHT)
+        self.player_x -= PLAYER_SPEED * left
+        self.player_x += PLAYER_SPEED * right
+        np.clip(self.player_x, 0, SCREEN_WIDTH - self.player_width, out=self.player_x)
+
+        # 똥 생성
+        spawn = active & (now - self.last_spawn_time > self.spawn_interval)
+        self._spawn(np.flatnonzero(spawn))
+        self.last_spawn_time[spawn] = now[spawn]
+
+        # 똥 이동
+        moving = self.poop_alive & active[:, None]
+        self.poop_y = np.where(moving, _round_coord(self.poop_y + self.poop_speed), self.poop_y)
+
+        # 화면 밖으로 나간 똥 제거 및 점수 증가
+        offscreen = moving & (self.poop_y > SCREEN_HEIGHT)
+        dodged = offscreen.sum(axis=1)
+        self.score += dodged
+        self.poop_alive &= ~offscreen
+
+        # 충돌 체크 (pygame.Rect.colliderect와 같은 기준)
+        width = self.size_width[self.poop_size]
+        height = self.size_height[self.poop_size]
+        player_x = self.player_x[:, None]
+        hit = (self.poop_alive & active[:, None]
+               & (self.poop_x < player_x + self.player_width)
+               & (self.poop_x + width > player_x)
+               & (self.poop_y < self.player_y + self.player_height)
+               & (self.poop_y + height > self.player_y))
+        if self.masks is not None and hit.any():
+            # 사각형이 겹친 똥만 마스크로 다시 검사 (투명한 모서리는 맞지 않음)
+            self._reject_mask_misses(hit, right.astype(np.int64) - left)
+        hits = hit.sum(axis=1)
+        self.lives -= hits
+        self.poop_alive &= ~hit
+        finished = active & (self.lives <= 0)
+        self.done |= finished
+
+        # 난이도 증가 및 시계 진행
+        self.speed[active] += POOP_ACCELERATION / FPS
+        self.clock_ticks[active] += 1
+        self.ticks[active] += 1
+
+        rewards = dodged - self.hit_penalty * hits
+        final_score = np.where(finished, self.score, -1)
+        dones = finished.copy()
+        if self.auto_reset and finished.any():
+            self._reset_envs(np.flatnonzero(finished))
+
+        info = {"dodged": dodged, "hits": hits, "final_score": final_score}
+        return self.observe(), rewards, dones, info
+
+
+    def _reject_mask_misses(self, hit, direction):
+        """
+        사각형은 겹쳤지만 불투명 픽셀은 겹치지 않은 충돌 제외 (Simulation과 같은 기준)
+
+        Args:
+            hit (numpy.ndarray): 사각형이 겹친 똥 (N, 용량), 제자리에서 수정
+            direction (numpy.ndarray): 게임별 이번 틱의 이동 방향 (-1: 왼쪽, 0: 정지, 1: 오른쪽)
+        """
+        for env, slot in zip(*np.nonzero(hit)):
+            # 마스크가 없는 쪽은 사각형 전체를 불투명하게 봄 (CollisionWorld.masks_overlap과 같음)
+            player_mask = self.masks.player(int(direction[env]))
+            poop_mask = self.masks.obstacle(POOP_SIZES[self.poop_size[env, slot]])
+            if player_mask is None or poop_mask is None:
+                continue
+            offset = (int(self.poop_x[env, slot] - self.player_x[env]),
+                      int(self.poop_y[env, slot] - self.player_y))
+            if player_mask.overlap(poop_mask, offset) is None:
+                hit[env, slot] = False
+
+
+def _shard_worker(connection, num_envs, seed, kwargs):
+    """
+    프로세스 하나에서 배치 시뮬레이션을 실행하는 작업 함수
+
+    Args:
+        connection (multiprocessing.connection.Connection): 메인 프로세스와 연결된 파이프
+        num_envs (int): 이 프로세스가 맡을 게임 수
+        seed (int): 난수 시드
+        kwargs (dict): BatchSimulation 추가 인자 (pixel_collision이 True면 이 프로세스에서 마스크를 만듦)
+    """
+    if kwargs.pop("pixel_collision", False):
+        from svg_utils import load_sprite_masks  # 사각형만 검사할 때는 SVG 애셋 모듈이 필요 없음
+        kwargs["masks"] = load_sprite_masks()
+    env = BatchSimulation(num_envs, seed=seed, **kwargs)
+    while True:
+        command, argument = connection.recv()
+        if command == "step":
+            connection.send(env.step(argument))
+        elif command == "reset":
+            connection.send(env.reset(argument))
+        elif command == "close":
+            connection.close()
+            return
+
+
+class ShardedBatchSimulation:
+    """게임을 여러 프로세스에 나눠 진행하는 배치 시뮬레이션 클래스 (BatchSimulation과 같은 인터페이스)"""
+
+    def __init__(self, num_envs, num_workers=None, seed=None, pixel_collision=False, **kwargs):
+        """
+        분산 배치 시뮬레이션 초기화
+
+        Args:
+            num_envs (int): 전체 게임 수
+            num_workers (int, optional): 프로세스 수 (기본값: CPU 코어 수)
+            seed (int, optional): 난수 시드 (프로세스마다 다른 시드를 파생)
+            pixel_collision (bool): 픽셀 마스크로 충돌 검사 (마스크는 프로세스 사이에 보낼 수 없어 각 프로세스가 만듦)
+            **kwargs: BatchSimulation 추가 인자 (masks 제외)
+        """
+        if "masks" in kwargs:
+            raise ValueError("Pass pixel_collision=True instead of masks; each worker builds its own masks")
+        kwargs["pixel_collision"] = pixel_collision
+        self.pixel_collision = pixel_collision
+        num_workers = max(1, min(num_workers or os.cpu_count() or 1, num_envs))
+        self.num_envs = num_envs
+        self.shard_sizes = [len(part) for part in np.array_split(np.arange(num_envs), num_workers)]
+        self.bounds = np.cumsum([0] + self.shard_sizes)
+        seeds = np.random.SeedSequence(seed).generate_state(num_workers)
+
+        context = multiprocessing.get_context("spawn")
+        self.connections = []
+        self.processes = []
+        for shard_size, shard_seed in zip(self.shard_sizes, seeds):
+            parent, child = context.Pipe()
+            process = context.Process(target=_shard_worker,
+                                      args=(child, shard_size, int(shard_seed), kwargs), daemon=True)
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    @staticmethod
+    def _concat_observations(observations):
+        """프로세스별 관측값 합치기 (똥 배열 크기가 다르면 빈 칸으로 채움)"""
+        capacity = max(obs["poop_x"].shape[1] for obs in observations)
+        merged = {}
+        for key in observations[0]:
+            parts = []
+            for obs in observations:
+                part = obs[key]
+                if part.ndim == 2 and part.shape[1] < capacity:
+                    part = np.pad(part, ((0, 0), (0, capacity - part.shape[1])))
+                parts.append(part)
+            merged[key] = np.concatenate(parts)
+        return merged
+
+    def reset(self, seed=None):
+        """
+        모든 게임을 새로 시작
+
+        Args:
+            seed (int, optional): 새 난수 시드
+
+        Returns:
+            dict: 관측값
+        """
+        seeds = np.random.SeedSequence(seed).generate_state(len(self.connections)) \
+            if seed is not None else [None] * len(self.connections)
+        for connection, shard_seed in zip(self.connections, seeds):
+            connection.send(("reset", None if shard_seed is None else int(shard_seed)))
+        return self._concat_observations([connection.recv() for connection in self.connections])
+
+    def step(self, actions):
+        """
+        모든 게임을 한 틱 진행
+
+        Args:
+            actions (array-like): 게임별 행동
+
+        Returns:
+            tuple: (관측값, 보상, 게임 오버 여부, 정보 dict)
+        """
+        actions = np.asarray(actions)
+        for index, connection in enumerate(self.connections):
+            connection.send(("step", actions[self.bounds[index]:self.bounds[index + 1]]))
+        results = [connection.recv() for connection in self.connections]
+
+        observations = self._concat_observations([result[0] for result in results])
+        rewards = np.concatenate([result[1] for result in results])
+        dones = np.concatenate([result[2] for result in results])
+        info = {key: np.concatenate([result[3][key] for result in results]) for key in results[0][3]}
+        return observations, rewards, dones, info
+
+    def close(self):
+        """작업 프로세스 종료"""
+        for connection in self.connections:
+            try:
+                connection.send(("close", None))
+                connection.close()
+            except (OSError, BrokenPipeError):
+                pass
+        for process in self.processes:
+            process.join(timeout=1.0)
+        self.connections = []
+        self.processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="배치 시뮬레이션 처리 속도 측정 (무작위 행동)")
+    parser.add_argument("--envs", type=int, default=1024, help="동시에 진행할 게임 수")
+    parser.add_argument("--ticks", type=int, default=FPS * 60, help="진행할 틱 수")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="프로세스 수 (0이면 현재 프로세스에서 실행)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--rect-collision", action="store_true",
+                        help="픽셀 마스크 없이 사각형만으로 충돌 검사 (게임 화면과 점수가 다를 수 있음)")
+    args = parser.parse_args()
+
+    pixel_collision = not args.rect_collision
+    if args.workers:
+        env = ShardedBatchSimulation(args.envs, args.workers, seed=args.seed, pixel_collision=pixel_collision)
+    elif pixel_collision:
+        from svg_utils import load_sprite_masks
+        env = BatchSimulation(args.envs, seed=args.seed, masks=load_sprite_masks())
+    else:
+        env = BatchSimulation(args.envs, seed=args.seed)
+    action_rng = np.random.default_rng(args.seed)
+
+    env.reset()
+    games = 0
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        _, _, dones, _ = env.step(action_rng.integers(0, 3, size=args.envs))
+        games += int(dones.sum())
+    elapsed = time.perf_counter() - start
+    if args.workers:
+        env.close()
+
+    print(f"env_ticks_per_second: {args.envs * args.ticks / elapsed:.0f}")
+    print(f"finished_games: {games}")
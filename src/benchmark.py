@@ -0,0 +1,461 @@
+"""
+애셋 로딩, 게임 업데이트, 그리기 성능 측정 모듈
+
+SDL 더미 드라이버로 화면 없이 실행되며 결과를 JSON으로 저장해 이전 결과와 비교할 수 있습니다.
+
+    python src/benchmark.py --counts 10 100 1000 10000 --output bench.json
+    python src/benchmark.py --compare bench.json
+    python src/benchmark.py --replay session.pdrp   # 실제 플레이 입력으로 Game.update 측정
+    python src/benchmark.py --rasterizers cairosvg cairo pygame   # SVG 래스터화 백엔드 비교
+"""
+import os
+
+# pygame을 불러오기 전에 화면/사운드 없이 실행되도록 설정
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, MENU, PLAYING, GAME_OVER, POOP_SIZES
+from replay import Replay
+from rasterizers import RASTERIZERS, pixel_difference
+from simulation import IdleInput
+from svg_utils import SVGAssetManager
+
+DEFAULT_COUNTS = [10, 100, 1000, 10000]
+DEFAULT_REPEAT = 30
+DEFAULT_REGRESSION_THRESHOLD = 0.10  # 중앙값이 10% 이상 느려지면 회귀로 판단
+STATE_NAMES = {MENU: "MENU", PLAYING: "PLAYING", GAME_OVER: "GAME_OVER"}
+
+
+def percentile(samples, fraction):
+    """
+    정렬된 표본의 백분위수 (최근접 순위 방식)
+
+    Args:
+        samples (list): 정렬된 측정값 목록
+        fraction (float): 백분위 (0~1)
+
+    Returns:
+        float: 백분위수 값
+    """
+    index = min(len(samples) - 1, max(0, int(round(fraction * len(samples) + 0.5)) - 1))
+    return samples[index]
+
+
+def measure(name, func, setup=None, repeat=DEFAULT_REPEAT, warmup=2, params=None):
+    """
+    함수 실행 시간과 메모리 할당량 측정
+
+    시간 측정과 할당량 측정은 tracemalloc 부하가 시간에 섞이지 않도록 따로 실행합니다.
+
+    Args:
+        name (str): 측정 항목 이름
+        func (callable): 측정할 함수
+        setup (callable, optional): 매 측정 전에 호출할 준비 함수 (시간에 포함하지 않음)
+        repeat (int): 측정 횟수
+        warmup (int): 측정 전에 버리는 실행 횟수
+        params (dict, optional): 결과에 함께 기록할 매개변수
+
+    Returns:
+        dict: 측정 결과 (ms 단위 통계, 할당 바이트/블록 수)
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    samples.sort()
+
+    # 메모리 할당량 측정 (한 번 실행)
+    if setup:
+        setup()
+    tracemalloc.start()
+    before_size, _ = tracemalloc.get_traced_memory()
+    before_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.reset_peak()
+    func()
+    after_size, peak_size = tracemalloc.get_traced_memory()
+    after_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+
+    return {
+        "name": name,
+        "params": params or {},
+        "samples": repeat,
+        "median_ms": statistics.median(samples),
+        "p95_ms": percentile(samples, 0.95),
+        "mean_ms": statistics.fmean(samples),
+        "min_ms": samples[0],
+        "max_ms": samples[-1],
+        "alloc_peak_bytes": max(0, peak_size - before_size),
+        "alloc_net_bytes": after_size - before_size,
+        "alloc_net_blocks": after_blocks - before_blocks,
+    }
+
+
+def populate(game, count, seed=0):
+    """
+    게임을 PLAYING 상태로 만들고 똥과 파티클을 count개씩 배치
+
+    Args:
+        game (Game): 게임 객체
+        count (int): 똥과 파티클 수
+        seed (int): 배치 난수 시드
+    """
+    rng = random.Random(seed)
+    sim = game.sim
+    sim.reset(seed)
+    game.start_game()  # 화면의 플레이어와 HUD가 새 시뮬레이션 상태를 사용하도록 시드를 정한 뒤 시작
+    for _ in range(count):
+        size = rng.choice(POOP_SIZES)
+        width, height = sim.poop_sizes[size]
+        poop = sim.poop_pool.acquire(size, (width, height),
+                                     rng.randint(0, SCREEN_WIDTH - width), sim.poop_speed)
+        poop.rect.y = rng.randint(-height, SCREEN_HEIGHT - height)
+        sim.poops.append(poop)
+
+    game.particles.clear()
+    game.particles.rng = np.random.default_rng(seed)
+    remaining = count
+    while remaining > 0:
+        burst = min(20, remaining)
+        game.particles.emit(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT), burst)
+        remaining -= burst
+
+
+def bench_asset_loading(repeat):
+    """
+    SVGAssetManager.load_all_assets 측정 (디스크 캐시가 빈 경우와 채워진 경우)
+
+    Args:
+        repeat (int): 측정 횟수
+
+    Returns:
+        list: 측정 결과 목록
+    """
+    results = []
+    cache_root = tempfile.mkdtemp(prefix="poop_dodge_bench_")
+    try:
+        cold_dir = os.path.join(cache_root, "cold")
+
+        def cold_setup():
+            shutil.rmtree(cold_dir, ignore_errors=True)
+
+        def cold():
+            SVGAssetManager(cache_dir=cold_dir).load_all_assets((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        results.append(measure("load_all_assets", cold, cold_setup, repeat=max(3, repeat // 5),
+                               warmup=1, params={"cache": "cold"}))
+
+        warm_dir = os.path.join(cache_root, "warm")
+        SVGAssetManager(cache_dir=warm_dir).load_all_assets((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        def warm():
+            SVGAssetManager(cache_dir=warm_dir).load_all_assets((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        results.append(measure("load_all_assets", warm, repeat=repeat, params={"cache": "warm"}))
+    finally:
+        shutil.rmtree(cache_root, ignore_errors=True)
+    return results
+
+
+def bench_rasterizers(names, repeat):
+    """
+    SVG 래스터화 백엔드별로 매니페스트 애셋의 변환 시간과 픽셀 차이 측정
+
+    디스크 캐시를 거치지 않고 각 애셋을 등록된 크기로 변환하며,
+    첫 번째 백엔드의 결과를 기준으로 나머지 백엔드의 픽셀 차이를 계산합니다.
+
+    Args:
+        names (list): 비교할 백엔드 이름 (첫 번째가 기준)
+        repeat (int): 애셋별 측정 횟수
+
+    Returns:
+        list: 측정 결과 목록 (기준이 아닌 백엔드는 pixel_diff 포함)
+    """
+    rasterizers = []
+    for name in names:
+        if RASTERIZERS[name].available:
+            rasterizers.append(RASTERIZERS[name])
+        else:
+            print(f"Warning: SVG rasterizer '{name}' is not available. Skipping.")
+
+    manifest = SVGAssetManager(use_disk_cache=False).build_default_manifest((SCREEN_WIDTH, SCREEN_HEIGHT))
+    results = []
+    for spec in manifest:
+        if not os.path.exists(spec.path):
+            continue
+        reference = None
+        for index, rasterizer in enumerate(rasterizers):
+            def rasterize():
+                return rasterizer.rasterize(spec.path, *spec.size)
+
+            try:
+                raster = rasterize()
+            except Exception as e:
+                print(f"Warning: {rasterizer.name} could not rasterize {spec.path}: {e}")
+                continue
+            result = measure("rasterize_svg", rasterize, repeat=repeat, warmup=0,
+                             params={"rasterizer": rasterizer.name, "asset": spec.name})
+            if index == 0:
+                reference = raster
+            elif reference is not None:
+                result["pixel_diff"] = pixel_difference(reference, raster)
+            results.append(result)
+    return results
+
+
+def bench_game(game, counts, repeat):
+    """
+    Game.update, Game.draw, Player.apply_hit_effect 측정
+
+    Args:
+        game (Game): 게임 객체
+        counts (list): 측정할 똥/파티클 수 목록
+        repeat (int): 측정 횟수
+
+    Returns:
+        list: 측정 결과 목록
+    """
+    results = []
+
+    # 메뉴와 게임 오버 화면 그리기
+    game.state = MENU
+    results.append(measure("Game.draw", game.draw, repeat=repeat,
+                           params={"state": STATE_NAMES[MENU], "entities": 0}))
+    game.start_game()
+    game.game_over()
+    results.append(measure("Game.draw", game.draw, repeat=repeat,
+                           params={"state": STATE_NAMES[GAME_OVER], "entities": 0}))
+
+    # 측정 도중 게임 오버가 되지 않도록 (이후 재생 측정에는 영향을 주지 않게 되돌림)
+    game.sim.invincible = True
+    try:
+        for count in counts:
+            params = {"state": STATE_NAMES[PLAYING], "entities": count}
+            results.append(measure("Game.update", game.update,
+                                   setup=lambda: populate(game, count), repeat=repeat, params=params))
+            populate(game, count)
+            results.append(measure("Game.draw", game.draw, repeat=repeat, params=params))
+
+        populate(game, 0)
+        results.append(measure("Player.apply_hit_effect", game.player.apply_hit_effect,
+                               repeat=repeat * 10))
+    finally:
+        game.sim.invincible = False
+    return results
+
+
+def bench_replay(game, path, repeat):
+    """
+    기록된 플레이 입력을 화면 없이 재생하는 시간 측정 (Game.update 전체 경로)
+
+    Args:
+        game (Game): 게임 객체
+        path (str): 입력 기록 파일 경로
+        repeat (int): 측정 횟수
+
+    Returns:
+        list: 측정 결과 목록
+    """
+    replay = Replay.load(path)
+    params = {"replay": os.path.basename(path), "frames": len(replay)}
+    return [measure("Game.play_replay", lambda: game.play_replay(replay),
+                    repeat=repeat, warmup=1, params=params)]
+
+
+def run_suite(counts=DEFAULT_COUNTS, repeat=DEFAULT_REPEAT, include_assets=True, replays=()):
+    """
+    전체 벤치마크 실행
+
+    Args:
+        counts (list): 측정할 똥/파티클 수 목록
+        repeat (int): 항목별 측정 횟수
+        include_assets (bool): 애셋 로딩 측정 포함 여부
+        replays (list): 재생 시간을 측정할 입력 기록 파일 경로
+
+    Returns:
+        dict: 실행 환경 정보와 측정 결과
+    """
+    from main import Game
+
+    game = Game(seed=0)
+    game.finish_loading()
+    game.sim.input_source = IdleInput()
+
+    results = []
+    if include_assets:
+        results.extend(bench_asset_loading(repeat))
+    results.extend(bench_game(game, counts, repeat))
+    for path in replays:
+        results.extend(bench_replay(game, path, max(3, repeat // 5)))
+
+    meta = environment_meta()
+    meta.update({
+        "counts": list(counts),
+        "repeat": repeat,
+        "replays": [os.path.basename(path) for path in replays],
+    })
+    return {"meta": meta, "results": results}
+
+
+def run_rasterizer_comparison(names, repeat=DEFAULT_REPEAT):
+    """
+    SVG 래스터화 백엔드 비교 실행
+
+    Args:
+        names (list): 비교할 백엔드 이름 (첫 번째가 픽셀 차이 기준)
+        repeat (int): 애셋별 측정 횟수
+
+    Returns:
+        dict: 실행 환경 정보와 측정 결과
+    """
+    meta = environment_meta()
+    meta.update({
+        "repeat": repeat,
+        "rasterizers": {name: RASTERIZERS[name].version
+                        for name in names if RASTERIZERS[name].available},
+    })
+    return {"meta": meta, "results": bench_rasterizers(names, repeat)}
+
+
+def environment_meta():
+    """측정 결과에 함께 저장할 실행 환경 정보"""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def result_key(result):
+    """비교할 때 사용하는 측정 항목 키"""
+    return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def compare(current, baseline, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """
+    이전 결과와 비교하여 느려진 항목 찾기
+
+    Args:
+        current (dict): 이번 측정 결과
+        baseline (dict): 이전 측정 결과
+        threshold (float): 회귀로 판단할 중앙값 증가 비율
+
+    Returns:
+        list: (항목 키, 이전 중앙값, 현재 중앙값, 변화율, 회귀 여부) 목록
+    """
+    previous = {result_key(result): result for result in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = result_key(result)
+        if key not in previous:
+            continue
+        before = previous[key]["median_ms"]
+        after = result["median_ms"]
+        change = (after - before) / before if before > 0 else 0.0
+        rows.append((key, before, after, change, change > threshold))
+    return rows
+
+
+def print_results(report):
+    """측정 결과를 표로 출력"""
+    print(f"{'benchmark':<58} {'median':>10} {'p95':>10} {'alloc':>12}")
+    for result in report["results"]:
+        label = result["name"] + " " + " ".join(f"{k}={v}" for k, v in result["params"].items())
+        print(f"{label:<58} {result['median_ms']:>8.3f}ms {result['p95_ms']:>8.3f}ms "
+              f"{result['alloc_peak_bytes']:>11,}B")
+
+
+def print_rasterizer_results(report):
+    """래스터화 백엔드 비교 결과를 애셋별 표로 출력"""
+    print(f"{'asset':<20} {'rasterizer':<10} {'median':>10} {'max diff':>9} {'mean diff':>10} {'differing':>10}")
+    totals = {}
+    for result in report["results"]:
+        params = result["params"]
+        totals[params["rasterizer"]] = totals.get(params["rasterizer"], 0.0) + result["median_ms"]
+        diff = result.get("pixel_diff")
+        if "pixel_diff" not in result:
+            columns = f"{'(reference)':>9}"
+        elif diff is None:
+            columns = f"{'(size differs)':>9}"
+        else:
+            columns = f"{diff['max']:>9} {diff['mean']:>10.3f} {diff['differing']:>10.2%}"
+        print(f"{params['asset']:<20} {params['rasterizer']:<10} {result['median_ms']:>8.3f}ms {columns}")
+    for name, total in totals.items():
+        print(f"{'total':<20} {name:<10} {total:>8.3f}ms")
+
+
+def main(argv=None):
+    """명령줄 실행"""
+    parser = argparse.ArgumentParser(description="똥피하기 게임 성능 측정")
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS,
+                        help="측정할 똥/파티클 수")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="항목별 측정 횟수")
+    parser.add_argument("--skip-assets", action="store_true", help="애셋 로딩 측정 생략")
+    parser.add_argument("--replay", nargs="+", default=[], metavar="PATH",
+                        help="재생 시간을 측정할 입력 기록 파일 (main.py --record로 저장)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="회귀로 판단할 중앙값 증가 비율")
+    parser.add_argument("--rasterizers", nargs="+", choices=sorted(RASTERIZERS), metavar="NAME",
+                        help="게임 대신 SVG 래스터화 백엔드를 애셋별로 비교 (첫 번째가 픽셀 차이 기준, "
+                             f"선택: {', '.join(sorted(RASTERIZERS))})")
+    args = parser.parse_args(argv)
+
+    output_path = os.path.abspath(args.output) if args.output else None
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+    replay_paths = [os.path.abspath(path) for path in args.replay]
+
+    # 애셋 경로가 저장소 루트 기준이므로 루트에서 실행
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if args.rasterizers:
+        report = run_rasterizer_comparison(args.rasterizers, max(3, args.repeat // 5))
+        print_rasterizer_results(report)
+    else:
+        report = run_suite(args.counts, args.repeat, include_assets=not args.skip_assets,
+                           replays=replay_paths)
+        print_results(report)
+
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if compare_path:
+        with open(compare_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = 0
+        print()
+        for key, before, after, change, regressed in compare(report, baseline, args.threshold):
+            marker = "REGRESSION" if regressed else ""
+            print(f"{key:<70} {before:>8.3f} -> {after:>8.3f}ms ({change:+.1%}) {marker}")
+            regressions += regressed
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+바뀐 영역만 다시 그리는 더티 렉트(dirty rectangle) 렌더링 모듈
+"""
+import pygame
+
+# 더티 영역이 화면의 이 비율을 넘으면 전체 화면을 다시 그림
+DEFAULT_FULL_REDRAW_THRESHOLD = 0.4
+
+
+class DirtyRectRenderer:
+    """이전 프레임과 현재 프레임에 그린 영역만 복원하고 화면에 반영하는 클래스"""
+
+    def __init__(self, screen, threshold=DEFAULT_FULL_REDRAW_THRESHOLD):
+        """
+        더티 렉트 렌더러 초기화
+
+        Args:
+            screen (pygame.Surface): 그릴 화면 (창의 서브서피스여도 됨)
+            threshold (float): 전체 다시 그리기로 전환할 더티 영역 비율 (0~1)
+        """
+        self.screen = screen
+        self.threshold = threshold
+        self.screen_rect = screen.get_rect()
+        self.offset = screen.get_abs_offset()  # 창 안에서 화면의 위치 (디스플레이 갱신용)
+        self._previous = []  # 지난 프레임에 그린 영역
+        self._current = []  # 이번 프레임에 그린 영역
+        self._full_redraw = True
+
+        # 통계
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self):
+        """다음 프레임을 전체 다시 그리도록 표시 (상태 전환 등)"""
+        self._full_redraw = True
+        self._current = []
+
+    def _area(self, rects):
+        """영역들의 넓이 합 (겹치는 부분은 중복 계산)"""
+        return sum(rect.width * rect.height for rect in rects)
+
+    def _over_threshold(self, rects):
+        """영역 합이 전체 다시 그리기 기준을 넘는지 확인"""
+        return self._area(rects) > self.threshold * self.screen_rect.width * self.screen_rect.height
+
+    def restore(self, background):
+        """
+        지난 프레임에 그린 영역을 배경으로 복원
+
+        복원할 영역이 너무 크면 배경 전체를 그리고 전체 다시 그리기로 전환합니다.
+
+        Args:
+            background (pygame.Surface): 화면 크기의 배경 표면
+        """
+        if self._full_redraw or self._over_threshold(self._previous):
+            self.screen.blit(background, (0, 0))
+            self._full_redraw = True
+            return
+
+        for rect in self._previous:
+            self.screen.blit(background, rect, rect)
+
+    def add(self, rect):
+        """
+        이번 프레임에 그린 영역 추가
+
+        Args:
+            rect (pygame.Rect): 그린 영역 (blit 반환값 등, None이면 무시)
+        """
+        if rect:
+            self._current.append(rect)
+
+    def add_many(self, rects):
+        """
+        이번 프레임에 그린 영역 여러 개 추가
+
+        Args:
+            rects (iterable): 그린 영역 목록
+        """
+        self._current.extend(rect for rect in rects if rect)
+
+    def present(self):
+        """이번 프레임을 화면에 반영 (더티 영역만 또는 전체)"""
+        rects = [rect.clip(self.screen_rect) for rect in self._previous + self._current]
+        rects = [rect for rect in rects if rect]
+
+        if self._full_redraw or self._over_threshold(rects):
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            if self.offset != (0, 0):
+                rects = [rect.move(self.offset) for rect in rects]
+            pygame.display.update(rects)
+            self.partial_frames += 1
+
+        self._previous = self._current
+        self._current = []
+        self._full_redraw = False
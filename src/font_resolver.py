@@ -0,0 +1,189 @@
+"""
+한글 폰트 파일을 찾고 결과를 디스크에 저장하는 모듈
+
+시스템 폰트 검색(fontconfig)은 폰트가 많은 환경에서 느리므로,
+한 번 찾은 폰트 경로와 한글 사용 여부를 캐시해 다음 실행부터는 파일 수정 시각만 확인합니다.
+"""
+import json
+import os
+import tempfile
+
+import pygame
+
+from raster_cache import DEFAULT_CACHE_DIR
+
+FONT_CACHE_VERSION = 2
+FONT_CACHE_FILENAME = "font.json"
+
+# 먼저 확인할 폰트 파일 경로
+PREFERRED_FONT_PATHS = [
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+]
+
+# 시스템 폰트에서 찾을 한글 지원 폰트 이름 (pygame.font.get_fonts() 형식)
+KOREAN_FONT_NAMES = ["notosanscjk", "notosanscjkkr", "malgungothic", "gulim", "batang", "dotum"]
+
+# 폰트 설치/삭제를 감지하기 위해 수정 시각을 확인할 디렉토리 (하위 디렉토리 포함)
+FONT_DIRS = [
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.join(os.path.expanduser("~"), ".local", "share", "fonts"),
+    os.path.join(os.path.expanduser("~"), ".fonts"),
+    "/Library/Fonts",
+    os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+]
+
+
+def _mtime(path):
+    """파일 수정 시각 (없으면 None)"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _dir_mtimes(directory):
+    """
+    디렉토리와 모든 하위 디렉토리의 수정 시각
+
+    폰트는 보통 /usr/share/fonts/truetype/... 처럼 하위 디렉토리에 설치되고,
+    파일을 추가/삭제/교체(이름 바꾸기)하면 그 파일이 있는 디렉토리의 수정 시각만 바뀝니다.
+
+    Args:
+        directory (str): 확인할 디렉토리
+
+    Returns:
+        dict: 디렉토리 경로 -> 수정 시각 (없는 디렉토리는 포함하지 않음)
+    """
+    mtimes = {}
+    for root, dirnames, _ in os.walk(directory):
+        dirnames.sort()
+        mtime = _mtime(root)
+        if mtime is not None:
+            mtimes[root] = mtime
+    return mtimes
+
+
+class FontResolver:
+    """한글 폰트 파일 경로를 찾고 캐시하는 클래스"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, preferred_paths=PREFERRED_FONT_PATHS,
+                 font_names=KOREAN_FONT_NAMES, font_dirs=FONT_DIRS):
+        """
+        폰트 검색기 초기화
+
+        Args:
+            cache_dir (str): 검색 결과를 저장할 디렉토리
+            preferred_paths (list): 먼저 확인할 폰트 파일 경로
+            font_names (list): 시스템 폰트에서 찾을 폰트 이름
+            font_dirs (list): 수정 시각으로 폰트 설치 여부를 확인할 디렉토리 (하위 디렉토리 포함)
+        """
+        self.cache_path = os.path.join(cache_dir, FONT_CACHE_FILENAME)
+        self.preferred_paths = preferred_paths
+        self.font_names = font_names
+        self.font_dirs = font_dirs
+        self.from_cache = False  # 마지막 resolve 결과가 캐시에서 왔는지 여부
+
+    def resolve(self):
+        """
+        한글 폰트 파일 찾기 (캐시가 유효하면 시스템 폰트 검색 생략)
+
+        Returns:
+            tuple: (폰트 파일 경로 또는 None, 영어 텍스트 사용 여부)
+        """
+        cached = self._load()
+        if cached is not None:
+            self.from_cache = True
+            return cached["path"], cached["use_english_text"]
+
+        self.from_cache = False
+        path = self._search()
+        self._save(path, path is None)
+        return path, path is None
+
+    def invalidate(self):
+        """캐시 삭제 (저장된 폰트를 열 수 없을 때 호출)"""
+        try:
+            os.remove(self.cache_path)
+        except OSError:
+            pass
+
+    def _search(self):
+        """
+        폰트 파일 검색
+
+        Returns:
+            str: 폰트 파일 경로 또는 찾지 못하면 None
+        """
+        # 1. 알려진 경로의 폰트 사용
+        for path in self.preferred_paths:
+            if os.path.isfile(path):
+                return path
+
+        # 2. 시스템 폰트 중 한글 지원 폰트 찾기 (fontconfig 검색)
+        try:
+            return pygame.font.match_font(self.font_names)
+        except Exception as e:
+            print(f"Warning: Could not search system fonts: {e}")
+            return None
+
+    def _fingerprint(self, path):
+        """
+        캐시 유효성 확인용 수정 시각
+
+        Args:
+            path (str): 폰트 파일 경로 또는 None
+
+        Returns:
+            dict: 폰트 파일과 폰트 디렉토리(하위 디렉토리 포함)의 수정 시각
+        """
+        dirs = {}
+        for directory in self.font_dirs:
+            dirs.update(_dir_mtimes(directory))
+        return {
+            "font": _mtime(path) if path else None,
+            "dirs": dirs,
+        }
+
+    def _load(self):
+        """
+        캐시 읽기
+
+        Returns:
+            dict: 유효한 캐시 내용 또는 없거나 오래되었으면 None
+        """
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("version") != FONT_CACHE_VERSION:
+            return None
+        if cached.get("fingerprint") != self._fingerprint(cached.get("path")):
+            return None
+        return cached
+
+    def _save(self, path, use_english_text):
+        """
+        검색 결과를 캐시에 저장
+
+        Args:
+            path (str): 폰트 파일 경로 또는 None
+            use_english_text (bool): 영어 텍스트 사용 여부
+        """
+        data = {
+            "version": FONT_CACHE_VERSION,
+            "path": path,
+            "use_english_text": use_english_text,
+            "fingerprint": self._fingerprint(path),
+        }
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write font cache: {e}")
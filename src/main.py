@@ -5,269 +5,156 @@ SVG 그래픽을 사용한 구현
 import pygame
 import sys
 import os
+import argparse
 import random
 import time
 
 # 필요한 모듈 가져오기
-from svg_utils import SVGAssetManager
+from settings import *
+from svg_utils import SVGAssetManager, load_sprite_masks
+from rasterizers import RASTERIZERS
+from dirty_rects import DirtyRectRenderer
+from particles import ParticleSystem
+from simulation import Simulation, PlayerState, KeyboardInput
+from profiling import FrameProfiler, NullProfiler
+from text_cache import TextCache
+from font_resolver import FontResolver
+from sprite_variants import SpriteVariantCache
+from replay import Replay, ReplayRecorder, ReplayInput
+from asset_loader import AssetLoader
+from asset_watcher import AssetWatcher
+from audio import AudioSystem, SoundSpec
+from render_batch import RenderBatch
+from viewport import Viewport
+from static_layers import StaticLayerCache, to_display_format
+from quality import QualityGovernor
 
-# 게임 설정
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-FPS = 60
+# 게임 상태별로 미리 로드할 애셋
+ASSET_PREFETCH_HINTS = {
+    MENU: ["background", "start_button"],
+    PLAYING: ["player_normal", "player_left", "player_right",
+              "poop_small", "poop_medium", "poop_large", "life_icon"],
+    GAME_OVER: ["restart_button"],
+}
+PREFETCH_FRAME_BUDGET = 0.5 / FPS  # 프레임 시간이 이보다 짧을 때만 미리 로드
 
-# 색상 정의
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 0, 0)
+# 백그라운드 로딩 순서 (메뉴 화면 애셋이 준비되면 바로 메뉴로 전환)
+ASSET_LOAD_ORDER = ASSET_PREFETCH_HINTS[MENU] + ASSET_PREFETCH_HINTS[PLAYING] + ASSET_PREFETCH_HINTS[GAME_OVER]
 
-# 게임 상태
-MENU = 0
-PLAYING = 1
-GAME_OVER = 2
+# 텍스처 아틀라스로 묶을 스프라이트 (배경처럼 큰 이미지는 제외)
+USE_SPRITE_ATLAS = True
+ATLAS_ASSETS = ["player_normal", "player_left", "player_right",
+                "poop_small", "poop_medium", "poop_large",
+                "start_button", "restart_button",
+                "pause_button", "life_icon", "score_icon"]
 
-# 게임 난이도 설정
-INITIAL_POOP_SPEED = 3
-POOP_ACCELERATION = 0.1
-POOP_SPAWN_RATE = 1.0  # 초당 생성 개수
-PLAYER_SPEED = 5
+# 효과음 (우선순위가 높은 게임 오버 소리는 채널이 부족하면 충돌 소리를 끊고 재생)
+SOUND_EFFECTS = [
+    SoundSpec("collision", "assets/sounds/collision.wav", priority=1),
+    SoundSpec("game_over", "assets/sounds/game_over.wav", priority=10),
+]
+MUSIC_PATH = "assets/sounds/background.mp3"
 
-class Particle:
-    """충돌 효과를 위한 파티클 클래스"""
-    
-    def __init__(self, x, y, color=(139, 69, 19)):
-        """
-        파티클 초기화
-        
-        Args:
-            x (int): 시작 x 좌표
-            y (int): 시작 y 좌표
-            color (tuple): 파티클 색상 (R, G, B)
-        """
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(2, 5)
-        self.speed_x = random.uniform(-3, 3)
-        self.speed_y = random.uniform(-7, -2)
-        self.gravity = 0.3
-        self.life = 30  # 파티클 수명 (프레임 수)
-        
-    def update(self):
-        """파티클 상태 업데이트"""
-        self.x += self.speed_x
-        self.y += self.speed_y
-        self.speed_y += self.gravity
-        self.life -= 1
-        
-        # 크기 감소
-        if self.size > 0.2:
-            self.size -= 0.1
-            
-    def draw(self, screen):
-        """
-        파티클 그리기
-        
-        Args:
-            screen (pygame.Surface): 그릴 화면
-        """
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), int(self.size))
-        
-    def is_dead(self):
-        """
-        파티클이 수명을 다했는지 확인
-        
-        Returns:
-            bool: 수명이 다했으면 True
-        """
-        return self.life <= 0
+# 충돌/깜빡임 효과 이미지를 미리 만들어 둘 플레이어 스프라이트
+PLAYER_SPRITE_NAMES = ["player_normal", "player_left", "player_right"]
+
+# 충돌 마스크를 만드는 스프라이트
+COLLISION_SPRITE_NAMES = set(PLAYER_DIRECTION_SPRITES.values()) | set(POOP_ASSET_NAMES.values())
+
+# 픽셀 단위 충돌 검사 사용 여부 (False면 사각형만 검사)
+USE_PIXEL_COLLISION = True
 
 class Player:
-    """플레이어 클래스"""
+    """플레이어 클래스 (화면 표시 담당, 위치와 충돌 상태는 PlayerState가 관리)"""
     
-    def __init__(self, asset_manager):
+    def __init__(self, asset_manager, state=None, sprites=None):
         """
         플레이어 초기화
         
         Args:
             asset_manager (SVGAssetManager): SVG 애셋 관리자
+            state (PlayerState, optional): 시뮬레이션의 플레이어 상태
+            sprites (SpriteVariantCache, optional): 미리 만든 플레이어 효과 이미지
         """
         self.asset_manager = asset_manager
-        self.image = asset_manager.get_asset("player_normal")
-        self.original_image = self.image.copy()  # 원본 이미지 저장
-        self.rect = self.image.get_rect()
-        
-        # 화면 하단 중앙에 위치하도록 설정
-        self.rect.centerx = SCREEN_WIDTH // 2
-        self.rect.bottom = SCREEN_HEIGHT - 20  # 바닥에서 약간 띄움
-        
-        self.speed = PLAYER_SPEED
-        self.lives = 3
-        self.direction = 0  # -1: 왼쪽, 0: 정지, 1: 오른쪽
-        
-        # 충돌 효과 관련 변수
-        self.is_hit = False
-        self.hit_time = 0
-        self.hit_duration = 1.0  # 충돌 효과 지속 시간 (초)
-        self.hit_flash_interval = 0.1  # 깜빡임 간격 (초)
-        self.last_flash_time = 0
-        self.is_visible = True
-        self.shake_offset = 0
-        self.shake_direction = 1
+        self.state = state or PlayerState()
+        self.sprites = sprites or SpriteVariantCache(asset_manager, PLAYER_SPRITE_NAMES)
+        self.sprite_name = "player_normal"  # 현재 방향의 애셋 이름
+        self.image = self.sprites.get(self.sprite_name)
+        self.shown_direction = 0  # 현재 이미지의 방향
+        self.shown_hit = False  # 현재 이미지에 충돌 효과가 적용되었는지 여부
+        
+    @property
+    def rect(self):
+        """플레이어 위치 (pygame.Rect)"""
+        return self.state.rect
+        
+    @property
+    def lives(self):
+        """남은 생명 수"""
+        return self.state.lives
+        
+    @property
+    def direction(self):
+        """이동 방향 (-1: 왼쪽, 0: 정지, 1: 오른쪽)"""
+        return self.state.direction
+        
+    def update(self, new_hit=False):
+        """
+        시뮬레이션 상태에 맞게 이미지 업데이트
         
-    def update(self):
-        """플레이어 상태 업데이트"""
-        current_time = time.time()
-        
-        # 충돌 효과 처리
-        if self.is_hit:
-            # 깜빡임 효과 - 완전히 사라지지 않고 투명도만 변경
-            if current_time - self.last_flash_time > self.hit_flash_interval:
-                self.is_visible = not self.is_visible
-                self.last_flash_time = current_time
-                
-            # 흔들림 효과
-            self.shake_offset = self.shake_direction * 2
-            self.shake_direction *= -1
-            
-            # 충돌 효과 종료 체크
-            if current_time - self.hit_time > self.hit_duration:
-                self.is_hit = False
-                self.is_visible = True
-                self.shake_offset = 0
-                # 원래 방향에 맞는 이미지로 복원
-                self.update_direction_image()
-        
-        # 이전 방향 저장
-        prev_direction = self.direction
-        self.direction = 0
-        
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.rect.x -= self.speed
-            self.direction = -1
-        if keys[pygame.K_RIGHT]:
-            self.rect.x += self.speed
-            self.direction = 1
-            
-        # 방향에 따라 이미지 변경
-        if not self.is_hit and self.direction != prev_direction:
+        Args:
+            new_hit (bool): 이번 틱에 새로 똥에 맞았는지 여부
+        """
+        if new_hit:
+            # 맞았을 때 현재 방향 이미지에 효과 (똥색 틴트)
+            self.update_direction_image()
+            self.apply_hit_effect()
+        elif not self.state.is_hit and (self.shown_hit or self.direction != self.shown_direction):
+            # 방향이 바뀌었거나 충돌 효과가 끝나면 원래 이미지로 복원
             self.update_direction_image()
-            
-        # 화면 경계 처리
-        if self.rect.left < 0:
-            self.rect.left = 0
-        if self.rect.right > SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
     
     def update_direction_image(self):
-        """방향에 따라 이미지 업데이트"""
-        old_center = self.rect.center
-        
-        if self.direction == -1:
-            self.image = self.asset_manager.get_asset("player_left")
-        elif self.direction == 1:
-            self.image = self.asset_manager.get_asset("player_right")
-        else:
-            self.image = self.asset_manager.get_asset("player_normal")
-            
-        self.original_image = self.image.copy()
-        
-        # 이미지가 변경되어도 위치는 유지
-        self.rect = self.image.get_rect()
-        self.rect.center = old_center
-    
-    def hit_by_poop(self):
-        """똥에 맞았을 때 호출되는 메서드"""
-        if not self.is_hit:  # 이미 맞은 상태가 아닐 때만 처리
-            self.is_hit = True
-            self.hit_time = time.time()
-            self.last_flash_time = self.hit_time
-            self.is_visible = True  # 완전히 사라지지 않도록 수정
-            
-            # 맞았을 때 이미지 효과 (똥색 틴트)
-            self.apply_hit_effect()
+        """방향에 따라 이미지 업데이트 (위치는 시뮬레이션이 관리하므로 유지)"""
+        self.sprite_name = PLAYER_DIRECTION_SPRITES[self.direction]
+        self.image = self.sprites.get(self.sprite_name)
+        self.shown_direction = self.direction
+        self.shown_hit = False
             
     def apply_hit_effect(self):
-        """맞았을 때 이미지에 효과 적용 - 고양이만 똥색으로 변하게 함"""
-        # 현재 이미지의 복사본 생성
-        hit_image = self.original_image.copy()
-        
-        # 똥색 (갈색) 오버레이 생성
-        overlay = pygame.Surface(hit_image.get_size(), pygame.SRCALPHA)
-        overlay.fill((139, 69, 19, 100))  # 반투명 똥색
-        
-        # 오버레이를 이미지에 합성
-        hit_image.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        
-        self.image = hit_image
+        """맞았을 때 이미지에 효과 적용 - 고양이만 똥색으로 변하게 함 (미리 만든 틴트 이미지 사용)"""
+        self.image = self.sprites.get(self.sprite_name, hit=True)
+        self.shown_hit = True
+            
+    def refresh_image(self):
+        """스프라이트가 다시 래스터화되었을 때 현재 이미지 다시 가져오기"""
+        self.image = self.sprites.get(self.sprite_name, hit=self.shown_hit)
             
-    def draw(self, screen):
+    def blit_item(self, viewport=None, flash=True):
         """
-        플레이어 그리기
+        플레이어를 그릴 (이미지, 위치)
         
         Args:
-            screen (pygame.Surface): 그릴 화면
+            viewport (Viewport, optional): 논리 좌표를 화면 좌표로 바꿀 뷰포트
+            flash (bool): 충돌 후 깜빡임 효과 사용 여부 (효과 품질을 낮추면 꺼짐)
+            
+        Returns:
+            tuple: Surface.blit/blits에 넘길 (표면, (x, y))
         """
-        if self.is_visible:
-            # 흔들림 효과 적용 - rect 사용하여 정확한 위치에 그리기
-            draw_pos = self.rect.copy()
-            draw_pos.x += self.shake_offset
-            screen.blit(self.image, draw_pos)
+        if self.state.is_visible or not flash:
+            image = self.image
         else:
             # 깜빡임 효과 - 완전히 사라지지 않고 반투명하게 표시
-            temp_img = self.image.copy()
-            temp_img.set_alpha(128)  # 반투명 설정
-            draw_pos = self.rect.copy()
-            draw_pos.x += self.shake_offset
-            screen.blit(temp_img, draw_pos)
-
-class Poop:
-    """똥 클래스"""
-    
-    def __init__(self, asset_manager, speed):
-        """
-        똥 초기화
-        
-        Args:
-            asset_manager (SVGAssetManager): SVG 애셋 관리자
-            speed (float): 떨어지는 속도
-        """
-        # 랜덤하게 크기 선택
-        size = random.choice(["small", "medium", "large"])
-        self.image = asset_manager.get_asset(f"poop_{size}")
-        self.rect = self.image.get_rect()
-        self.rect.x = random.randint(0, SCREEN_WIDTH - self.rect.width)
-        self.rect.y = -self.rect.height
-        self.speed = speed
-        self.size = size  # 크기 정보 저장
-        
-    def update(self):
-        """똥 상태 업데이트"""
-        self.rect.y += self.speed
-        
-    def is_offscreen(self):
-        """
-        화면 밖으로 나갔는지 확인
-        
-        Returns:
-            bool: 화면 밖이면 True
-        """
-        return self.rect.top > SCREEN_HEIGHT
-        
-    def draw(self, screen):
-        """
-        똥 그리기
-        
-        Args:
-            screen (pygame.Surface): 그릴 화면
-        """
-        screen.blit(self.image, self.rect)
+            image = self.sprites.get(self.sprite_name, hit=self.shown_hit, faded=True)
+            
+        # 흔들림 효과 적용 - rect 위치에 흔들림만큼 옮겨 그리기
+        pos = (self.rect.x + self.state.shake_offset, self.rect.y)
+        return image, pos if viewport is None else viewport.point(pos)
 
 class Button:
     """버튼 클래스"""
     
-    def __init__(self, image, x, y):
+    def __init__(self, image, x, y, size=None):
         """
         버튼 초기화
         
@@ -275,9 +162,10 @@ class Button:
             image (pygame.Surface): 버튼 이미지
             x (int): x 좌표
             y (int): y 좌표
+            size (tuple, optional): 논리 좌표에서의 버튼 크기 (기본값: 이미지 크기)
         """
         self.image = image
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect((0, 0), size or self.image.get_size())
         self.rect.centerx = x
         self.rect.centery = y
         
@@ -293,40 +181,80 @@ class Button:
         """
         return self.rect.collidepoint(pos)
         
-    def draw(self, screen):
+    def draw(self, screen, viewport=None):
         """
         버튼 그리기
         
         Args:
             screen (pygame.Surface): 그릴 화면
+            viewport (Viewport, optional): 논리 좌표를 화면 좌표로 바꿀 뷰포트
         """
-        screen.blit(self.image, self.rect)
+        if viewport is None:
+            screen.blit(self.image, self.rect)
+        else:
+            screen.blit(self.image, self.image.get_rect(center=viewport.point(self.rect.center)))
 
 class Game:
     """게임 클래스"""
     
-    def __init__(self):
-        """게임 초기화"""
+    def __init__(self, dirty_rects=False, seed=None, profiler=None, profile_overlay=False,
+                 background_loading=True, resizable=False, fullscreen=False, watch_assets=False,
+                 rasterizer=None, adaptive_quality=True):
+        """
+        게임 초기화
+        
+        Args:
+            dirty_rects (bool): 바뀐 영역만 다시 그리는 더티 렉트 렌더링 사용 여부
+            seed (int, optional): 게임 로직 난수 시드
+            profiler (FrameProfiler, optional): 프레임 단계별 시간을 기록할 프로파일러
+            profile_overlay (bool): 프로파일러 측정값을 화면에 표시할지 여부 (F3으로 전환)
+            background_loading (bool): 애셋을 백그라운드 스레드에서 로드하고 그동안 로딩 화면 표시
+            resizable (bool): 창 크기 조절 허용 (애셋은 창 크기에 맞는 배율로 다시 래스터화)
+            fullscreen (bool): 전체 화면으로 실행
+            watch_assets (bool): SVG 파일이 바뀌면 다시 래스터화해 바로 반영 (아트 작업용)
+            rasterizer (str, optional): SVG 래스터화 백엔드 이름 (기본값: POOP_DODGE_RASTERIZER 또는 cairosvg)
+            adaptive_quality (bool): 프레임 시간이 예산을 넘으면 효과 품질을 자동으로 낮춤
+        """
         # Pygame 초기화
         pygame.init()
         pygame.mixer.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.display_flags = pygame.FULLSCREEN if fullscreen else (pygame.RESIZABLE if resizable else 0)
+        window = pygame.display.set_mode((0, 0) if fullscreen else (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                         self.display_flags)
         pygame.display.set_caption("똥피하기 게임")
         self.clock = pygame.time.Clock()
-        
-        # 애셋 관리자 초기화
-        self.asset_manager = SVGAssetManager()
+        self.use_dirty_rects = dirty_rects
+        self.layout_window(window.get_size())
+        self.profiler = profiler or NullProfiler()
+        self.profile_overlay = profile_overlay and self.profiler.enabled
+        
+        # 애셋 관리자 초기화 (애셋은 처음 사용할 때 래스터화)
+        self.asset_manager = SVGAssetManager(prefetch_hints=ASSET_PREFETCH_HINTS, rasterizer=rasterizer)
+        self.asset_manager.register_assets(
+            self.asset_manager.build_default_manifest((SCREEN_WIDTH, SCREEN_HEIGHT))
+        )
+        self.asset_manager.set_scale(self.viewport.scale)  # 창 크기에 맞는 배율로 래스터화
         
         # 게임 상태 초기화
-        self.state = MENU
+        self.state = LOADING
+        self.background_loading = background_loading
+        self.loader = None  # 백그라운드 애셋 로더
+        self.watcher = None  # SVG 파일 변경 감시기 (watch_assets일 때)
+        self.sim = Simulation(seed=seed, input_source=KeyboardInput(),
+                              profiler=self.profiler)  # 게임 로직
         self.player = None
-        self.poops = []
-        self.particles = []  # 파티클 리스트 추가
-        self.score = 0
-        self.poop_speed = INITIAL_POOP_SPEED
-        self.last_spawn_time = 0
-        self.spawn_interval = 1.0 / POOP_SPAWN_RATE
+        self.player_sprites = SpriteVariantCache(self.asset_manager, PLAYER_SPRITE_NAMES)
+        self.particles = ParticleSystem()  # 충돌 효과 파티클
+        self.recorder = None  # 입력 기록기 (start_recording으로 시작)
         self.use_english_text = False  # 기본값은 한글 사용
+        self.text_cache = TextCache()  # 렌더링한 텍스트 재사용
+        self.render_batch = RenderBatch()  # 레이어별 일괄 그리기
+        self.static_layers = StaticLayerCache()  # 상태별로 미리 합성한 배경과 HUD
+        self.shown_background = None  # 지난 프레임에 그린 정적 레이어
+        self.quality = QualityGovernor()  # 프레임 시간에 맞춘 효과 품질 (게임 로직에는 영향 없음)
+        self.adaptive_quality = adaptive_quality
+        self.hud_items = None  # 지난번에 구성한 HUD 그리기 목록 (품질을 낮추면 몇 프레임 재사용)
+        self.hud_age = 0
         
         # 버튼 초기화
         self.start_button = None
@@ -334,225 +262,484 @@ class Game:
         
         # 애셋 로드
         self.load_assets()
+        if watch_assets:
+            self.watcher = AssetWatcher(self.asset_manager)
+            self.watcher.start()
         
     def load_assets(self):
         """게임에 필요한 애셋 로드"""
-        # SVG 애셋 로드
-        self.asset_manager.load_all_assets((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # 저장된 스프라이트 아틀라스가 있으면 이미지 하나로 스프라이트를 모두 로드
+        if USE_SPRITE_ATLAS:
+            self.asset_manager.load_atlas()
         
-        # 폰트 설정
+        # 폰트 설정 (로딩 화면에서도 사용)
         self.setup_font()
         
-        # 버튼 생성
-        self.start_button = Button(
-            self.asset_manager.get_asset("start_button"),
-            SCREEN_WIDTH // 2,
-            SCREEN_HEIGHT // 2
-        )
+        if self.background_loading:
+            # 로딩 스레드에서 래스터화하는 동안 로딩 화면 표시 (메뉴 애셋이 준비되면 메뉴로 전환)
+            self.loader = AssetLoader(self.asset_manager,
+                                      ASSET_LOAD_ORDER + list(self.asset_manager.manifest))
+            self.loader.start()
+        else:
+            # 메뉴 화면에 필요한 SVG 애셋만 먼저 로드하고 나머지는 남는 프레임에 미리 로드
+            self.asset_manager.prefetch(MENU)
+            self.asset_manager.prefetch_step(max_items=len(ASSET_PREFETCH_HINTS[MENU]))
+            self.asset_manager.prefetch(PLAYING)
+            self.asset_manager.prefetch(GAME_OVER)
+            self.enter_menu()
+        
+        # 효과음과 배경 음악은 백그라운드에서 미리 디코딩
+        self.audio = AudioSystem(SOUND_EFFECTS, MUSIC_PATH)
+        self.audio.preload()
+    
+    def layout_window(self, window_size):
+        """
+        창 크기에 맞게 뷰포트와 그리기 영역(캔버스) 설정
         
-        self.restart_button = Button(
-            self.asset_manager.get_asset("restart_button"),
-            SCREEN_WIDTH // 2,
-            SCREEN_HEIGHT // 2 + 100
-        )
+        Args:
+            window_size (tuple): 창 크기 (너비, 높이)
+        """
+        viewport = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT), window_size)
+        window = pygame.display.get_surface()
+        if window.get_size() != tuple(window_size) and not self.display_flags & pygame.FULLSCREEN:
+            window = pygame.display.set_mode(window_size, self.display_flags)
+        if not window.get_rect().contains(viewport.canvas_rect):
+            # 가장 작은 배율로도 들어가지 않는 창은 캔버스 크기로 늘림
+            window = pygame.display.set_mode(viewport.canvas_rect.size, self.display_flags)
+            viewport = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT), window.get_size())
+        self.viewport = viewport
+        
+        # 여백은 검은색으로 칠하고 캔버스(창의 서브서피스)에만 그림
+        window.fill(BLACK)
+        self.window = window
+        self.screen = window.subsurface(viewport.canvas_rect)
+        self.dirty_renderer = DirtyRectRenderer(self.screen) if self.use_dirty_rects else None
+        
+    def resize(self, window_size):
+        """
+        창 크기가 바뀌었을 때 처리 (배율이 바뀌면 애셋을 백그라운드에서 새 배율로 래스터화)
         
-        # 사운드 로드
-        try:
-            self.collision_sound = pygame.mixer.Sound('assets/sounds/collision.wav')
-        except:
-            print("Warning: Could not load collision sound.")
-            self.collision_sound = None
+        게임 로직은 논리 좌표에서 진행하므로 영향을 받지 않습니다.
+        
+        Args:
+            window_size (tuple): 새 창 크기 (너비, 높이)
+        """
+        previous_scale = self.viewport.scale
+        self.layout_window(window_size)
+        if self.viewport.scale == previous_scale:
+            return
+        
+        # 래스터화가 끝날 때까지는 이전 배율 이미지를 확대/축소해 사용
+        rescaled = self.asset_manager.set_scale(self.viewport.scale)
+        self.create_fonts(self.font_path)
+        self.text_cache.clear()
+        self.static_layers.invalidate()
+        self.hud_items = None
+        self.refresh_assets(PLAYER_SPRITE_NAMES + ["start_button", "restart_button"])
+        
+        if self.loader is not None:
+            self.loader.stop()
+        self.loader = AssetLoader(self.asset_manager,
+                                  ASSET_LOAD_ORDER + rescaled + list(self.asset_manager.manifest))
+        self.loader.start()
+        
+    def refresh_assets(self, names):
+        """
+        새로 래스터화된 애셋을 사용 중인 플레이어 효과 이미지, 버튼, 충돌 마스크에 반영
+        
+        Args:
+            names (list): 바뀐 애셋 이름
+        """
+        names = set(names)
+        changed_sprites = names.intersection(PLAYER_SPRITE_NAMES)
+        if changed_sprites:
+            self.player_sprites.invalidate(changed_sprites)
+            if self.player is not None:
+                self.player.refresh_image()
+        # 버튼은 한 버튼이 영어로 바뀌면 다른 버튼도 함께 바뀌므로 항상 다시 가져옴
+        for button, name in ((self.start_button, "start_button"), (self.restart_button, "restart_button")):
+            if button is not None:
+                button.image = self.asset_manager.get_asset(name)
+        # 충돌 마스크는 SVG를 배율 1로 래스터화한 결과로 만들므로 대신 쓰던 이미지가 실제 애셋으로 바뀌면 다시 만듦
+        if self.sim.masks is not None and not names.isdisjoint(COLLISION_SPRITE_NAMES):
+            self.build_collision_masks()
+        
+    def make_button(self, name, x, y):
+        """
+        애셋으로 버튼 만들기
+        
+        Args:
+            name (str): 버튼 애셋 이름
+            x (int): 논리 x 좌표
+            y (int): 논리 y 좌표
+            
+        Returns:
+            Button: 버튼 (클릭 영역은 논리 좌표)
+        """
+        spec = self.asset_manager.manifest.get(name)
+        return Button(self.asset_manager.get_asset(name), x, y, spec.size if spec else None)
+        
+    def enter_menu(self):
+        """메뉴 화면으로 전환 (시작 버튼 생성, 재시작 버튼은 게임 오버 화면에서 생성)"""
+        if self.start_button is None:
+            self.start_button = self.make_button("start_button", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.state = MENU
+        
+    def poll_loader(self):
+        """백그라운드 로더가 보낸 애셋을 등록하고 메뉴 애셋이 준비되면 메뉴로 전환"""
+        names = self.loader.poll()
+        if names:
+            self.refresh_assets(names)
+        if self.state == LOADING:
+            menu_ready = all(name in self.asset_manager.assets for name in ASSET_PREFETCH_HINTS[MENU])
+            if menu_ready or self.loader.finished:
+                self.enter_menu()
+        if self.loader.finished:
+            self.loader = None
             
+    def poll_watcher(self):
+        """바뀐 SVG 파일에서 다시 래스터화한 애셋을 프레임 사이에 한 번에 교체하고 사용 중인 객체에 반영"""
+        names = self.watcher.poll()
+        if not names:
+            return
+        self.refresh_assets(names)
+            
+    def finish_loading(self):
+        """백그라운드 로딩이 끝날 때까지 기다린 뒤 메뉴로 전환"""
+        if self.loader is not None:
+            self.loader.wait()
+            self.loader = None
+            self.refresh_assets(PLAYER_SPRITE_NAMES + ["start_button", "restart_button"])
+        if self.state == LOADING:
+            self.enter_menu()
+        
+    def build_sprite_atlas(self):
+        """스프라이트를 아틀라스로 묶고 다음 실행을 위해 저장 (저장은 배율 1일 때만)"""
         try:
-            self.game_over_sound = pygame.mixer.Sound('assets/sounds/game_over.wav')
-        except:
-            print("Warning: Could not load game over sound.")
-            self.game_over_sound = None
-    
+            self.asset_manager.build_atlas(ATLAS_ASSETS)
+        except (ValueError, pygame.error) as e:
+            print(f"Warning: Could not build sprite atlas: {e}")
+            return
+        if self.asset_manager.scale == 1:
+            self.asset_manager.save_atlas()
+        
     def setup_font(self):
-        """한글 폰트 설정"""
-        # 폰트 초기화 - 한글 지원 폰트 사용
-        font_loaded = False
+        """한글 폰트 설정 (찾은 폰트 경로는 캐시해 다음 실행에서 재사용)"""
+        resolver = FontResolver()
+        font_path, use_english_text = resolver.resolve()
         
-        # 1. 시스템에 설치된 Noto Sans CJK 폰트 사용 시도
-        try:
-            self.font = pygame.font.Font("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc", 36)
-            self.ui_font = pygame.font.Font("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc", 24)  # UI용 작은 폰트
-            font_loaded = True
-            print("Using NotoSansCJK font")
-        except:
-            pass
-            
-        # 2. 시스템 기본 폰트 중 한글 지원 폰트 찾기
-        if not font_loaded:
+        # 1. 찾은 한글 지원 폰트 사용 (영어 텍스트 사용 여부는 검색 결과 또는 캐시된 결과를 따름)
+        if font_path:
             try:
-                available_fonts = pygame.font.get_fonts()
-                korean_fonts = [f for f in available_fonts if f in ["notosanscjk", "malgun gothic", "gulim", "batang", "dotum"]]
-                
-                if korean_fonts:
-                    self.font = pygame.font.SysFont(korean_fonts[0], 36)
-                    self.ui_font = pygame.font.SysFont(korean_fonts[0], 24)  # UI용 작은 폰트
-                    font_loaded = True
-                    print(f"Using system font: {korean_fonts[0]}")
-            except:
-                pass
+                self.create_fonts(font_path)
+            except (OSError, pygame.error):
+                # 캐시된 폰트를 열 수 없으면 다음 실행에서 다시 검색
+                resolver.invalidate()
+                font_path, use_english_text = None, True
                 
-        # 3. 모두 실패하면 기본 폰트 사용하고 한글 텍스트를 영어로 대체
-        if not font_loaded:
+        # 2. 폰트가 없으면 기본 폰트 사용
+        if not font_path:
+            self.create_fonts(None)
+        self.use_english_text = use_english_text
+        
+        if use_english_text:
             print("Warning: Could not load Korean font. Using English text instead.")
-            self.font = pygame.font.Font(None, 36)
-            self.ui_font = pygame.font.Font(None, 24)  # UI용 작은 폰트
-            self.use_english_text = True
         else:
-            self.use_english_text = False
+            print(f"Using font: {font_path}" + (" (cached)" if resolver.from_cache else ""))
+        
+    def create_fonts(self, font_path):
+        """
+        현재 배율에 맞는 크기로 글꼴 만들기
+        
+        Args:
+            font_path (str): 폰트 파일 경로 (None이면 기본 폰트)
+        """
+        self.font = pygame.font.Font(font_path, self.viewport.length(36))
+        self.ui_font = pygame.font.Font(font_path, self.viewport.length(24))  # UI용 작은 폰트
+        self.font_path = font_path
         
     def start_game(self):
         """게임 시작"""
         self.state = PLAYING
-        self.player = Player(self.asset_manager)
-        self.poops = []
-        self.particles = []
-        self.score = 0
-        self.poop_speed = INITIAL_POOP_SPEED
-        self.last_spawn_time = time.time()
-        
-        # 배경 음악 재생
-        try:
-            pygame.mixer.music.load('assets/sounds/background.mp3')
-            pygame.mixer.music.play(-1)
-        except:
-            print("Warning: Could not load background music.")
+        self.sim.reset()
+        self.player_sprites.build()  # 플레이 중에는 효과 이미지를 새로 만들지 않도록 미리 준비
+        if USE_PIXEL_COLLISION:
+            self.build_collision_masks()
+        self.player = Player(self.asset_manager, self.sim.player, self.player_sprites)
+        self.particles.clear()
+        self.hud_items = None
+        self.asset_manager.prefetch(GAME_OVER)
+        
+        # 배경 음악 재생 (미리 로드해 두었으므로 바로 재생)
+        self.audio.play_music()
+        
+    def build_collision_masks(self):
+        """충돌 마스크 준비 (애셋 관리자가 한 번만 만들어 캐시하므로 플레이 중에는 만들지 않음)"""
+        self.sim.masks = load_sprite_masks(self.asset_manager)
         
     def create_particles(self, x, y, count=20, color=(139, 69, 19)):
         """
-        파티클 생성
+        파티클 생성 (효과 품질을 낮춘 동안에는 개수를 줄임)
         
         Args:
             x (int): 파티클 생성 x 좌표
             y (int): 파티클 생성 y 좌표
-            count (int): 생성할 파티클 수
+            count (int): 생성할 파티클 수 (최고 품질 기준)
             color (tuple): 파티클 색상 (R, G, B)
         """
-        for _ in range(count):
-            self.particles.append(Particle(x, y, color))
+        scale = self.quality.level.particle_scale
+        if scale < 1 and count > 0:
+            count = max(1, round(count * scale))
+        self.particles.emit(x, y, count, color)
         
     def update(self):
         """게임 상태 업데이트"""
-        if self.state == PLAYING:
-            self.player.update()
+        self.audio.begin_frame()
+        if self.loader is not None:
+            self.poll_loader()
+        if self.watcher is not None:
+            self.poll_watcher()
             
-            # 똥 생성
-            current_time = time.time()
-            if current_time - self.last_spawn_time > self.spawn_interval:
-                self.poops.append(Poop(self.asset_manager, self.poop_speed))
-                self.last_spawn_time = current_time
-                
-            # 똥 업데이트 및 충돌 체크
-            for poop in self.poops[:]:
-                poop.update()
-                
-                # 화면 밖으로 나간 똥 제거 및 점수 증가
-                if poop.is_offscreen():
-                    self.poops.remove(poop)
-                    self.score += 1
-                    
-                # 충돌 체크
-                if self.player.rect.colliderect(poop.rect):
-                    # 충돌 위치에 파티클 생성
-                    collision_x = (self.player.rect.centerx + poop.rect.centerx) // 2
-                    collision_y = (self.player.rect.top + poop.rect.bottom) // 2
-                    
-                    # 똥 크기에 따라 파티클 수 조절
-                    if poop.size == "small":
-                        particle_count = 10
-                    elif poop.size == "medium":
-                        particle_count = 15
-                    else:  # large
-                        particle_count = 20
-                        
-                    self.create_particles(collision_x, collision_y, particle_count)
-                    
-                    # 플레이어 충돌 효과 적용
-                    self.player.hit_by_poop()
-                    
-                    # 충돌 사운드 재생
-                    if self.collision_sound:
-                        self.collision_sound.play()
-                    
-                    # 똥 제거 및 생명력 감소
-                    self.poops.remove(poop)
-                    self.player.lives -= 1
-                    
-                    if self.player.lives <= 0:
-                        self.game_over()
+        if self.state == PLAYING:
+            # 게임 로직 한 틱 진행
+            events = self.sim.step()
+            for event in events:
+                self.handle_collision(event)
+            self.player.update(new_hit=any(event.new_hit for event in events))
             
             # 파티클 업데이트
-            for particle in self.particles[:]:
-                particle.update()
-                if particle.is_dead():
-                    self.particles.remove(particle)
+            with self.profiler.section("update.particles"):
+                self.particles.update()
+            
+            if self.sim.game_over:
+                self.game_over()
             
-            # 난이도 증가
-            self.poop_speed += POOP_ACCELERATION / FPS
+    def handle_collision(self, event):
+        """
+        플레이어가 똥에 맞았을 때 효과 처리
+        
+        Args:
+            event (CollisionEvent): 시뮬레이션의 충돌 이벤트
+        """
+        # 충돌 위치에 파티클 생성 (똥 크기에 따라 파티클 수 조절)
+        self.create_particles(event.x, event.y, POOP_PARTICLE_COUNTS[event.size])
+        
+        # 충돌 사운드 재생 (한 프레임에 여러 번 맞아도 한 번만 재생)
+        self.audio.play("collision")
             
     def draw(self):
         """게임 화면 그리기"""
-        # 배경 그리기
-        self.screen.blit(self.asset_manager.get_asset("background"), (0, 0))
+        if self.state == LOADING:
+            self.draw_loading_screen()
+            return
+            
+        # 정적 레이어 그리기 (더티 렉트 모드에서는 지난 프레임에 그린 영역만 복원)
+        background = self.static_background()
+        dirty = self.dirty_renderer is not None and self.state == PLAYING
+        if dirty:
+            if background is not self.shown_background:
+                self.dirty_renderer.invalidate()  # 생명 수 등이 바뀌어 다시 합성했으면 전체 다시 그리기
+            self.dirty_renderer.restore(background)
+        else:
+            self.screen.blit(background, (0, 0))
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.invalidate()
+        self.shown_background = background
+        
+        # 위치는 논리 좌표로 계산하고 뷰포트로 화면 좌표로 변환 (글자 크기는 이미 화면 픽셀 단위)
+        view = self.viewport
         
         if self.state == MENU:
-            # 메뉴 화면 그리기
-            title_text = "똥피하기 게임" if not self.use_english_text else "Poop Dodge Game"
-            title = self.font.render(title_text, True, BLACK)
-            self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, SCREEN_HEIGHT//3))
-            
-            # 시작 버튼 그리기
-            self.start_button.draw(self.screen)
+            # 시작 버튼 그리기 (제목은 정적 레이어에 포함)
+            self.start_button.draw(self.screen, view)
             
         elif self.state == PLAYING:
-            # 게임 화면 그리기
-            self.player.draw(self.screen)
+            # 게임 화면 그리기 (레이어별로 모아 Surface.blits로 한 번에 그림)
+            batch = self.render_batch
+            level = self.quality.level
+            batch.add("player", *self.player.blit_item(view, flash=level.flash))
             
             # 똥 그리기
-            for poop in self.poops:
-                poop.draw(self.screen)
+            poop_images = {size: self.asset_manager.get_asset(name)
+                           for size, name in POOP_ASSET_NAMES.items()}
+            batch.extend("obstacles", view.place([(poop_images[poop.size], poop.rect)
+                                                  for poop in self.sim.poops]))
                 
-            # 파티클 그리기
-            for particle in self.particles:
-                particle.draw(self.screen)
+            # 파티클 그리기 (크기와 색상별로 미리 그린 원 스프라이트 사용)
+            batch.extend("particles", self.particles.blit_items(view.scale))
                 
-            # UI 그리기
-            score_text = self.ui_font.render("점수: " + str(self.score) if not self.use_english_text else "Score: " + str(self.score), True, BLACK)
-            lives_text = self.ui_font.render("HP: " + str(self.player.lives), True, RED)
-            self.screen.blit(score_text, (10, 10))
-            self.screen.blit(lives_text, (SCREEN_WIDTH - lives_text.get_width() - 10, 10))
+            # UI 그리기 (라벨과 생명 표시는 미리 합성한 HUD, 점수 숫자는 글리프 단위로 캐시해 조합)
+            # 효과 품질을 낮춘 동안에는 hud_interval 프레임마다만 다시 구성
+            if self.hud_items is None or self.hud_age >= level.hud_interval:
+                (score_label, label_pos), lives_item = self.static_hud()
+                self.hud_items = [(score_label, label_pos), lives_item]
+                self.hud_items += self.text_cache.glyph_items(self.ui_font, str(self.sim.score),
+                                                              (label_pos[0] + score_label.get_width(), label_pos[1]),
+                                                              True, BLACK)
+                self.hud_age = 0
+            self.hud_age += 1
+            batch.extend("hud", self.hud_items)
             
-            # 생명 아이콘 그리기
-            life_icon = self.asset_manager.get_asset("life_icon")
-            for i in range(self.player.lives):
-                self.screen.blit(life_icon, (SCREEN_WIDTH - 40 - i * 35, 50))
+            # 그린 영역은 더티 렉트 모드에서 사용
+            drawn = batch.flush(self.screen, collect_rects=dirty)
+            if dirty:
+                self.dirty_renderer.add_many(drawn)
             
         elif self.state == GAME_OVER:
-            # 게임 오버 화면 그리기
-            game_over_text = self.font.render("게임 오버!" if not self.use_english_text else "Game Over!", True, RED)
-            score_text = self.ui_font.render("최종 점수: " + str(self.score) if not self.use_english_text else "Final Score: " + str(self.score), True, BLACK)
+            # 재시작 버튼 그리기 (게임 오버 글자와 최종 점수는 정적 레이어에 포함)
+            self.restart_button.draw(self.screen, view)
             
-            self.screen.blit(game_over_text, (SCREEN_WIDTH//2 - game_over_text.get_width()//2, SCREEN_HEIGHT//3))
-            self.screen.blit(score_text, (SCREEN_WIDTH//2 - score_text.get_width()//2, SCREEN_HEIGHT//2))
+        # 프로파일러 측정값 표시
+        if self.profile_overlay:
+            overlay_rect = self.profiler.draw_overlay(self.screen, self.ui_font)
+            if dirty:
+                self.dirty_renderer.add(overlay_rect)
             
-            # 재시작 버튼 그리기
-            self.restart_button.draw(self.screen)
+    def static_background(self):
+        """
+        현재 상태의 정적 레이어 가져오기 (내용을 결정하는 값이 바뀌었을 때만 다시 합성)
+        
+        Returns:
+            pygame.Surface: 배경과 상태별 고정 글자를 합성한 화면 크기 표면
+        """
+        layers = self.static_layers
+        background = self.asset_manager.get_asset("background")
+        base = layers.get("base", (background, self.viewport.scale),
+                          lambda: self.compose_base(background))
+        
+        if self.state == MENU:
+            return layers.get(MENU, (base, self.font, self.use_english_text),
+                              lambda: self.compose_menu(base))
+        if self.state == GAME_OVER:
+            key = (base, self.font, self.ui_font, self.use_english_text, self.sim.score)
+            return layers.get(GAME_OVER, key, lambda: self.compose_game_over(base))
+        return base
+        
+    def compose_base(self, background):
+        """
+        배경 레이어 합성
+        
+        Args:
+            background (pygame.Surface): 배경 이미지
+            
+        Returns:
+            pygame.Surface: 화면 크기의 배경
+        """
+        surface = pygame.Surface((self.viewport.width, self.viewport.height))
+        surface.fill(WHITE)
+        if background is not None:
+            surface.blit(background, (0, 0))
+        return to_display_format(surface)
+        
+    def compose_menu(self, base):
+        """메뉴 화면 정적 레이어 합성 (배경 + 제목)"""
+        view = self.viewport
+        surface = base.copy()
+        title_text = "똥피하기 게임" if not self.use_english_text else "Poop Dodge Game"
+        title = self.text_cache.render(self.font, title_text, True, BLACK)
+        surface.blit(title, (view.width//2 - title.get_width()//2, view.length(SCREEN_HEIGHT//3)))
+        return to_display_format(surface)
+        
+    def static_hud(self):
+        """
+        플레이 화면의 고정 HUD 가져오기 (생명 수가 바뀌었을 때만 다시 합성)
+        
+        게임 화면 위에 그려야 하므로 배경과 따로 합성합니다.
+        
+        Returns:
+            tuple: ((점수 라벨, 위치), (HP 글자와 생명 아이콘을 합성한 표면, 위치))
+        """
+        life_icon = self.asset_manager.get_asset("life_icon")
+        key = (self.ui_font, self.use_english_text, life_icon, self.player.lives, self.viewport.scale)
+        return self.static_layers.get("hud", key, lambda: self.compose_hud(life_icon))
+        
+    def compose_hud(self, life_icon):
+        """
+        고정 HUD 합성 (점수 라벨, 오른쪽 위의 HP 글자와 생명 아이콘)
+        
+        Args:
+            life_icon (pygame.Surface): 생명 아이콘 이미지
+            
+        Returns:
+            tuple: ((점수 라벨, 위치), (HP 글자와 생명 아이콘을 합성한 표면, 위치))
+        """
+        view = self.viewport
+        margin = view.length(10)
+        score_label = self.text_cache.render(self.ui_font, "점수: " if not self.use_english_text else "Score: ", True, BLACK)
+        lives_text = self.text_cache.render(self.ui_font, "HP: " + str(self.player.lives), True, RED)
+        
+        # HP 글자와 생명 아이콘을 감싸는 영역에 한 번에 합성
+        items = [(lives_text, (view.width - lives_text.get_width() - margin, margin))]
+        items += view.place([(life_icon, (SCREEN_WIDTH - 40 - i * 35, 50)) for i in range(self.player.lives)])
+        area = pygame.Rect(items[0][1], lives_text.get_size())
+        area.unionall_ip([pygame.Rect(pos, surface.get_size()) for surface, pos in items[1:]])
+        lives = pygame.Surface(area.size, pygame.SRCALPHA)
+        lives.blits([(surface, (pos[0] - area.x, pos[1] - area.y)) for surface, pos in items], doreturn=False)
+        return (score_label, (margin, margin)), (to_display_format(lives, alpha=True), area.topleft)
+        
+    def compose_game_over(self, base):
+        """게임 오버 화면 정적 레이어 합성 (배경 + 게임 오버 글자, 최종 점수)"""
+        view = self.viewport
+        surface = base.copy()
+        game_over_text = self.text_cache.render(self.font, "게임 오버!" if not self.use_english_text else "Game Over!", True, RED)
+        score_text = self.text_cache.render(self.ui_font, "최종 점수: " + str(self.sim.score) if not self.use_english_text else "Final Score: " + str(self.sim.score), True, BLACK)
+        
+        surface.blit(game_over_text, (view.width//2 - game_over_text.get_width()//2, view.length(SCREEN_HEIGHT//3)))
+        surface.blit(score_text, (view.width//2 - score_text.get_width()//2, view.length(SCREEN_HEIGHT//2)))
+        return to_display_format(surface)
+        
+    def draw_loading_screen(self):
+        """애셋 로딩 화면 그리기 (배경 애셋 없이 글자와 진행 막대만 표시)"""
+        self.screen.fill(WHITE)
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.invalidate()
+            
+        view = self.viewport
+        text = self.text_cache.render(self.ui_font, "로딩 중..." if not self.use_english_text else "Loading...", True, BLACK)
+        self.screen.blit(text, (view.width//2 - text.get_width()//2, view.length(SCREEN_HEIGHT//2 - 40)))
+        
+        # 진행 막대
+        progress = self.loader.progress() if self.loader is not None else 1.0
+        bar = pygame.Rect((0, 0), view.size((300, 16)))
+        bar.center = view.point((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        pygame.draw.rect(self.screen, BLACK, bar, 2)
+        pygame.draw.rect(self.screen, BLACK, (bar.x, bar.y, int(bar.width * progress), bar.height))
+        
+    def entity_stats(self):
+        """
+        오브젝트 풀 통계
+        
+        Returns:
+            dict: 똥 풀과 파티클 시스템의 재사용률 및 최대 동시 개수, 효과음 채널 풀 통계
+        """
+        stats = {
+            "poop_pool_hit_rate": self.sim.poop_pool.hit_rate(),
+            "poop_peak_live": self.sim.poop_pool.peak_live,
+            "particle_slot_hit_rate": self.particles.hit_rate(),
+            "particle_peak_live": self.particles.peak_count,
+        }
+        stats.update({"audio_" + key: value for key, value in self.audio.stats().items()})
+        return stats
+        
+    def present(self):
+        """그린 화면을 디스플레이에 반영"""
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.present()
+        else:
+            pygame.display.flip()
             
     def game_over(self):
         """게임 오버 처리"""
         self.state = GAME_OVER
         
+        if self.restart_button is None:
+            self.restart_button = self.make_button("restart_button", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100)
+        
         # 배경 음악 중지
-        pygame.mixer.music.stop()
+        self.audio.stop_music()
         
         # 게임 오버 사운드 재생
-        if self.game_over_sound:
-            self.game_over_sound.play()
+        self.audio.play("game_over")
         
     def handle_events(self):
         """이벤트 처리"""
@@ -560,54 +747,229 @@ class Game:
             if event.type == pygame.QUIT:
                 return False
                 
+            if event.type == pygame.VIDEORESIZE:
+                self.resize(event.size)
+                
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return False
                     
+                if event.key == pygame.K_F3 and self.profiler.enabled:
+                    self.profile_overlay = not self.profile_overlay
+                    
                 if event.key == pygame.K_SPACE:
                     if self.state == MENU or self.state == GAME_OVER:
-                        self.start_game()
+                        self.request_start()
                         
             if event.type == pygame.MOUSEBUTTONDOWN:
-                pos = pygame.mouse.get_pos()
+                pos = self.viewport.to_logical(pygame.mouse.get_pos())  # 버튼 영역은 논리 좌표
                 
                 if self.state == MENU and self.start_button.is_clicked(pos):
-                    self.start_game()
+                    self.request_start()
                     
                 if self.state == GAME_OVER and self.restart_button.is_clicked(pos):
-                    self.start_game()
+                    self.request_start()
                     
         return True
         
+    def request_start(self):
+        """시작/재시작 요청 처리 (입력 기록 중이면 함께 기록)"""
+        if self.recorder is not None:
+            self.recorder.mark_start()
+        self.start_game()
+        
+    def start_recording(self):
+        """
+        입력 기록 시작 (메뉴 화면에서 호출해야 재생할 때 같은 상태에서 시작)
+        
+        Returns:
+            Replay: 프레임마다 입력이 추가되는 입력 기록
+        """
+        self.recorder = ReplayRecorder(self.sim.input_source, self.sim.seed)
+        self.sim.input_source = self.recorder
+        return self.recorder.replay
+        
+    def play_replay(self, replay, render_every=0):
+        """
+        입력 기록을 프레임 제한 없이 최대 속도로 재생
+        
+        Args:
+            replay (Replay): 재생할 입력 기록
+            render_every (int): N 프레임마다 화면 그리기 (0이면 그리지 않음)
+            
+        Returns:
+            dict: 재생한 프레임 수, 걸린 시간, 게임 수, 마지막 점수
+        """
+        self.finish_loading()
+        replay_input = ReplayInput(replay)
+        self.sim.input_source = replay_input
+        self.sim.invincible = False  # 기록할 때처럼 게임 오버와 재시작이 일어나야 함
+        self.sim.reset(replay.seed)
+        self.state = MENU
+        
+        games = 0
+        start = time.perf_counter()
+        while not replay_input.finished():
+            if replay_input.start_requested() and self.state in (MENU, GAME_OVER):
+                self.start_game()
+                games += 1
+                
+            self.update()
+            
+            if render_every and replay_input.frame % render_every == 0:
+                # 창이 응답 없음 상태가 되지 않도록 이벤트 처리 (닫으면 재생 중단)
+                if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                    break
+                self.draw()
+                self.present()
+                
+            replay_input.end_frame()
+        elapsed = time.perf_counter() - start
+        
+        return {
+            "frames": replay_input.frame,
+            "seconds": elapsed,
+            "frames_per_second": replay_input.frame / elapsed if elapsed > 0 else float("inf"),
+            "games": games,
+            "score": self.sim.score,
+        }
+        
     def run(self):
         """게임 실행"""
         running = True
         
+        profiler = self.profiler
+        
         while running:
+            frame_start = time.perf_counter()
+            profiler.begin_frame()
+            
             # 이벤트 처리
-            running = self.handle_events()
+            with profiler.section("handle_events"):
+                running = self.handle_events()
             
             # 게임 업데이트
-            self.update()
+            with profiler.section("update"):
+                self.update()
             
             # 화면 그리기
-            self.draw()
+            with profiler.section("draw"):
+                self.draw()
             
             # 화면 업데이트
-            pygame.display.flip()
+            with profiler.section("display.flip"):
+                self.present()
+            
+            # 플레이 중 프레임 작업 시간으로 효과 품질 조절 (다른 화면의 프레임 시간은 버림)
+            frame_time = time.perf_counter() - frame_start
+            if self.adaptive_quality:
+                if self.state == PLAYING:
+                    self.quality.record(frame_time)
+                else:
+                    self.quality.reset_window()
+            
+            # 프레임 시간이 남으면 다음 화면에 필요한 애셋 미리 로드
+            if self.loader is None and frame_time < PREFETCH_FRAME_BUDGET:
+                with profiler.section("prefetch"):
+                    if not self.asset_manager.prefetch_step() and USE_SPRITE_ATLAS \
+                            and self.asset_manager.atlas is None:
+                        self.build_sprite_atlas()
             
             # FPS 설정
-            self.clock.tick(FPS)
+            with profiler.section("clock.tick"):
+                self.clock.tick(FPS)
+            profiler.end_frame()
             
+            if self.recorder is not None:
+                self.recorder.end_frame()
+            
+        if self.watcher is not None:
+            self.watcher.stop()
         pygame.quit()
 
+def parse_args(argv=None):
+    """
+    명령줄 인자 해석
+    
+    Args:
+        argv (list, optional): 인자 목록 (기본값: sys.argv)
+        
+    Returns:
+        argparse.Namespace: 해석된 인자
+    """
+    parser = argparse.ArgumentParser(description="똥피하기 게임")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="바뀐 영역만 다시 그리는 더티 렉트 렌더링 사용")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="게임 로직 난수 시드 (같은 시드와 입력이면 같은 게임)")
+    parser.add_argument("--pool-stats", action="store_true",
+                        help="종료할 때 오브젝트 풀 통계 출력")
+    parser.add_argument("--record", metavar="PATH",
+                        help="플레이 입력을 기록해 종료할 때 저장")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="기록한 입력을 최대 속도로 재생하고 통계 출력")
+    parser.add_argument("--render-every", type=int, default=0, metavar="N",
+                        help="재생할 때 N 프레임마다 화면 그리기 (기본값: 그리지 않음)")
+    parser.add_argument("--resizable", action="store_true",
+                        help="창 크기 조절 허용 (창 크기에 맞는 해상도로 애셋을 다시 래스터화)")
+    parser.add_argument("--fullscreen", action="store_true",
+                        help="전체 화면으로 실행")
+    parser.add_argument("--watch-assets", action="store_true",
+                        help="SVG 파일이 바뀌면 바로 다시 래스터화해 반영 (아트 작업용)")
+    parser.add_argument("--rasterizer", choices=sorted(RASTERIZERS), default=None,
+                        help="SVG 래스터화 백엔드 (기본값: POOP_DODGE_RASTERIZER 환경 변수 또는 cairosvg)")
+    parser.add_argument("--fixed-quality", action="store_true",
+                        help="프레임 시간에 따라 효과 품질(파티클 수, 깜빡임, HUD 갱신)을 자동으로 낮추지 않음")
+    parser.add_argument("--profile", action="store_true",
+                        help="프레임 단계별 시간 측정 (F3으로 화면 표시 전환)")
+    parser.add_argument("--profile-overlay", action="store_true",
+                        help="측정값을 화면에 표시한 상태로 시작 (--profile 포함)")
+    parser.add_argument("--profile-out", metavar="PATH",
+                        help="종료할 때 측정값 저장 (.json: Chrome trace, .csv: CSV, --profile 포함)")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
+    args = parse_args()
+    
     # 필요한 디렉토리 확인
     if not os.path.exists("assets/svg"):
         print("Error: assets/svg directory not found!")
         print("Please make sure all SVG assets are in the correct location.")
         sys.exit(1)
         
+    # 재생할 기록이 있으면 기록된 시드 사용, 기록할 때는 시드를 정해 함께 저장
+    replay = Replay.load(args.replay) if args.replay else None
+    if replay is not None:
+        args.seed = replay.seed
+    elif args.record and args.seed is None:
+        args.seed = random.randrange(2 ** 31)
+        
     # 게임 실행
-    game = Game()
-    game.run()
+    profiling = args.profile or args.profile_overlay or args.profile_out
+    profiler = FrameProfiler() if profiling else None
+    game = Game(dirty_rects=args.dirty_rects, seed=args.seed,
+                profiler=profiler, profile_overlay=args.profile_overlay,
+                resizable=args.resizable, fullscreen=args.fullscreen,
+                watch_assets=args.watch_assets, rasterizer=args.rasterizer,
+                adaptive_quality=not args.fixed_quality)
+    
+    if replay is not None:
+        stats = game.play_replay(replay, args.render_every)
+        pygame.quit()
+        for key, value in stats.items():
+            print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
+    else:
+        if args.record:
+            recording = game.start_recording()
+        game.run()
+        if args.record:
+            recording.save(args.record)
+            print(f"Replay saved to {args.record} ({len(recording)} frames, seed {recording.seed})")
+    
+    if args.profile_out:
+        profiler.export(args.profile_out)
+        print(f"Profile saved to {args.profile_out} ({min(profiler.frame_count, profiler.capacity)} frames)")
+    
+    if args.pool_stats:
+        for key, value in game.entity_stats().items():
+            print(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}")
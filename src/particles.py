@@ -0,0 +1,208 @@
+"""
+NumPy 배열 기반 파티클 시스템 모듈
+"""
+import numpy as np
+import pygame
+
+# 파티클 물리 설정 (프레임 단위)
+PARTICLE_GRAVITY = 0.3
+PARTICLE_LIFE = 30  # 파티클 수명 (프레임 수)
+PARTICLE_SIZE_DECAY = 0.1
+PARTICLE_MIN_SIZE = 0.2
+DEFAULT_PARTICLE_CAPACITY = 1024
+
+
+class ParticleSystem:
+    """위치, 속도, 크기, 수명, 색상을 배열로 저장하는 파티클 시스템 클래스"""
+
+    def __init__(self, capacity=DEFAULT_PARTICLE_CAPACITY, rng=None):
+        """
+        파티클 시스템 초기화
+
+        Args:
+            capacity (int): 미리 할당할 파티클 수 (부족하면 두 배씩 늘어남)
+            rng (numpy.random.Generator, optional): 난수 생성기
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = 0
+        self._sprites = {}  # (반지름, 색상) -> 원 스프라이트
+        self._allocate(capacity)
+
+        # 통계 (배열 슬롯이 파티클 풀 역할)
+        self.bursts = 0  # emit 호출 수
+        self.grows = 0  # 용량이 부족해 배열을 다시 할당한 횟수
+        self.peak_count = 0  # 동시에 살아 있던 최대 파티클 수
+
+    def _allocate(self, capacity):
+        """파티클 배열 할당 (기존 파티클은 유지)"""
+        position = np.zeros((capacity, 2), dtype=np.float32)
+        velocity = np.zeros((capacity, 2), dtype=np.float32)
+        size = np.zeros(capacity, dtype=np.float32)
+        life = np.zeros(capacity, dtype=np.int16)
+        color = np.zeros((capacity, 3), dtype=np.uint8)
+
+        if self.count:
+            n = self.count
+            position[:n] = self.position[:n]
+            velocity[:n] = self.velocity[:n]
+            size[:n] = self.size[:n]
+            life[:n] = self.life[:n]
+            color[:n] = self.color[:n]
+
+        self.capacity = capacity
+        self.position = position
+        self.velocity = velocity
+        self.size = size
+        self.life = life
+        self.color = color
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """모든 파티클 제거"""
+        self.count = 0
+
+    def emit(self, x, y, count, color=(139, 69, 19)):
+        """
+        파티클 생성
+
+        Args:
+            x (int): 파티클 생성 x 좌표
+            y (int): 파티클 생성 y 좌표
+            count (int): 생성할 파티클 수
+            color (tuple): 파티클 색상 (R, G, B)
+        """
+        if count <= 0:
+            return
+
+        needed = self.count + count
+        self.bursts += 1
+        if needed > self.capacity:
+            self._allocate(max(self.capacity * 2, needed))
+            self.grows += 1
+
+        start, end = self.count, needed
+        self.position[start:end] = (x, y)
+        self.velocity[start:end, 0] = self.rng.uniform(-3, 3, count)
+        self.velocity[start:end, 1] = self.rng.uniform(-7, -2, count)
+        self.size[start:end] = self.rng.integers(2, 6, count)
+        self.life[start:end] = PARTICLE_LIFE
+        self.color[start:end] = color
+        self.count = end
+        if end > self.peak_count:
+            self.peak_count = end
+
+    def hit_rate(self):
+        """
+        미리 할당된 슬롯만으로 처리한 emit 비율
+
+        Returns:
+            float: 재할당 없이 처리한 비율 (0~1)
+        """
+        return 1.0 - self.grows / self.bursts if self.bursts else 0.0
+
+    def update(self):
+        """파티클 상태 업데이트 (이동, 중력, 크기 감소, 수명)"""
+        n = self.count
+        if n == 0:
+            return
+
+        position = self.position[:n]
+        velocity = self.velocity[:n]
+        size = self.size[:n]
+        life = self.life[:n]
+
+        position += velocity
+        velocity[:, 1] += PARTICLE_GRAVITY
+        life -= 1
+
+        # 크기 감소
+        size[size > PARTICLE_MIN_SIZE] -= PARTICLE_SIZE_DECAY
+
+        self._compact()
+
+    def _compact(self):
+        """
+        수명이 다한 파티클 제거
+
+        살아 있는 파티클 수를 k라고 할 때, 앞쪽 k개 안의 빈자리를
+        뒤쪽의 살아 있는 파티클로 채웁니다 (순서는 유지하지 않음).
+        """
+        n = self.count
+        alive = self.life[:n] > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count == n:
+            return
+
+        holes = np.flatnonzero(~alive[:alive_count])
+        sources = np.flatnonzero(alive[alive_count:]) + alive_count
+        for array in (self.position, self.velocity, self.size, self.life, self.color):
+            array[holes] = array[sources]
+        self.count = alive_count
+
+    def _sprite(self, radius, color):
+        """
+        미리 그려 둔 원 스프라이트 가져오기
+
+        pygame.draw.circle과 같은 픽셀이 되도록 (2r x 2r) 표면의 (r, r)에 원을 그립니다.
+
+        Args:
+            radius (int): 반지름
+            color (tuple): 색상 (R, G, B)
+
+        Returns:
+            pygame.Surface: 원 스프라이트
+        """
+        key = (radius, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._sprites[key] = sprite
+        return sprite
+
+    def blit_items(self, scale=1):
+        """
+        파티클을 그릴 (스프라이트, 위치) 목록
+
+        반지름과 색상이 같은 파티클은 같은 스프라이트를 공유하며,
+        반지름이 1보다 작은 파티클은 pygame.draw.circle처럼 그리지 않습니다.
+
+        Args:
+            scale (float): 위치와 반지름에 곱할 화면 배율
+
+        Returns:
+            list: Surface.blits에 넘길 (표면, (x, y)) 목록
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        if scale == 1:
+            positions = self.position[:n].astype(np.int32)
+            radii = self.size[:n].astype(np.int32)
+        else:
+            positions = (self.position[:n] * scale).astype(np.int32)
+            radii = (self.size[:n] * scale).astype(np.int32)
+        visible = radii > 0
+        if not visible.all():
+            positions = positions[visible]
+            radii = radii[visible]
+            colors = self.color[:n][visible]
+        else:
+            colors = self.color[:n]
+        if len(radii) == 0:
+            return []
+
+        # (반지름, 색상)을 정수 하나로 묶어 종류별로 스프라이트를 한 번만 찾음
+        packed = ((colors[:, 0].astype(np.int64) << 16) | (colors[:, 1].astype(np.int64) << 8)
+                  | colors[:, 2]) * 256 + radii
+        keys, inverse = np.unique(packed, return_inverse=True)
+        sprites = [self._sprite(int(key & 0xFF), ((int(key) >> 24) & 0xFF, (int(key) >> 16) & 0xFF,
+                                                  (int(key) >> 8) & 0xFF))
+                   for key in keys]
+        corners = positions - radii[:, None]
+        return list(zip(map(sprites.__getitem__, inverse.tolist()), map(tuple, corners.tolist())))
@@ -0,0 +1,315 @@
+"""
+프레임 단위 구간 시간 측정 모듈
+
+게임 루프의 각 단계(이벤트 처리, 업데이트, 그리기 등)에 걸린 시간을 고정 크기 링 버퍼에 기록하고,
+화면 오버레이로 보여 주거나 Chrome trace-event JSON 또는 CSV로 내보냅니다.
+"""
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+
+from settings import FPS
+
+DEFAULT_PROFILER_CAPACITY = 600  # 기록할 프레임 수 (60 FPS 기준 10초)
+MAX_PROFILER_PHASES = 32
+OVERLAY_WINDOW = 60  # 오버레이 평균을 계산할 최근 프레임 수
+IDLE_PHASE = "clock.tick"  # 프레임 시간 중 대기 시간으로 보는 구간
+
+
+class _Section:
+    """with 문으로 한 구간의 시간을 재는 객체"""
+
+    __slots__ = ("profiler", "index", "start")
+
+    def __init__(self, profiler, index):
+        self.profiler = profiler
+        self.index = index
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler._record(self.index, self.start, time.perf_counter())
+        return False
+
+
+class _NullSection:
+    """아무것도 기록하지 않는 구간 객체"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class NullProfiler:
+    """측정을 끈 경우 사용하는 프로파일러 (모든 호출이 아무 일도 하지 않음)"""
+
+    enabled = False
+
+    def section(self, name):
+        """구간 측정 (아무 일도 하지 않음)"""
+        return _NULL_SECTION
+
+    def begin_frame(self):
+        """프레임 시작 (아무 일도 하지 않음)"""
+
+    def end_frame(self):
+        """프레임 종료 (아무 일도 하지 않음)"""
+
+
+class FrameProfiler:
+    """프레임별 구간 시간을 링 버퍼에 기록하는 프로파일러 클래스"""
+
+    enabled = True
+
+    def __init__(self, capacity=DEFAULT_PROFILER_CAPACITY, frame_budget=1.0 / FPS,
+                 idle_phase=IDLE_PHASE):
+        """
+        프로파일러 초기화
+
+        Args:
+            capacity (int): 링 버퍼에 보관할 프레임 수
+            frame_budget (float): 프레임 시간 예산 (초, 넘으면 드롭된 프레임으로 판단)
+            idle_phase (str): 대기 시간으로 보고 예산 계산에서 제외할 구간 이름
+        """
+        self.capacity = capacity
+        self.frame_budget = frame_budget
+        self.idle_phase = idle_phase
+        self.origin = time.perf_counter()
+
+        # 링 버퍼 (프레임 x 구간)
+        self.section_starts = np.zeros((capacity, MAX_PROFILER_PHASES))
+        self.section_durations = np.zeros((capacity, MAX_PROFILER_PHASES))
+        self.frame_starts = np.zeros(capacity)
+        self.frame_durations = np.zeros(capacity)
+
+        self.phase_names = []
+        self._sections = {}
+        self.frame_count = 0  # 완료된 프레임 수
+        self.dropped_frames = 0
+        self._row = None  # 기록 중인 링 버퍼 행
+
+    def section(self, name):
+        """
+        구간 측정용 객체 가져오기
+
+        Args:
+            name (str): 구간 이름
+
+        Returns:
+            with 문에서 사용할 구간 객체
+        """
+        section = self._sections.get(name)
+        if section is None:
+            if len(self.phase_names) >= MAX_PROFILER_PHASES:
+                return _NULL_SECTION
+            section = _Section(self, len(self.phase_names))
+            self.phase_names.append(name)
+            self._sections[name] = section
+        return section
+
+    def begin_frame(self):
+        """프레임 기록 시작"""
+        row = self.frame_count % self.capacity
+        self.section_starts[row] = 0.0
+        self.section_durations[row] = 0.0
+        self.frame_starts[row] = time.perf_counter() - self.origin
+        self._row = row
+
+    def end_frame(self):
+        """프레임 기록 종료"""
+        row = self._row
+        if row is None:
+            return
+        self.frame_durations[row] = time.perf_counter() - self.origin - self.frame_starts[row]
+        if self._busy_time(row) > self.frame_budget:
+            self.dropped_frames += 1
+        self.frame_count += 1
+        self._row = None
+
+    def _record(self, index, start, end):
+        """구간 시간 기록 (한 프레임에 같은 구간이 여러 번 있으면 합산)"""
+        row = self._row
+        if row is None:
+            return
+        if self.section_durations[row, index] == 0.0:
+            self.section_starts[row, index] = start - self.origin
+        self.section_durations[row, index] += end - start
+
+    def _busy_time(self, row):
+        """대기 구간을 뺀 프레임 작업 시간 (초)"""
+        busy = self.frame_durations[row]
+        idle = self._sections.get(self.idle_phase)
+        if idle is not None:
+            busy -= self.section_durations[row, idle.index]
+        return busy
+
+    def _rows(self, last=None):
+        """기록된 프레임의 링 버퍼 행 번호 (오래된 것부터)"""
+        count = min(self.frame_count, self.capacity)
+        if last is not None:
+            count = min(count, last)
+        first = self.frame_count - count
+        return [(first + i) % self.capacity for i in range(count)]
+
+    def averages(self, last=OVERLAY_WINDOW):
+        """
+        최근 프레임의 구간별 평균 시간
+
+        Args:
+            last (int): 평균을 낼 최근 프레임 수
+
+        Returns:
+            dict: 구간 이름별 평균 시간 (ms), "frame" 키는 전체 프레임 시간
+        """
+        rows = self._rows(last)
+        if not rows:
+            return {}
+        result = {"frame": float(self.frame_durations[rows].mean() * 1000.0)}
+        for index, name in enumerate(self.phase_names):
+            result[name] = float(self.section_durations[rows, index].mean() * 1000.0)
+        return result
+
+    def slowest_phase(self, row):
+        """
+        프레임에서 가장 오래 걸린 구간 (대기 구간 제외)
+
+        Args:
+            row (int): 링 버퍼 행 번호
+
+        Returns:
+            str: 구간 이름 또는 기록이 없으면 None
+        """
+        best_name = None
+        best_duration = 0.0
+        for index, name in enumerate(self.phase_names):
+            duration = self.section_durations[row, index]
+            if name != self.idle_phase and duration > best_duration:
+                best_name, best_duration = name, duration
+        return best_name
+
+    def last_dropped_frame(self):
+        """
+        가장 최근에 드롭된 프레임 정보
+
+        Returns:
+            tuple: (프레임 번호, 작업 시간 ms, 가장 오래 걸린 구간) 또는 없으면 None
+        """
+        rows = self._rows()
+        first = self.frame_count - len(rows)
+        for offset in range(len(rows) - 1, -1, -1):
+            row = rows[offset]
+            busy = self._busy_time(row)
+            if busy > self.frame_budget:
+                return first + offset, busy * 1000.0, self.slowest_phase(row)
+        return None
+
+    def export_chrome_trace(self, path):
+        """
+        Chrome trace-event JSON으로 내보내기 (chrome://tracing, Perfetto에서 열 수 있음)
+
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        events = []
+        rows = self._rows()
+        first = self.frame_count - len(rows)
+        for offset, row in enumerate(rows):
+            busy = self._busy_time(row)
+            events.append({
+                "name": "frame", "ph": "X", "pid": 1, "tid": 1,
+                "ts": self.frame_starts[row] * 1e6,
+                "dur": self.frame_durations[row] * 1e6,
+                "args": {
+                    "frame": first + offset,
+                    "busy_ms": busy * 1000.0,
+                    "dropped": bool(busy > self.frame_budget),
+                    "slowest": self.slowest_phase(row),
+                },
+            })
+            for index, name in enumerate(self.phase_names):
+                duration = self.section_durations[row, index]
+                if duration > 0.0:
+                    events.append({
+                        "name": name, "ph": "X", "pid": 1, "tid": 1,
+                        "ts": self.section_starts[row, index] * 1e6,
+                        "dur": duration * 1e6,
+                    })
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def export_csv(self, path):
+        """
+        프레임당 한 줄인 CSV로 내보내기 (시간 단위 ms)
+
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        rows = self._rows()
+        first = self.frame_count - len(rows)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "start_ms", "frame_ms", "dropped", "slowest"] + self.phase_names)
+            for offset, row in enumerate(rows):
+                busy = self._busy_time(row)
+                writer.writerow(
+                    [first + offset,
+                     f"{self.frame_starts[row] * 1000.0:.3f}",
+                     f"{self.frame_durations[row] * 1000.0:.3f}",
+                     int(busy > self.frame_budget),
+                     self.slowest_phase(row) or ""]
+                    + [f"{self.section_durations[row, index] * 1000.0:.3f}"
+                       for index in range(len(self.phase_names))]
+                )
+
+    def export(self, path):
+        """
+        파일 확장자에 따라 CSV 또는 Chrome trace JSON으로 내보내기
+
+        Args:
+            path (str): 저장할 파일 경로 (.csv 또는 .json)
+        """
+        if path.lower().endswith(".csv"):
+            self.export_csv(path)
+        else:
+            self.export_chrome_trace(path)
+
+    def draw_overlay(self, screen, font, pos=(10, 90), color=(0, 0, 0)):
+        """
+        최근 구간별 평균 시간을 화면에 표시
+
+        Args:
+            screen (pygame.Surface): 그릴 화면
+            font (pygame.font.Font): 글꼴
+            pos (tuple): 왼쪽 위 좌표
+            color (tuple): 글자 색상
+
+        Returns:
+            pygame.Rect: 그린 영역
+        """
+        lines = [f"{name}: {ms:.2f} ms" for name, ms in self.averages().items()]
+        dropped = self.last_dropped_frame()
+        lines.append(f"dropped: {self.dropped_frames}")
+        if dropped:
+            lines.append(f"last drop #{dropped[0]}: {dropped[1]:.1f} ms ({dropped[2]})")
+
+        x, y = pos
+        area = pygame.Rect(x, y, 0, 0)
+        for line in lines:
+            text = font.render(line, True, color)
+            area.union_ip(screen.blit(text, (x, y)))
+            y += text.get_height()
+        return area
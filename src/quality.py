@@ -0,0 +1,96 @@
+"""
+프레임 시간 예산에 맞춰 효과 품질을 조절하는 모듈
+
+최근 프레임들의 작업 시간(clock.tick 대기 제외) 평균이 예산을 넘으면 품질을 한 단계 낮추고,
+충분히 여유가 있는 상태가 이어지면 한 단계 올립니다. 품질은 파티클 수, 깜빡임 효과,
+HUD 갱신 간격 같은 시각 효과에만 영향을 주며 게임 로직(시뮬레이션)은 그대로입니다.
+"""
+from collections import deque, namedtuple
+
+from settings import FPS
+
+# 품질 단계 (파티클 수 배율, 깜빡임 반투명 이미지 사용 여부, 점수/HP 표시를 다시 그리는 프레임 간격)
+QualityLevel = namedtuple("QualityLevel", ["name", "particle_scale", "flash", "hud_interval"])
+
+QUALITY_LEVELS = (
+    QualityLevel("high", 1.0, True, 1),
+    QualityLevel("medium", 0.5, True, 1),
+    QualityLevel("low", 0.25, False, 1),
+    QualityLevel("minimal", 0.1, False, 6),
+)
+
+QUALITY_WINDOW = 30  # 평균을 계산할 최근 프레임 수
+QUALITY_HEADROOM = 0.6  # 평균이 예산의 이 비율보다 짧아야 품질을 올림
+QUALITY_UPGRADE_DELAY = 180  # 품질을 바꾼 뒤 다시 올리기까지 기다릴 최소 프레임 수 (오르내림 반복 방지)
+
+
+class QualityGovernor:
+    """최근 프레임 시간으로 효과 품질 단계를 고르는 클래스"""
+
+    def __init__(self, frame_budget=1.0 / FPS, window=QUALITY_WINDOW, headroom=QUALITY_HEADROOM,
+                 upgrade_delay=QUALITY_UPGRADE_DELAY, levels=QUALITY_LEVELS):
+        """
+        품질 조절기 초기화
+
+        Args:
+            frame_budget (float): 프레임 시간 예산 (초)
+            window (int): 평균을 계산할 최근 프레임 수
+            headroom (float): 품질을 올릴 수 있는 평균 프레임 시간 (예산 대비 비율)
+            upgrade_delay (int): 품질을 바꾼 뒤 다시 올리기까지 기다릴 최소 프레임 수
+            levels (tuple): 높은 품질부터 나열한 QualityLevel 목록
+        """
+        self.frame_budget = frame_budget
+        self.headroom = headroom
+        self.upgrade_delay = upgrade_delay
+        self.levels = tuple(levels)
+        self.index = 0
+        self._samples = deque(maxlen=window)
+        self._frames_since_change = 0
+
+        # 통계
+        self.transitions = 0
+
+    @property
+    def level(self):
+        """현재 품질 단계"""
+        return self.levels[self.index]
+
+    def record(self, frame_time):
+        """
+        프레임 작업 시간 기록 후 필요하면 품질 단계 변경
+
+        Args:
+            frame_time (float): clock.tick 대기를 뺀 프레임 작업 시간 (초)
+
+        Returns:
+            bool: 품질 단계를 바꿨으면 True
+        """
+        samples = self._samples
+        samples.append(frame_time)
+        self._frames_since_change += 1
+        if len(samples) < samples.maxlen:
+            return False
+
+        average = sum(samples) / len(samples)
+        if average > self.frame_budget and self.index < len(self.levels) - 1:
+            self._change(self.index + 1, average)
+            return True
+        if (average < self.frame_budget * self.headroom and self.index > 0
+                and self._frames_since_change >= self.upgrade_delay):
+            self._change(self.index - 1, average)
+            return True
+        return False
+
+    def reset_window(self):
+        """측정 중인 프레임 버리기 (화면 전환처럼 프레임 시간이 크게 달라질 때, 단계는 유지)"""
+        self._samples.clear()
+
+    def _change(self, index, average):
+        """품질 단계를 바꾸고 기록"""
+        previous = self.level
+        self.index = index
+        self.transitions += 1
+        self._samples.clear()  # 새 단계의 프레임 시간으로 다시 판단
+        self._frames_since_change = 0
+        print(f"Quality: {previous.name} -> {self.level.name} "
+              f"(average frame {average * 1000:.1f} ms, budget {self.frame_budget * 1000:.1f} ms)")
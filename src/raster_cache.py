@@ -0,0 +1,196 @@
+"""
+SVG 래스터화 결과를 디스크에 저장하는 캐시 모듈
+"""
+import hashlib
+import os
+import struct
+import tempfile
+
+# 기본 캐시 위치 및 용량 제한
+DEFAULT_CACHE_DIR = os.environ.get(
+    "POOP_DODGE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "poop_dodge")
+)
+DEFAULT_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 32MB
+
+# 캐시 파일 헤더 (너비, 높이)
+_HEADER = struct.Struct("<II")
+_ENTRY_SUFFIX = ".rgba"
+
+
+def content_key(filepath, width, height, rasterizer_version):
+    """
+    SVG 내용, 출력 크기, 래스터라이저 버전으로 키 생성
+
+    Args:
+        filepath (str): SVG 파일 경로
+        width (int): 출력 너비
+        height (int): 출력 높이
+        rasterizer_version (str): 래스터라이저 이름 및 버전
+
+    Returns:
+        str: 16진수 해시 문자열 또는 파일을 읽을 수 없으면 None
+    """
+    try:
+        with open(filepath, "rb") as f:
+            svg_data = f.read()
+    except OSError:
+        return None
+
+    digest = hashlib.sha256(svg_data)
+    digest.update(f"|{width}x{height}|{rasterizer_version}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RasterCache:
+    """SVG 내용 해시로 주소를 정하는 RGBA 래스터 캐시 클래스"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        """
+        래스터 캐시 초기화
+
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 디렉토리
+            max_bytes (int): 캐시 전체 용량 제한 (바이트)
+        """
+        self.cache_dir = os.path.join(cache_dir, "raster")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, filepath, width, height, rasterizer_version):
+        """
+        캐시 키 생성
+
+        SVG 내용이 바뀌면 해시가 달라지므로 이전 항목은 자동으로 무효화됩니다.
+
+        Args:
+            filepath (str): SVG 파일 경로
+            width (int): 출력 너비 (None이면 원본 크기)
+            height (int): 출력 높이 (None이면 원본 크기)
+            rasterizer_version (str): 래스터라이저 이름 및 버전
+
+        Returns:
+            str: 캐시 키 또는 파일을 읽을 수 없으면 None
+        """
+        return content_key(filepath, width, height, rasterizer_version)
+
+    def _entry_path(self, key):
+        """캐시 키에 해당하는 파일 경로"""
+        return os.path.join(self.cache_dir, key + _ENTRY_SUFFIX)
+
+    def get(self, key):
+        """
+        캐시된 래스터 데이터 가져오기
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            tuple: ((너비, 높이), RGBA 바이트) 또는 캐시에 없으면 None
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        if len(data) < _HEADER.size:
+            self._discard(path)
+            self.misses += 1
+            return None
+
+        width, height = _HEADER.unpack_from(data)
+        pixels = data[_HEADER.size:]
+        if len(pixels) != width * height * 4:
+            # 손상된 항목은 삭제하고 다시 래스터화
+            self._discard(path)
+            self.misses += 1
+            return None
+
+        # LRU 순서를 위해 마지막 사용 시각 갱신
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return (width, height), pixels
+
+    def put(self, key, size, pixels):
+        """
+        래스터 데이터를 캐시에 저장
+
+        Args:
+            key (str): 캐시 키
+            size (tuple): 이미지 크기 (너비, 높이)
+            pixels (bytes): RGBA 픽셀 데이터
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # 다른 프로세스가 읽는 도중 깨진 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_HEADER.pack(size[0], size[1]))
+                    f.write(pixels)
+                os.replace(tmp_path, self._entry_path(key))
+            except OSError:
+                self._discard(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Warning: Could not write raster cache entry: {e}")
+            return
+
+        self.evict()
+
+    def evict(self):
+        """용량 제한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        entries = []
+        total = 0
+        for entry_name in names:
+            if not entry_name.endswith(_ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, entry_name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, entry_size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._discard(path)
+            total -= entry_size
+
+    def clear(self):
+        """캐시 항목 전체 삭제"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        for entry_name in names:
+            if entry_name.endswith(_ENTRY_SUFFIX):
+                self._discard(os.path.join(self.cache_dir, entry_name))
+
+    def _discard(self, path):
+        """파일 삭제 (실패해도 무시)"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
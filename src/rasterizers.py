@@ -0,0 +1,241 @@
+"""
+SVG 래스터화 백엔드 모듈
+
+모든 백엔드는 SVG 파일을 ((너비, 높이), RGBA 바이트)로 변환하므로 디스크 캐시와
+Pygame 표면 생성 코드를 그대로 공유합니다. 백엔드마다 결과 픽셀이 조금씩 다를 수 있어
+캐시 키에는 백엔드 이름과 버전(version)을 넣습니다.
+
+    cairosvg  cairosvg로 PNG를 만든 뒤 다시 디코딩 (기본값)
+    cairo     cairosvg가 그린 cairo 이미지 버퍼를 PNG 인코딩/디코딩 없이 바로 RGBA로 변환
+    pygame    Pygame(SDL_image)의 SVG 로더 사용 (cairo 라이브러리 불필요)
+
+백엔드는 SVGAssetManager의 rasterizer 인자나 POOP_DODGE_RASTERIZER 환경 변수로 고릅니다.
+"""
+import io
+import os
+
+import numpy as np
+import pygame
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # cairo 라이브러리가 없으면 pygame 백엔드만 사용 가능
+    cairosvg = None
+try:
+    from cairosvg.parser import Tree
+    from cairosvg.surface import PNGSurface, cairo
+except (ImportError, OSError):
+    PNGSurface = None
+
+DEFAULT_RASTERIZER = os.environ.get("POOP_DODGE_RASTERIZER", "cairosvg")
+SVG_DPI = 96  # cairosvg.svg2png 기본값과 같은 해상도
+
+
+class CairoSVGRasterizer:
+    """cairosvg.svg2png로 PNG를 만든 뒤 Pygame으로 디코딩하는 백엔드"""
+
+    name = "cairosvg"
+
+    @property
+    def available(self):
+        return cairosvg is not None
+
+    @property
+    def version(self):
+        return f"cairosvg-{cairosvg.__version__}"
+
+    def rasterize(self, filepath, width=None, height=None):
+        """
+        SVG 파일을 RGBA 데이터로 변환
+
+        Args:
+            filepath (str): SVG 파일 경로
+            width (int, optional): 원하는 너비
+            height (int, optional): 원하는 높이
+
+        Returns:
+            tuple: ((너비, 높이), RGBA 바이트)
+        """
+        if width and height:
+            png_data = cairosvg.svg2png(url=filepath, write_to=None,
+                                        output_width=width, output_height=height)
+        else:
+            png_data = cairosvg.svg2png(url=filepath, write_to=None)
+        surface = pygame.image.load(io.BytesIO(png_data))
+        return surface.get_size(), pygame.image.tostring(surface, "RGBA")
+
+
+class CairoBufferRasterizer(CairoSVGRasterizer):
+    """cairosvg가 그린 cairo 이미지 표면의 픽셀 버퍼를 바로 RGBA로 변환하는 백엔드"""
+
+    name = "cairo"
+
+    @property
+    def available(self):
+        return PNGSurface is not None
+
+    @property
+    def version(self):
+        return f"cairo-{cairo.cairo_version_string()}-cairosvg-{cairosvg.__version__}"
+
+    def rasterize(self, filepath, width=None, height=None):
+        """
+        SVG 파일을 RGBA 데이터로 변환 (PNG 인코딩/디코딩 생략)
+
+        Args:
+            filepath (str): SVG 파일 경로
+            width (int, optional): 원하는 너비
+            height (int, optional): 원하는 높이
+
+        Returns:
+            tuple: ((너비, 높이), RGBA 바이트)
+        """
+        if width and height:
+            svg_surface = PNGSurface(Tree(url=filepath), None, SVG_DPI,
+                                     output_width=width, output_height=height)
+        else:
+            svg_surface = PNGSurface(Tree(url=filepath), None, SVG_DPI)
+        image = svg_surface.cairo
+        image.flush()
+        size = image.get_width(), image.get_height()
+        return size, argb32_to_rgba(image.get_data(), size, image.get_stride())
+
+
+class PygameRasterizer:
+    """Pygame(SDL_image)의 SVG 로더를 사용하는 백엔드"""
+
+    name = "pygame"
+
+    @property
+    def available(self):
+        # SDL_image는 2.0.2부터 SVG를 지원
+        return pygame.image.get_extended() and pygame.image.get_sdl_image_version() >= (2, 0, 2)
+
+    @property
+    def version(self):
+        sdl_image = ".".join(map(str, pygame.image.get_sdl_image_version()))
+        return f"pygame-{pygame.version.ver}-sdl_image-{sdl_image}"
+
+    def rasterize(self, filepath, width=None, height=None):
+        """
+        SVG 파일을 RGBA 데이터로 변환
+
+        크기를 지정해 읽을 수 없는 Pygame 버전(2.4 미만)에서는 원본 크기로 읽은 뒤 확대/축소합니다.
+
+        Args:
+            filepath (str): SVG 파일 경로
+            width (int, optional): 원하는 너비
+            height (int, optional): 원하는 높이
+
+        Returns:
+            tuple: ((너비, 높이), RGBA 바이트)
+        """
+        if width and height and hasattr(pygame.image, "load_sized_svg"):
+            surface = pygame.image.load_sized_svg(filepath, (width, height))
+        else:
+            surface = pygame.image.load(filepath)
+        if width and height and surface.get_size() != (width, height):
+            # load_sized_svg는 가로세로 비율을 유지하므로 요청한 크기와 다를 수 있음
+            surface = pygame.transform.smoothscale(surface, (width, height))
+        return surface.get_size(), pygame.image.tostring(surface, "RGBA")
+
+
+RASTERIZERS = {rasterizer.name: rasterizer
+               for rasterizer in (CairoSVGRasterizer(), CairoBufferRasterizer(), PygameRasterizer())}
+
+
+def argb32_to_rgba(data, size, stride):
+    """
+    cairo ARGB32(알파가 곱해진 네이티브 엔디언 32비트) 버퍼를 RGBA 바이트로 변환
+
+    알파를 되돌릴 때 cairo의 PNG 저장과 같은 반올림을 사용해 cairosvg 백엔드와 같은 픽셀을 만듭니다.
+
+    Args:
+        data: cairo 이미지 표면의 픽셀 버퍼
+        size (tuple): 이미지 크기 (너비, 높이)
+        stride (int): 한 줄의 바이트 수
+
+    Returns:
+        bytes: RGBA 픽셀 데이터
+    """
+    width, height = size
+    pixels = np.frombuffer(data, np.uint32, count=height * stride // 4)
+    pixels = pixels.reshape(height, stride // 4)[:, :width]
+
+    alpha = pixels >> 24
+    rgba = np.empty((height, width, 4), np.uint8)
+    rgba[..., 3] = alpha
+    half = alpha // 2
+    safe_alpha = np.maximum(alpha, 1)  # 완전히 투명한 픽셀은 색 값도 0
+    for channel, shift in enumerate((16, 8, 0)):
+        value = (pixels >> shift) & 0xFF
+        rgba[..., channel] = (value * 255 + half) // safe_alpha
+    return rgba.tobytes()
+
+
+def get_rasterizer(name=None):
+    """
+    이름으로 래스터화 백엔드 찾기
+
+    알 수 없거나 이 환경에서 사용할 수 없는 백엔드면 경고를 출력하고
+    사용 가능한 다른 백엔드를 반환합니다.
+
+    Args:
+        name (str, optional): 백엔드 이름 (기본값: DEFAULT_RASTERIZER)
+
+    Returns:
+        백엔드 객체 (name, version, rasterize 제공)
+    """
+    name = name or DEFAULT_RASTERIZER
+    rasterizer = RASTERIZERS.get(name)
+    if rasterizer is not None and rasterizer.available:
+        return rasterizer
+
+    fallback = next((r for r in RASTERIZERS.values() if r.available), None)
+    if fallback is None:
+        raise RuntimeError("No SVG rasterizer available (install cairosvg or pygame with SVG support)")
+    reason = "unknown" if rasterizer is None else "not available"
+    print(f"Warning: SVG rasterizer '{name}' is {reason}. Using '{fallback.name}'.")
+    return fallback
+
+
+def rasterize_svg(filepath, width=None, height=None, rasterizer=None):
+    """
+    SVG 파일을 RGBA 데이터로 변환
+
+    프로세스 풀 작업자에서도 호출되므로 백엔드는 이름으로 넘기며 Pygame 화면 상태에 의존하지 않습니다.
+
+    Args:
+        filepath (str): SVG 파일 경로
+        width (int, optional): 원하는 너비
+        height (int, optional): 원하는 높이
+        rasterizer (str, optional): 백엔드 이름 (기본값: DEFAULT_RASTERIZER)
+
+    Returns:
+        tuple: ((너비, 높이), RGBA 바이트)
+    """
+    return get_rasterizer(rasterizer).rasterize(filepath, width, height)
+
+
+def pixel_difference(reference, other):
+    """
+    두 래스터 결과의 픽셀 차이
+
+    Args:
+        reference (tuple): 기준 ((너비, 높이), RGBA 바이트)
+        other (tuple): 비교할 ((너비, 높이), RGBA 바이트)
+
+    Returns:
+        dict: 채널 값 차이의 최댓값/평균과 다른 픽셀 비율 (크기가 다르면 None)
+    """
+    if reference[0] != other[0]:
+        return None
+    width, height = reference[0]
+    a = np.frombuffer(reference[1], np.uint8).reshape(height, width, 4).astype(np.int16)
+    b = np.frombuffer(other[1], np.uint8).reshape(height, width, 4).astype(np.int16)
+    diff = np.abs(a - b)
+    return {
+        "max": int(diff.max()) if diff.size else 0,
+        "mean": float(diff.mean()) if diff.size else 0.0,
+        "differing": float(diff.any(axis=2).mean()) if diff.size else 0.0,
+    }
@@ -0,0 +1,84 @@
+"""
+레이어별로 그리기 요청을 모아 Surface.blits로 한 번에 그리는 모듈
+
+엔티티마다 blit을 호출하는 대신 (표면, 위치) 목록을 레이어별로 모아 두었다가
+레이어마다 Surface.blits를 한 번만 호출해 파이썬 호출 부담을 줄입니다.
+"""
+
+# 그리는 순서대로 나열한 레이어 이름
+DEFAULT_LAYERS = ("background", "player", "obstacles", "particles", "hud")
+
+
+class RenderBatch:
+    """레이어별 (표면, 위치) 목록을 모으는 그리기 일괄 처리 클래스"""
+
+    def __init__(self, layers=DEFAULT_LAYERS):
+        """
+        그리기 일괄 처리 초기화
+
+        Args:
+            layers (tuple): 그리는 순서대로 나열한 레이어 이름
+        """
+        self.layers = tuple(layers)
+        self._items = {layer: [] for layer in self.layers}
+
+        # 통계
+        self.blit_calls = 0  # 마지막 flush에서 호출한 Surface.blits 수
+        self.items_drawn = 0  # 마지막 flush에서 그린 표면 수
+
+    def add(self, layer, surface, dest, area=None):
+        """
+        그리기 요청 추가
+
+        Args:
+            layer (str): 레이어 이름
+            surface (pygame.Surface): 그릴 표면
+            dest: 그릴 위치 (좌표 또는 pygame.Rect)
+            area (pygame.Rect, optional): 원본 표면에서 그릴 영역 (아틀라스 사용 시)
+        """
+        if area is None:
+            self._items[layer].append((surface, dest))
+        else:
+            self._items[layer].append((surface, dest, area))
+
+    def extend(self, layer, items):
+        """
+        그리기 요청 여러 개 추가
+
+        Args:
+            layer (str): 레이어 이름
+            items (iterable): (표면, 위치) 또는 (표면, 위치, 영역) 튜플
+        """
+        self._items[layer].extend(items)
+
+    def clear(self):
+        """모은 그리기 요청 버리기"""
+        for items in self._items.values():
+            items.clear()
+
+    def flush(self, screen, collect_rects=False):
+        """
+        모은 요청을 레이어 순서대로 그리고 비우기
+
+        Args:
+            screen (pygame.Surface): 그릴 화면
+            collect_rects (bool): 그린 영역 목록을 돌려받을지 여부 (더티 렉트 모드에서 사용)
+
+        Returns:
+            list: 그린 영역 목록 (collect_rects가 False면 빈 목록)
+        """
+        rects = []
+        self.blit_calls = 0
+        self.items_drawn = 0
+        for layer in self.layers:
+            items = self._items[layer]
+            if not items:
+                continue
+            if collect_rects:
+                rects.extend(screen.blits(items))
+            else:
+                screen.blits(items, doreturn=False)
+            self.blit_calls += 1
+            self.items_drawn += len(items)
+            items.clear()
+        return rects
@@ -0,0 +1,257 @@
+"""
+플레이 입력을 기록하고 재생하는 모듈
+
+난수 시드와 프레임별 입력(왼쪽/오른쪽 키, 시작/재시작)만 저장하므로
+같은 시드로 재생하면 게임 로직이 기록할 때와 똑같이 진행됩니다.
+
+파일 형식 (리틀 엔디언):
+    헤더: 매직(4바이트 "PDRP"), 버전(uint16), 시드(int64), 프레임 수(uint32)
+    본문: (입력 플래그 1바이트, 반복 횟수 LEB128 가변 길이 정수) 쌍의 나열
+"""
+import struct
+
+REPLAY_MAGIC = b"PDRP"
+REPLAY_VERSION = 2  # 2: 픽셀 단위 충돌 검사 (1로 기록한 입력은 다르게 진행되므로 읽지 않음)
+
+# 프레임별 입력 플래그
+FLAG_LEFT = 0x01
+FLAG_RIGHT = 0x02
+FLAG_START = 0x04  # 시작/재시작 요청
+
+_HEADER = struct.Struct("<4sHqI")
+
+
+def encode_runs(frames):
+    """
+    프레임별 플래그를 (플래그, 반복 횟수) 런 길이 부호화
+
+    Args:
+        frames (bytes): 프레임별 입력 플래그
+
+    Returns:
+        bytes: 부호화된 데이터
+    """
+    data = bytearray()
+    index = 0
+    while index < len(frames):
+        flags = frames[index]
+        run = 1
+        while index + run < len(frames) and frames[index + run] == flags:
+            run += 1
+        data.append(flags)
+
+        # 반복 횟수는 7비트씩 나눠 저장 (LEB128)
+        value = run
+        while True:
+            byte = value & 0x7F
+            value >>= 7
+            if value:
+                data.append(byte | 0x80)
+            else:
+                data.append(byte)
+                break
+        index += run
+    return bytes(data)
+
+
+def decode_runs(data, frame_count):
+    """
+    런 길이 부호화된 데이터를 프레임별 플래그로 복원
+
+    Args:
+        data (bytes): 부호화된 데이터
+        frame_count (int): 헤더에 기록된 프레임 수
+
+    Returns:
+        bytearray: 프레임별 입력 플래그
+
+    Raises:
+        ValueError: 데이터가 손상된 경우
+    """
+    frames = bytearray()
+    index = 0
+    while index < len(data):
+        flags = data[index]
+        index += 1
+        run = 0
+        shift = 0
+        while True:
+            if index >= len(data):
+                raise ValueError("Truncated replay data")
+            byte = data[index]
+            index += 1
+            run |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                break
+        frames.extend(bytes((flags,)) * run)
+
+    if len(frames) != frame_count:
+        raise ValueError(f"Replay frame count mismatch ({len(frames)} != {frame_count})")
+    return frames
+
+
+class Replay:
+    """시드와 프레임별 입력 기록"""
+
+    def __init__(self, seed, frames=None):
+        """
+        입력 기록 초기화
+
+        Args:
+            seed (int): 게임 로직 난수 시드
+            frames (bytes, optional): 프레임별 입력 플래그
+        """
+        self.seed = seed
+        self.frames = bytearray(frames or b"")
+
+    def __len__(self):
+        return len(self.frames)
+
+    def to_bytes(self):
+        """
+        파일 형식으로 변환
+
+        Returns:
+            bytes: 헤더와 부호화된 입력
+        """
+        header = _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, len(self.frames))
+        return header + encode_runs(self.frames)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        파일 형식에서 복원
+
+        Args:
+            data (bytes): 파일 내용
+
+        Returns:
+            Replay: 입력 기록
+
+        Raises:
+            ValueError: 형식이나 버전이 맞지 않는 경우
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Replay file is too short")
+        magic, version, seed, frame_count = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        return cls(seed, decode_runs(data[_HEADER.size:], frame_count))
+
+    def save(self, path):
+        """
+        파일로 저장
+
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        파일에서 불러오기
+
+        Args:
+            path (str): 입력 기록 파일 경로
+
+        Returns:
+            Replay: 입력 기록
+        """
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """다른 입력 소스를 감싸 프레임별 입력을 기록하는 입력 소스"""
+
+    def __init__(self, source, seed):
+        """
+        입력 기록기 초기화
+
+        Args:
+            source: read(sim)으로 (왼쪽, 오른쪽) 입력을 돌려주는 입력 소스
+            seed (int): 게임 로직 난수 시드
+        """
+        self.source = source
+        self.replay = Replay(seed)
+        self._flags = 0  # 현재 프레임의 입력
+
+    def read(self, sim):
+        """
+        이번 틱의 입력 읽기 (감싼 입력 소스의 값을 기록)
+
+        Args:
+            sim (Simulation): 현재 시뮬레이션 상태
+
+        Returns:
+            tuple: (왼쪽 키 눌림, 오른쪽 키 눌림)
+        """
+        left, right = self.source.read(sim)
+        if left:
+            self._flags |= FLAG_LEFT
+        if right:
+            self._flags |= FLAG_RIGHT
+        return left, right
+
+    def mark_start(self):
+        """이번 프레임에 시작/재시작 요청 기록"""
+        self._flags |= FLAG_START
+
+    def end_frame(self):
+        """현재 프레임의 입력을 기록에 추가"""
+        self.replay.frames.append(self._flags)
+        self._flags = 0
+
+
+class ReplayInput:
+    """입력 기록을 프레임 순서대로 돌려주는 입력 소스"""
+
+    def __init__(self, replay):
+        """
+        입력 재생기 초기화
+
+        Args:
+            replay (Replay): 재생할 입력 기록
+        """
+        self.replay = replay
+        self.frame = 0
+
+    def finished(self):
+        """
+        재생이 끝났는지 확인
+
+        Returns:
+            bool: 모든 프레임을 재생했으면 True
+        """
+        return self.frame >= len(self.replay.frames)
+
+    def start_requested(self):
+        """
+        현재 프레임에 시작/재시작 요청이 있는지 확인
+
+        Returns:
+            bool: 요청이 있으면 True
+        """
+        return bool(self.replay.frames[self.frame] & FLAG_START)
+
+    def read(self, sim):
+        """
+        이번 틱의 입력 읽기
+
+        Args:
+            sim (Simulation): 시뮬레이션 (사용하지 않음)
+
+        Returns:
+            tuple: (왼쪽 키 눌림, 오른쪽 키 눌림)
+        """
+        flags = self.replay.frames[self.frame]
+        return bool(flags & FLAG_LEFT), bool(flags & FLAG_RIGHT)
+
+    def end_frame(self):
+        """다음 프레임으로 이동"""
+        self.frame += 1
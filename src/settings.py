@@ -0,0 +1,44 @@
+"""
+게임 설정 상수 모듈
+"""
+
+# 게임 설정
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+FPS = 60
+
+# 색상 정의
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+
+# 게임 상태
+MENU = 0
+PLAYING = 1
+GAME_OVER = 2
+LOADING = 3
+
+# 게임 난이도 설정
+INITIAL_POOP_SPEED = 3
+POOP_ACCELERATION = 0.1
+POOP_SPAWN_RATE = 1.0  # 초당 생성 개수
+PLAYER_SPEED = 5
+PLAYER_LIVES = 3
+
+# 플레이어 충돌 효과 (초)
+HIT_DURATION = 1.0  # 충돌 효과 지속 시간
+HIT_FLASH_INTERVAL = 0.1  # 깜빡임 간격
+
+# 똥 크기 종류
+POOP_SIZES = ("small", "medium", "large")
+POOP_ASSET_NAMES = {size: f"poop_{size}" for size in POOP_SIZES}
+
+# 플레이어 이동 방향별 스프라이트 (-1: 왼쪽, 0: 정지, 1: 오른쪽)
+PLAYER_DIRECTION_SPRITES = {-1: "player_left", 0: "player_normal", 1: "player_right"}
+
+# 스프라이트 크기 (게임 로직에서 사용하는 충돌 영역 크기)
+PLAYER_SIZE = (50, 50)
+POOP_SPRITE_SIZES = {"small": (30, 30), "medium": (40, 40), "large": (50, 50)}
+
+# 똥 크기별 충돌 파티클 수
+POOP_PARTICLE_COUNTS = {"small": 10, "medium": 15, "large": 20}
@@ -0,0 +1,538 @@
+"""
+렌더링 없이 실행할 수 있는 고정 시간 간격 게임 로직 모듈
+
+플레이어 이동, 똥 생성/낙하, 충돌, 점수, 난이도 증가를 담당합니다.
+시계, 난수 생성기, 입력을 주입할 수 있어 같은 시드와 입력이면 항상 같은 결과가 나옵니다.
+"""
+import argparse
+import os
+import random
+import time
+from collections import namedtuple
+
+import pygame
+
+from collision import CollisionWorld
+from profiling import NullProfiler
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
+    INITIAL_POOP_SPEED, POOP_ACCELERATION, POOP_SPAWN_RATE,
+    PLAYER_SPEED, PLAYER_LIVES, HIT_DURATION, HIT_FLASH_INTERVAL,
+    POOP_SIZES, PLAYER_SIZE, POOP_SPRITE_SIZES,
+)
+
+# 충돌 이벤트 (충돌 위치, 똥 크기, 새로 맞은 것인지 여부)
+CollisionEvent = namedtuple("CollisionEvent", ["x", "y", "size", "new_hit"])
+
+
+class SimClock:
+    """한 틱마다 고정된 시간만큼 진행하는 시뮬레이션 시계"""
+
+    def __init__(self, dt=1.0 / FPS):
+        """
+        시뮬레이션 시계 초기화
+
+        Args:
+            dt (float): 한 틱의 길이 (초)
+        """
+        self.dt = dt
+        self.ticks = 0
+
+    def now(self):
+        """
+        현재 시뮬레이션 시각
+
+        Returns:
+            float: 시작 후 경과 시간 (초)
+        """
+        return self.ticks * self.dt
+
+    def advance(self):
+        """한 틱 진행"""
+        self.ticks += 1
+
+
+class KeyboardInput:
+    """키보드 방향키 상태를 읽는 입력 소스"""
+
+    def read(self, sim):
+        """
+        이번 틱의 입력 읽기
+
+        Args:
+            sim (Simulation): 시뮬레이션 (사용하지 않음)
+
+        Returns:
+            tuple: (왼쪽 키 눌림, 오른쪽 키 눌림)
+        """
+        keys = pygame.key.get_pressed()
+        return bool(keys[pygame.K_LEFT]), bool(keys[pygame.K_RIGHT])
+
+
+class IdleInput:
+    """아무 키도 누르지 않는 입력 소스"""
+
+    def read(self, sim):
+        """이번 틱의 입력 읽기 (항상 정지)"""
+        return False, False
+
+
+class DodgeBotInput:
+    """가장 가까이 떨어지는 똥을 피하는 간단한 봇 입력 소스 (밸런싱용)"""
+
+    def __init__(self, look_ahead=250):
+        """
+        봇 입력 초기화
+
+        Args:
+            look_ahead (int): 플레이어 위쪽으로 살펴볼 거리 (픽셀)
+        """
+        self.look_ahead = look_ahead
+
+    def read(self, sim):
+        """
+        이번 틱의 입력 읽기
+
+        Args:
+            sim (Simulation): 현재 시뮬레이션 상태
+
+        Returns:
+            tuple: (왼쪽 키 눌림, 오른쪽 키 눌림)
+        """
+        player = sim.player.rect
+        danger_zone = pygame.Rect(player.left - 10, player.top - self.look_ahead,
+                                  player.width + 20, self.look_ahead)
+        threats = [poop.rect for poop in sim.poops if danger_zone.colliderect(poop.rect)]
+        if not threats:
+            return False, False
+
+        nearest = max(threats, key=lambda rect: rect.bottom)
+        if nearest.centerx >= player.centerx:
+            # 오른쪽에서 오면 왼쪽으로, 왼쪽 벽에 막히면 오른쪽으로
+            return (True, False) if player.left > 0 else (False, True)
+        return (False, True) if player.right < SCREEN_WIDTH else (True, False)
+
+
+class PlayerState:
+    """렌더링과 무관한 플레이어 상태 (위치, 생명, 충돌 효과 타이머)"""
+
+    __slots__ = ("rect", "speed", "lives", "direction", "is_hit", "hit_time",
+                 "hit_duration", "hit_flash_interval", "last_flash_time",
+                 "is_visible", "shake_offset", "shake_direction")
+
+    def __init__(self, size=PLAYER_SIZE):
+        """
+        플레이어 상태 초기화
+
+        Args:
+            size (tuple): 플레이어 충돌 영역 크기 (너비, 높이)
+        """
+        self.rect = pygame.Rect((0, 0), size)
+
+        # 화면 하단 중앙에 위치하도록 설정
+        self.rect.centerx = SCREEN_WIDTH // 2
+        self.rect.bottom = SCREEN_HEIGHT - 20  # 바닥에서 약간 띄움
+
+        self.speed = PLAYER_SPEED
+        self.lives = PLAYER_LIVES
+        self.direction = 0  # -1: 왼쪽, 0: 정지, 1: 오른쪽
+
+        # 충돌 효과 관련 변수
+        self.is_hit = False
+        self.hit_time = 0
+        self.hit_duration = HIT_DURATION
+        self.hit_flash_interval = HIT_FLASH_INTERVAL
+        self.last_flash_time = 0
+        self.is_visible = True
+        self.shake_offset = 0
+        self.shake_direction = 1
+
+    def update(self, now, left, right):
+        """
+        플레이어 상태 업데이트
+
+        Args:
+            now (float): 현재 시뮬레이션 시각 (초)
+            left (bool): 왼쪽 키 눌림
+            right (bool): 오른쪽 키 눌림
+        """
+        # 충돌 효과 처리
+        if self.is_hit:
+            # 깜빡임 효과 - 완전히 사라지지 않고 투명도만 변경
+            if now - self.last_flash_time > self.hit_flash_interval:
+                self.is_visible = not self.is_visible
+                self.last_flash_time = now
+
+            # 흔들림 효과
+            self.shake_offset = self.shake_direction * 2
+            self.shake_direction *= -1
+
+            # 충돌 효과 종료 체크
+            if now - self.hit_time > self.hit_duration:
+                self.is_hit = False
+                self.is_visible = True
+                self.shake_offset = 0
+
+        self.direction = 0
+        if left:
+            self.rect.x -= self.speed
+            self.direction = -1
+        if right:
+            self.rect.x += self.speed
+            self.direction = 1
+
+        # 화면 경계 처리
+        if self.rect.left < 0:
+            self.rect.left = 0
+        if self.rect.right > SCREEN_WIDTH:
+            self.rect.right = SCREEN_WIDTH
+
+    def hit(self, now):
+        """
+        똥에 맞았을 때 충돌 효과 시작
+
+        Args:
+            now (float): 현재 시뮬레이션 시각 (초)
+
+        Returns:
+            bool: 새로 충돌 효과가 시작되었으면 True (이미 맞은 상태면 False)
+        """
+        if self.is_hit:
+            return False
+
+        self.is_hit = True
+        self.hit_time = now
+        self.last_flash_time = now
+        self.is_visible = True  # 완전히 사라지지 않도록 수정
+        return True
+
+
+class Poop:
+    """똥 클래스"""
+
+    __slots__ = ("rect", "speed", "size")
+
+    def __init__(self, size, sprite_size, x, speed):
+        """
+        똥 초기화
+
+        Args:
+            size (str): 똥 크기 종류 ("small", "medium", "large")
+            sprite_size (tuple): 충돌 영역 크기 (너비, 높이)
+            x (int): 시작 x 좌표
+            speed (float): 떨어지는 속도
+        """
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(size, sprite_size, x, speed)
+
+    def reset(self, size, sprite_size, x, speed):
+        """
+        똥 상태 초기화 (풀에서 재사용할 때도 호출)
+
+        Args:
+            size (str): 똥 크기 종류
+            sprite_size (tuple): 충돌 영역 크기 (너비, 높이)
+            x (int): 시작 x 좌표
+            speed (float): 떨어지는 속도
+        """
+        self.rect.size = sprite_size
+        self.rect.x = x
+        self.rect.y = -self.rect.height
+        self.speed = speed
+        self.size = size  # 크기 정보 저장
+
+    def update(self):
+        """똥 상태 업데이트"""
+        self.rect.y += self.speed
+
+    def is_offscreen(self):
+        """
+        화면 밖으로 나갔는지 확인
+
+        Returns:
+            bool: 화면 밖이면 True
+        """
+        return self.rect.top > SCREEN_HEIGHT
+
+
+class PoopPool:
+    """똥 객체를 재사용하는 오브젝트 풀 클래스"""
+
+    def __init__(self):
+        """똥 풀 초기화"""
+        self._free = []
+
+        # 통계
+        self.acquired = 0  # 꺼낸 횟수
+        self.reused = 0  # 새로 만들지 않고 재사용한 횟수
+        self.live = 0  # 현재 사용 중인 개수
+        self.peak_live = 0  # 동시에 사용된 최대 개수
+
+    def acquire(self, size, sprite_size, x, speed):
+        """
+        풀에서 똥 꺼내기 (비어 있으면 새로 생성)
+
+        Args:
+            size (str): 똥 크기 종류
+            sprite_size (tuple): 충돌 영역 크기 (너비, 높이)
+            x (int): 시작 x 좌표
+            speed (float): 떨어지는 속도
+
+        Returns:
+            Poop: 초기화된 똥 객체
+        """
+        if self._free:
+            poop = self._free.pop()
+            poop.reset(size, sprite_size, x, speed)
+            self.reused += 1
+        else:
+            poop = Poop(size, sprite_size, x, speed)
+
+        self.acquired += 1
+        self.live += 1
+        if self.live > self.peak_live:
+            self.peak_live = self.live
+        return poop
+
+    def release(self, poop):
+        """
+        사용이 끝난 똥을 풀에 반환
+
+        Args:
+            poop (Poop): 반환할 똥 객체
+        """
+        self._free.append(poop)
+        self.live -= 1
+
+    def release_all(self, poops):
+        """
+        여러 똥을 한 번에 풀에 반환
+
+        Args:
+            poops (list): 반환할 똥 객체 목록
+        """
+        self._free.extend(poops)
+        self.live -= len(poops)
+
+    def hit_rate(self):
+        """
+        풀 적중률
+
+        Returns:
+            float: 재사용 비율 (0~1)
+        """
+        return self.reused / self.acquired if self.acquired else 0.0
+
+
+class Simulation:
+    """고정 시간 간격으로 진행하는 게임 로직 클래스"""
+
+    def __init__(self, seed=None, clock=None, input_source=None, rng=None,
+                 poop_sizes=POOP_SPRITE_SIZES, player_size=PLAYER_SIZE, profiler=None, masks=None):
+        """
+        시뮬레이션 초기화
+
+        Args:
+            seed (int, optional): 난수 시드 (rng를 주지 않았을 때 사용)
+            clock (SimClock, optional): 시뮬레이션 시계
+            input_source (optional): read(sim)으로 (왼쪽, 오른쪽) 입력을 돌려주는 객체
+            rng (random.Random, optional): 난수 생성기
+            poop_sizes (dict): 똥 크기 종류별 충돌 영역 크기
+            player_size (tuple): 플레이어 충돌 영역 크기
+            profiler (FrameProfiler, optional): 단계별 시간을 기록할 프로파일러
+            masks (SpriteMasks, optional): 픽셀 단위 충돌 검사에 사용할 마스크 (없으면 사각형만 검사)
+        """
+        self.clock = clock or SimClock()
+        self.input_source = input_source or IdleInput()
+        self.rng = rng or random.Random(seed)
+        self.seed = seed
+        self.poop_sizes = poop_sizes
+        self.player_size = player_size
+        self.spawn_interval = 1.0 / POOP_SPAWN_RATE
+        self.profiler = profiler or NullProfiler()
+        self.masks = masks
+        self.invincible = False  # True면 맞아도 생명이 줄지 않음 (게임 오버 없이 측정할 때 사용)
+
+        self.poop_pool = PoopPool()
+        self.collision_world = CollisionWorld()
+        self.poops = []
+        self.reset()
+
+    def reset(self, seed=None):
+        """
+        새 게임 시작
+
+        Args:
+            seed (int, optional): 새 난수 시드 (없으면 현재 난수 상태 유지)
+        """
+        if seed is not None:
+            self.seed = seed
+            self.rng.seed(seed)
+
+        self.player = PlayerState(self.player_size)
+        self.poop_pool.release_all(self.poops)
+        self.poops = []
+        self.score = 0
+        self.poop_speed = INITIAL_POOP_SPEED
+        self.last_spawn_time = self.clock.now()
+        self.game_over = False
+        self.ticks = 0
+
+    def spawn_poop(self):
+        """화면 위쪽 임의의 위치에 똥 생성"""
+        # 랜덤하게 크기 선택
+        size = self.rng.choice(POOP_SIZES)
+        sprite_size = self.poop_sizes[size]
+        x = self.rng.randint(0, SCREEN_WIDTH - sprite_size[0])
+        self.poops.append(self.poop_pool.acquire(size, sprite_size, x, self.poop_speed))
+
+    def _resolve_collisions(self, now):
+        """
+        충돌 검사 후 화면 밖으로 나간 똥과 맞은 똥 제거
+
+        Args:
+            now (float): 현재 시뮬레이션 시각 (초)
+
+        Returns:
+            list: 이번 틱에 발생한 CollisionEvent 목록
+        """
+        # 충돌 체크 (모든 똥을 한 번에 검사)
+        player_rect = self.player.rect
+        hits = self.collision_world.find_collisions(
+            [player_rect], [poop.rect for poop in self.poops]
+        )[0]
+
+        # 사각형이 겹친 똥만 마스크로 다시 검사 (투명한 모서리는 맞지 않음)
+        if hits and self.masks is not None:
+            world = self.collision_world
+            player_mask = self.masks.player(self.player.direction)
+            hits = [index for index in hits
+                    if world.masks_overlap(player_rect, player_mask, self.poops[index].rect,
+                                           self.masks.obstacle(self.poops[index].size))]
+        hit_indices = set(hits)
+
+        # 남은 똥만 새 리스트에 모으고 제거된 똥은 풀에 반환
+        events = []
+        remaining = []
+        for index, poop in enumerate(self.poops):
+            # 화면 밖으로 나간 똥 제거 및 점수 증가
+            if poop.is_offscreen():
+                self.poop_pool.release(poop)
+                self.score += 1
+                continue
+
+            if index in hit_indices:
+                # 충돌 위치 계산 후 생명력 감소
+                collision_x = (player_rect.centerx + poop.rect.centerx) // 2
+                collision_y = (player_rect.top + poop.rect.bottom) // 2
+                new_hit = self.player.hit(now)
+                events.append(CollisionEvent(collision_x, collision_y, poop.size, new_hit))
+
+                self.poop_pool.release(poop)
+                if not self.invincible:
+                    self.player.lives -= 1
+                    if self.player.lives <= 0:
+                        self.game_over = True
+                continue
+
+            remaining.append(poop)
+        self.poops = remaining
+        return events
+
+    def step(self):
+        """
+        한 틱 진행
+
+        Returns:
+            list: 이번 틱에 발생한 CollisionEvent 목록
+        """
+        if self.game_over:
+            return []
+
+        profiler = self.profiler
+        now = self.clock.now()
+        with profiler.section("update.player"):
+            left, right = self.input_source.read(self)
+            self.player.update(now, left, right)
+
+        # 똥 생성 및 이동
+        with profiler.section("update.spawn"):
+            if now - self.last_spawn_time > self.spawn_interval:
+                self.spawn_poop()
+                self.last_spawn_time = now
+
+            for poop in self.poops:
+                poop.update()
+
+        with profiler.section("update.collision"):
+            events = self._resolve_collisions(now)
+
+        # 난이도 증가
+        self.poop_speed += POOP_ACCELERATION / FPS
+
+        self.clock.advance()
+        self.ticks += 1
+        return events
+
+
+def run_headless(ticks, seed=0, policy="bot", masks=None, pixel_collision=True, input_source=None):
+    """
+    렌더링 없이 주어진 틱 수만큼 게임을 반복 실행
+
+    게임 오버가 되면 바로 새 게임을 시작합니다. 게임 화면과 같은 결과가 나오도록
+    기본적으로 같은 스프라이트의 마스크로 픽셀 단위 충돌을 검사합니다.
+
+    Args:
+        ticks (int): 실행할 총 틱 수
+        seed (int): 난수 시드
+        policy (str): 입력 정책 ("bot" 또는 "idle")
+        masks (SpriteMasks, optional): 충돌 마스크 (없으면 SVG 애셋으로 만듦)
+        pixel_collision (bool): False면 마스크 없이 사각형만 검사
+        input_source (optional): read(sim)으로 (왼쪽, 오른쪽) 입력을 돌려주는 객체 (주면 policy 대신 사용)
+
+    Returns:
+        dict: 게임 수, 점수 통계, 처리 속도
+    """
+    if input_source is None:
+        input_source = DodgeBotInput() if policy == "bot" else IdleInput()
+    if pixel_collision and masks is None:
+        from svg_utils import load_sprite_masks  # 사각형만 검사할 때는 SVG 애셋 모듈이 필요 없음
+        masks = load_sprite_masks()
+    sim = Simulation(seed=seed, input_source=input_source, masks=masks if pixel_collision else None)
+
+    scores = []
+    start = time.perf_counter()
+    for _ in range(ticks):
+        sim.step()
+        if sim.game_over:
+            scores.append(sim.score)
+            sim.reset()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": ticks,
+        "simulated_seconds": ticks / FPS,
+        "games": len(scores),
+        "mean_score": sum(scores) / len(scores) if scores else 0.0,
+        "max_score": max(scores) if scores else 0,
+        "unfinished_score": sim.score,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    parser = argparse.ArgumentParser(description="똥피하기 게임 로직을 렌더링 없이 빠르게 실행")
+    parser.add_argument("--ticks", type=int, default=FPS * 60 * 60,
+                        help="실행할 틱 수 (기본값: 게임 시간 1시간)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--policy", choices=["bot", "idle"], default="bot",
+                        help="입력 정책")
+    parser.add_argument("--rect-collision", action="store_true",
+                        help="픽셀 마스크 없이 사각형만으로 충돌 검사 (게임 화면과 점수가 다를 수 있음)")
+    args = parser.parse_args()
+
+    stats = run_headless(args.ticks, args.seed, args.policy, pixel_collision=not args.rect_collision)
+    for key, value in stats.items():
+        print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,121 @@
+"""
+스프라이트 효과 버전(충돌 틴트, 반투명)을 미리 만들어 두는 모듈
+
+충돌 효과와 깜빡임을 그릴 때 매번 표면을 복사하지 않고 미리 만든 표면을 그대로 그립니다.
+"""
+import pygame
+
+HIT_TINT = (139, 69, 19, 100)  # 반투명 똥색 (RGBA 곱하기)
+FADED_ALPHA = 128  # 깜빡임 효과 투명도
+
+
+def tinted(surface, color=HIT_TINT):
+    """
+    색상을 곱한 복사본 만들기
+
+    Args:
+        surface (pygame.Surface): 원본 이미지
+        color (tuple): 곱할 색상 (R, G, B, A)
+
+    Returns:
+        pygame.Surface: 틴트가 적용된 새 표면
+    """
+    result = surface.copy()
+    result.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+    return result
+
+
+def faded(surface, alpha=FADED_ALPHA):
+    """
+    픽셀 알파에 투명도를 곱한 복사본 만들기
+
+    Args:
+        surface (pygame.Surface): 원본 이미지
+        alpha (int): 곱할 투명도 (0~255)
+
+    Returns:
+        pygame.Surface: 반투명한 새 표면
+    """
+    result = surface.copy()
+    result.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return result
+
+
+class SpriteVariantCache:
+    """스프라이트별 기본/충돌/반투명 버전을 보관하는 클래스"""
+
+    def __init__(self, asset_manager, names, tint_color=HIT_TINT, faded_alpha=FADED_ALPHA):
+        """
+        스프라이트 버전 캐시 초기화
+
+        Args:
+            asset_manager (SVGAssetManager): SVG 애셋 관리자
+            names (list): 효과 버전을 만들 애셋 이름
+            tint_color (tuple): 충돌 효과 색상 (R, G, B, A)
+            faded_alpha (int): 깜빡임 효과 투명도
+        """
+        self.asset_manager = asset_manager
+        self.names = list(names)
+        self.tint_color = tint_color
+        self.faded_alpha = faded_alpha
+        self._variants = {}  # (이름, 충돌 여부, 반투명 여부) -> 표면
+
+    def build(self, names=None):
+        """
+        아직 만들지 않은 스프라이트의 효과 버전 만들기
+
+        Args:
+            names (list, optional): 만들 애셋 이름 (기본값: 전체)
+        """
+        for name in names or self.names:
+            if (name, False, False) in self._variants:
+                continue
+
+            base = self.asset_manager.get_asset(name)
+            hit = tinted(base, self.tint_color)
+            variants = {
+                (name, False, False): base.copy(),
+                (name, False, True): faded(base, self.faded_alpha),
+                (name, True, False): hit,
+                (name, True, True): faded(hit, self.faded_alpha),
+            }
+
+            # 화면 형식으로 변환해 그리기 속도 향상
+            if pygame.display.get_surface() is not None:
+                variants = {key: surface.convert_alpha() for key, surface in variants.items()}
+            self._variants.update(variants)
+
+    def get(self, name, hit=False, faded=False):
+        """
+        스프라이트 효과 버전 가져오기
+
+        반환된 표면은 캐시와 공유되므로 수정하지 말아야 합니다.
+
+        Args:
+            name (str): 애셋 이름
+            hit (bool): 충돌 틴트 버전 여부
+            faded (bool): 반투명 버전 여부
+
+        Returns:
+            pygame.Surface: 스프라이트 표면
+        """
+        key = (name, hit, faded)
+        surface = self._variants.get(key)
+        if surface is None:
+            self.build([name])
+            surface = self._variants[key]
+        return surface
+
+    def invalidate(self, names=None):
+        """
+        효과 버전 삭제 (원본 애셋이 바뀌었을 때 호출)
+
+        Args:
+            names (list, optional): 삭제할 애셋 이름 (기본값: 전체)
+        """
+        if names is None:
+            self._variants.clear()
+            return
+        names = set(names)
+        self._variants = {key: surface for key, surface in self._variants.items()
+                          if key[0] not in names}
@@ -0,0 +1,72 @@
+"""
+정적인 화면 요소를 미리 합성해 두는 모듈
+
+배경, HUD 글자, 생명 아이콘처럼 특정 사건(생명 변화, 상태 전환, 창 크기 변경)이
+있을 때만 바뀌는 요소를 화면 형식 표면으로 합성해 두고 매 프레임 그대로 그립니다.
+각 레이어는 내용을 결정하는 값들의 키와 함께 저장되며, 키가 바뀌었을 때만 다시 합성합니다.
+"""
+import pygame
+
+
+def to_display_format(surface, alpha=False):
+    """
+    화면 형식으로 변환 (화면이 없으면 그대로 반환)
+
+    Args:
+        surface (pygame.Surface): 변환할 표면
+        alpha (bool): 픽셀 알파 유지 여부
+
+    Returns:
+        pygame.Surface: 변환한 표면
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+class StaticLayerCache:
+    """이름별로 합성한 정적 레이어(표면 또는 (표면, 위치) 목록)를 키와 함께 보관하는 클래스"""
+
+    def __init__(self):
+        """정적 레이어 캐시 초기화"""
+        self._layers = {}  # 이름 -> (키, 합성 결과)
+
+        # 통계
+        self.hits = 0
+        self.builds = 0  # 다시 합성한 횟수
+
+    def get(self, name, key, compose):
+        """
+        레이어 가져오기 (키가 바뀌었으면 다시 합성)
+
+        반환된 표면은 캐시와 공유되므로 수정하지 말아야 합니다.
+
+        Args:
+            name: 레이어 이름
+            key (tuple): 레이어 내용을 결정하는 값 (애셋 표면, 글꼴, 생명 수 등)
+            compose (callable): 화면 형식으로 변환한 합성 결과를 만들어 돌려주는 함수
+
+        Returns:
+            합성 결과 (compose가 돌려준 값)
+        """
+        entry = self._layers.get(name)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+
+        layer = compose()
+        self._layers[name] = (key, layer)
+        self.builds += 1
+        return layer
+
+    def invalidate(self, name=None):
+        """
+        레이어 삭제 (다음 get에서 다시 합성)
+
+        Args:
+            name (optional): 삭제할 레이어 이름 (기본값: 전체)
+        """
+        if name is None:
+            self._layers.clear()
+        else:
+            self._layers.pop(name, None)
@@ -2,16 +2,79 @@
 SVG 파일을 Pygame에서 사용하기 위한 유틸리티 모듈
 """
 import pygame
-import io
 import os
-from cairosvg import svg2png
+import multiprocessing
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from atlas import TextureAtlas, DEFAULT_ATLAS_WIDTH
+from collision import SpriteMasks
+from raster_cache import RasterCache, DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_BYTES, content_key
+from rasterizers import get_rasterizer, rasterize_svg
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_DIRECTION_SPRITES, POOP_ASSET_NAMES
+
+# 래스터화 프로세스 풀 시작 방식 (SDL과 오디오 스레드가 돌고 있는 프로세스를 fork하지 않도록)
+POOL_START_METHOD = "spawn"
+
+# 애셋 매니페스트 항목 (이름, SVG 경로, 크기, 로드 실패 시 사용할 대체 SVG 경로,
+# 대체 경로로 함께 바꿀 애셋 묶음 이름)
+AssetSpec = namedtuple("AssetSpec", ["name", "path", "size", "fallback_path", "fallback_group"],
+                       defaults=(None, None))
+
+def create_rasterizer_pool(max_workers):
+    """
+    SVG 래스터화 작업자 프로세스 풀 생성
+    
+    기본 fork 방식은 스레드(오디오 미리 로드, 애셋 로더)가 돌고 있는 프로세스를 복제하므로
+    교착 상태가 생길 수 있어 새 인터프리터로 작업자를 시작합니다.
+    
+    Args:
+        max_workers (int): 작업자 프로세스 수
+        
+    Returns:
+        ProcessPoolExecutor: 프로세스 풀
+    """
+    return ProcessPoolExecutor(max_workers=max_workers,
+                               mp_context=multiprocessing.get_context(POOL_START_METHOD))
 
 class SVGAssetManager:
     """SVG 애셋을 관리하는 클래스"""
     
-    def __init__(self):
-        """SVG 애셋 관리자 초기화"""
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, cache_max_bytes=DEFAULT_CACHE_MAX_BYTES,
+                 use_disk_cache=True, manifest=None, prefetch_hints=None, rasterizer=None):
+        """
+        SVG 애셋 관리자 초기화
+        
+        Args:
+            cache_dir (str): 래스터 캐시 디렉토리
+            cache_max_bytes (int): 래스터 캐시 용량 제한 (바이트)
+            use_disk_cache (bool): 디스크 캐시 사용 여부
+            manifest (list, optional): 필요할 때 로드할 AssetSpec 목록
+            prefetch_hints (dict, optional): 게임 상태별로 미리 로드할 애셋 이름 목록
+            rasterizer (str, optional): SVG 래스터화 백엔드 이름 (기본값: POOP_DODGE_RASTERIZER 또는 cairosvg)
+        """
         self.assets = {}
+        self.cache_dir = cache_dir
+        self.raster_cache = RasterCache(cache_dir, cache_max_bytes) if use_disk_cache else None
+        self.rasterizer = get_rasterizer(rasterizer)  # 캐시 키에는 백엔드 이름과 버전이 들어감
+        self._sources = {}  # 애셋 이름별 실제로 로드한 (SVG 경로, 너비, 높이)
+        self._masks = {}  # 애셋 이름 -> (마스크를 만든 표면, 충돌 마스크)
+        self.atlas = None
+        
+        # 배율별 래스터화 (창 크기에 맞춰 매니페스트 크기에 곱함)
+        self.scale = 1.0
+        self._scale_buckets = {}  # 배율 -> 그 배율의 (애셋, 원본 정보, 로드 시도 목록, 아틀라스)
+        self._stand_ins = {}  # 새 배율로 래스터화하는 동안 대신 쓸 이전 배율 표면의 확대/축소본
+        
+        # 매니페스트 기반 지연 로딩
+        self.manifest = {}
+        self.prefetch_hints = prefetch_hints or {}
+        self._resolved = set()  # 로드를 시도한 매니페스트 항목
+        self._prefetch_queue = deque()
+        self._fallback_groups = set()  # 대체 경로로 바꾼 애셋 묶음 (한글 버튼 하나가 실패하면 모두 영어로)
+        if manifest:
+            self.register_assets(manifest)
         
     def load_svg(self, name, filepath, width=None, height=None):
         """
@@ -31,16 +94,12 @@ class SVGAssetManager:
                 print(f"Error: SVG file not found at {filepath}")
                 return False
                 
-            # SVG를 PNG로 변환
-            if width and height:
-                png_data = svg2png(url=filepath, write_to=None, 
-                                  output_width=width, output_height=height)
-            else:
-                png_data = svg2png(url=filepath, write_to=None)
-                
-            # PNG 데이터를 Pygame 표면으로 변환
-            byte_io = io.BytesIO(png_data)
-            self.assets[name] = pygame.image.load(byte_io)
+            # 디스크 캐시에 있으면 래스터화하지 않고 바로 사용
+            loaded, cache_key = self._load_cached(name, filepath, width, height)
+            if not loaded:
+                raster = rasterize_svg(filepath, width, height, self.rasterizer.name)
+                self._store_raster(name, raster, cache_key)
+            self._sources[name] = (filepath, width, height)
             return True
             
         except Exception as e:
@@ -48,6 +107,259 @@ class SVGAssetManager:
             self._create_fallback_asset(name, width, height)
             return False
     
+    def load_svg_batch(self, requests, max_workers=None):
+        """
+        여러 SVG 파일을 프로세스 풀에서 병렬로 래스터화하여 로드
+        
+        래스터화만 작업자 프로세스에서 수행하고, 반환된 RGBA 데이터는
+        메인 스레드에서 Pygame 표면으로 변환합니다.
+        
+        Args:
+            requests (list): (애셋 이름, SVG 파일 경로, 너비, 높이) 튜플 목록
+            max_workers (int, optional): 최대 작업자 프로세스 수 (기본값: CPU 코어 수)
+            
+        Returns:
+            dict: 애셋 이름별 로드 성공 여부
+        """
+        results = {}
+        pending = []
+        
+        for name, filepath, width, height in requests:
+            if not os.path.exists(filepath):
+                print(f"Error: SVG file not found at {filepath}")
+                results[name] = False
+                continue
+                
+            try:
+                loaded, cache_key = self._load_cached(name, filepath, width, height)
+            except Exception as e:
+                print(f"Error loading SVG {filepath}: {e}")
+                self._create_fallback_asset(name, width, height)
+                results[name] = False
+                continue
+                
+            if loaded:
+                self._sources[name] = (filepath, width, height)
+                results[name] = True
+            else:
+                pending.append((name, filepath, width, height, cache_key))
+        
+        if not pending:
+            return results
+            
+        workers = min(len(pending), max_workers or os.cpu_count() or 1)
+        futures = None
+        pool = None
+        if workers > 1:
+            try:
+                pool = create_rasterizer_pool(workers)
+                futures = [pool.submit(rasterize_svg, filepath, width, height, self.rasterizer.name)
+                           for _, filepath, width, height, _ in pending]
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                # 프로세스 풀을 사용할 수 없는 환경이면 순차적으로 처리
+                print(f"Warning: Could not start rasterizer pool ({e}). Loading assets sequentially.")
+                futures = None
+        
+        try:
+            for index, (name, filepath, width, height, cache_key) in enumerate(pending):
+                try:
+                    if futures is None:
+                        raster = rasterize_svg(filepath, width, height, self.rasterizer.name)
+                    else:
+                        try:
+                            raster = futures[index].result()
+                        except BrokenProcessPool:
+                            # 작업자가 비정상 종료되면 남은 애셋은 직접 변환
+                            raster = rasterize_svg(filepath, width, height, self.rasterizer.name)
+                    self._store_raster(name, raster, cache_key)
+                    self._sources[name] = (filepath, width, height)
+                    results[name] = True
+                except Exception as e:
+                    print(f"Error loading SVG {filepath}: {e}")
+                    self._create_fallback_asset(name, width, height)
+                    results[name] = False
+        finally:
+            if pool is not None:
+                pool.shutdown()
+                
+        return results
+    
+    def _load_cached(self, name, filepath, width, height):
+        """
+        디스크 캐시에서 애셋 로드 시도
+        
+        Args:
+            name (str): 애셋 이름
+            filepath (str): SVG 파일 경로
+            width (int): 원하는 너비
+            height (int): 원하는 높이
+            
+        Returns:
+            tuple: (캐시 적중 여부, 캐시 키 또는 None)
+        """
+        if not self.raster_cache:
+            return False, None
+            
+        cache_key = self.raster_cache.make_key(filepath, width, height, self.rasterizer.version)
+        cached = self.raster_cache.get(cache_key) if cache_key else None
+        if cached:
+            size, pixels = cached
+            self.assets[name] = pygame.image.frombuffer(pixels, size, "RGBA")
+            return True, cache_key
+        return False, cache_key
+    
+    def _store_raster(self, name, raster, cache_key):
+        """
+        래스터화한 RGBA 데이터를 Pygame 표면으로 변환하여 저장
+        
+        Args:
+            name (str): 애셋 이름
+            raster (tuple): ((너비, 높이), RGBA 바이트)
+            cache_key (str): 디스크 캐시 키 (None이면 캐시에 저장하지 않음)
+        """
+        size, pixels = raster
+        self.assets[name] = pygame.image.frombuffer(pixels, size, "RGBA")
+        
+        # 다음 실행을 위해 RGBA 데이터를 캐시에 저장
+        if cache_key:
+            self.raster_cache.put(cache_key, size, pixels)
+    
+    def fetch_raster(self, filepath, width=None, height=None, raster=None, cached_only=False):
+        """
+        SVG 파일의 RGBA 래스터 데이터 가져오기 (디스크 캐시 사용)
+        
+        애셋 목록을 바꾸지 않으므로 백그라운드 로딩 스레드에서 호출할 수 있습니다.
+        
+        Args:
+            filepath (str): SVG 파일 경로
+            width (int, optional): 원하는 너비
+            height (int, optional): 원하는 높이
+            raster (tuple, optional): 이미 래스터화한 ((너비, 높이), RGBA 바이트) (없으면 직접 변환)
+            cached_only (bool): 캐시에 없으면 변환하지 않고 None 반환
+            
+        Returns:
+            tuple: ((너비, 높이), RGBA 바이트) 또는 cached_only일 때 캐시에 없으면 None
+        """
+        cache_key = None
+        if self.raster_cache:
+            cache_key = self.raster_cache.make_key(filepath, width, height, self.rasterizer.version)
+            cached = self.raster_cache.get(cache_key) if cache_key else None
+            if cached:
+                return cached
+        if cached_only:
+            return None
+            
+        if raster is None:
+            raster = rasterize_svg(filepath, width, height, self.rasterizer.name)
+        size, pixels = raster
+        if cache_key:
+            self.raster_cache.put(cache_key, size, pixels)
+        return size, pixels
+    
+    def install_raster(self, name, filepath, size, pixels):
+        """
+        다른 스레드에서 준비한 래스터 데이터를 애셋으로 등록 (메인 스레드에서 호출)
+        
+        Args:
+            name (str): 애셋 이름
+            filepath (str): 래스터화한 SVG 파일 경로
+            size (tuple): 이미지 크기 (너비, 높이)
+            pixels (bytes): RGBA 픽셀 데이터
+            
+        Returns:
+            bool: 등록했으면 True (이미 로드된 애셋이면 False)
+        """
+        if name in self.assets:
+            return False
+        spec = self.manifest.get(name)
+        width, height = self.target_size(spec) if spec else (None, None)
+        self.assets[name] = pygame.image.frombuffer(pixels, size, "RGBA")
+        self._sources[name] = (filepath, width, height)
+        self._resolved.add(name)
+        self._stand_ins.pop(name, None)
+        if spec is not None and spec.fallback_path:
+            if filepath == spec.fallback_path:
+                self._fall_back(spec)
+            elif spec.fallback_group in self._fallback_groups:
+                # 같은 묶음의 다른 애셋이 이미 대체 경로로 바뀌었으면 이 애셋도 맞춤
+                self.load_svg(name, spec.fallback_path, width, height)
+        return True
+    
+    def _fall_back(self, spec):
+        """
+        애셋이 대체 경로로 로드되었을 때 같은 묶음의 애셋도 대체 경로로 바꾸기
+        
+        한글 시작 버튼 옆에 영어 재시작 버튼이 나오지 않도록 묶음 단위로 바꿉니다.
+        
+        Args:
+            spec (AssetSpec): 대체 경로로 로드된 매니페스트 항목
+        """
+        group = spec.fallback_group
+        if group is None or group in self._fallback_groups:
+            return
+        self._fallback_groups.add(group)
+        members = [member for member in self.manifest.values()
+                   if member.fallback_group == group and member.name != spec.name]
+        for member in members:
+            if self.source_path(member.name) != member.path:
+                continue  # 아직 로드하지 않은 애셋은 로드할 때 대체 경로 사용
+            if self.atlas is not None and member.name in self.atlas:
+                self.atlas = None
+            print(f"Loading fallback asset for {member.name}")
+            self.load_svg(member.name, member.fallback_path, *self.target_size(member))
+    
+    def preferred_path(self, spec):
+        """애셋을 로드할 때 먼저 시도할 경로 (묶음이 대체 경로로 바뀌었으면 대체 경로)"""
+        if spec.fallback_path and spec.fallback_group in self._fallback_groups:
+            return spec.fallback_path
+        return spec.path
+    
+    def source_path(self, name):
+        """
+        현재 배율에서 애셋을 래스터화한 SVG 파일 경로
+        
+        Args:
+            name (str): 애셋 이름
+            
+        Returns:
+            str: SVG 파일 경로 또는 아직 로드하지 않았거나 대체 이미지면 None
+        """
+        source = self._sources.get(name)
+        return source[0] if source else None
+    
+    def reload_raster(self, name, filepath, size, pixels):
+        """
+        SVG 파일이 바뀌어 다시 래스터화한 애셋으로 교체 (핫 리로드, 메인 스레드에서 호출)
+        
+        다른 배율에 보관된 이전 버전은 버리고, 아틀라스에 들어 있던 애셋이면
+        아틀라스를 더 이상 사용하지 않습니다 (다른 스프라이트는 기존 서브서피스를 그대로 사용).
+        
+        Args:
+            name (str): 애셋 이름
+            filepath (str): 래스터화한 SVG 파일 경로
+            size (tuple): 이미지 크기 (너비, 높이)
+            pixels (bytes): RGBA 픽셀 데이터
+            
+        Returns:
+            bool: 교체했으면 True (현재 배율에서 로드되지 않은 애셋이면 False)
+        """
+        if name not in self.assets:
+            return False
+        if self.atlas is not None and name in self.atlas:
+            self.atlas = None
+        spec = self.manifest.get(name)
+        width, height = self.target_size(spec) if spec else (None, None)
+        self.assets[name] = pygame.image.frombuffer(pixels, size, "RGBA")
+        self._sources[name] = (filepath, width, height)
+        
+        for scale, (assets, sources, resolved, atlas) in list(self._scale_buckets.items()):
+            assets.pop(name, None)
+            sources.pop(name, None)
+            resolved.discard(name)
+            if atlas is not None and name in atlas:
+                self._scale_buckets[scale] = (assets, sources, resolved, None)
+        return True
+    
     def _create_fallback_asset(self, name, width, height):
         """
         SVG 로딩에 실패한 경우 대체 이미지 생성
@@ -57,6 +369,21 @@ class SVGAssetManager:
             width (int): 이미지 너비
             height (int): 이미지 높이
         """
+        self.assets[name] = self._draw_fallback_surface(name, width, height)
+        self._sources.pop(name, None)
+    
+    def _draw_fallback_surface(self, name, width, height):
+        """
+        대체 이미지 그리기
+        
+        Args:
+            name (str): 애셋 이름
+            width (int): 이미지 너비
+            height (int): 이미지 높이
+            
+        Returns:
+            pygame.Surface: 대체 이미지
+        """
         if width is None:
             width = 30
         if height is None:
@@ -75,62 +402,463 @@ class SVGAssetManager:
             # 기본 대체 이미지 (빨간색 X 표시)
             pygame.draw.line(surface, (255, 0, 0), (0, 0), (width, height), 2)
             pygame.draw.line(surface, (255, 0, 0), (0, height), (width, 0), 2)
-        
-        self.assets[name] = surface
+        return surface
     
     def get_asset(self, name):
         """
         저장된 애셋 가져오기
         
+        매니페스트에 등록되었지만 아직 로드되지 않은 애셋은 이때 래스터화합니다.
+        
         Args:
             name (str): 애셋 이름
             
         Returns:
             pygame.Surface: 애셋 표면 또는 None
         """
-        return self.assets.get(name)
-    
-    def load_player_assets(self, base_path="assets/svg/player", size=(50, 50)):
-        """플레이어 관련 SVG 애셋 로드"""
-        self.load_svg("player_normal", f"{base_path}/player_normal.svg", size[0], size[1])
-        self.load_svg("player_left", f"{base_path}/player_left.svg", size[0], size[1])
-        self.load_svg("player_right", f"{base_path}/player_right.svg", size[0], size[1])
-    
-    def load_obstacle_assets(self, base_path="assets/svg/obstacles"):
-        """장애물(똥) 관련 SVG 애셋 로드"""
-        self.load_svg("poop_small", f"{base_path}/poop_small.svg", 30, 30)
-        self.load_svg("poop_medium", f"{base_path}/poop_medium.svg", 40, 40)
-        self.load_svg("poop_large", f"{base_path}/poop_large.svg", 50, 50)
-    
-    def load_ui_assets(self, base_path="assets/svg/ui"):
-        """UI 관련 SVG 애셋 로드"""
-        # 한글 버튼 로드
-        korean_buttons_loaded = True
-        if not self.load_svg("start_button", f"{base_path}/start_button.svg", 200, 60):
-            korean_buttons_loaded = False
-        if not self.load_svg("restart_button", f"{base_path}/restart_button.svg", 200, 60):
-            korean_buttons_loaded = False
-            
-        # 한글 버튼 로드 실패 시 영어 버튼 로드
-        if not korean_buttons_loaded:
-            print("Loading English buttons instead")
-            self.load_svg("start_button", f"{base_path}/start_button_en.svg", 200, 60)
-            self.load_svg("restart_button", f"{base_path}/restart_button_en.svg", 200, 60)
-            
-        # 기타 UI 요소 로드
-        self.load_svg("pause_button", f"{base_path}/pause_button.svg", 40, 40)
-        self.load_svg("life_icon", f"{base_path}/life_icon.svg", 30, 30)
-        self.load_svg("score_icon", f"{base_path}/score_icon.svg", 30, 30)
-    
-    def load_background_assets(self, base_path="assets/svg/background", screen_size=(800, 600)):
-        """배경 관련 SVG 애셋 로드"""
-        self.load_svg("background", f"{base_path}/background_elements.svg", 
-                     screen_size[0], screen_size[1])
-        self.load_svg("background_pattern", f"{base_path}/background_pattern.svg", 100, 100)
-    
-    def load_all_assets(self, screen_size=(800, 600)):
-        """모든 SVG 애셋 로드"""
-        self.load_player_assets()
-        self.load_obstacle_assets()
-        self.load_ui_assets()
-        self.load_background_assets(screen_size=screen_size)
+        asset = self.assets.get(name)
+        if asset is None and name in self._stand_ins:
+            return self._stand_ins[name]
+        if asset is None and name in self.manifest and name not in self._resolved:
+            self.resolve(name)
+            asset = self.assets.get(name)
+        return asset
+    
+    def get_mask(self, name):
+        """
+        애셋의 충돌 마스크 가져오기 (불투명한 픽셀만 충돌)
+        
+        표면마다 한 번만 만들고 캐시하며, 애셋 표면이 바뀌면(확대/축소본이 실제 애셋으로 바뀔 때 포함) 다시 만듭니다.
+        마스크는 현재 배율과 관계없이 항상 배율 1 래스터에서 만듭니다.
+        
+        Args:
+            name (str): 애셋 이름
+            
+        Returns:
+            pygame.mask.Mask: 충돌 마스크 또는 애셋이 없으면 None
+        """
+        surface = self.get_asset(name)
+        if surface is None:
+            return None
+        cached = self._masks.get(name)
+        if cached is not None and cached[0] is surface:
+            return cached[1]
+        mask = pygame.mask.from_surface(self._logical_surface(name, surface))
+        self._masks[name] = (surface, mask)
+        return mask
+    
+    def _logical_surface(self, name, surface):
+        """
+        매니페스트 크기(배율 1)로 래스터화한 표면 (충돌 마스크가 창 크기에 따라 달라지지 않도록)
+        
+        다른 배율의 표면이나 새 배율을 기다리는 동안 쓰는 확대/축소본은 픽셀 경계가 달라지므로
+        사용하지 않고, SVG를 매니페스트 크기로 래스터화한 결과(디스크 캐시 사용)로 만듭니다.
+        
+        Args:
+            name (str): 애셋 이름
+            surface (pygame.Surface): get_asset이 돌려준 표면 (확대/축소본일 수 있음)
+            
+        Returns:
+            pygame.Surface: 논리 크기의 표면
+        """
+        spec = self.manifest.get(name)
+        if spec is None or not spec.size:
+            return surface
+        if self.assets.get(name) is surface:
+            if surface.get_size() == tuple(spec.size):
+                return surface  # 배율 1로 로드한 애셋 (아틀라스 영역 포함)
+            path = self.source_path(name)
+            if path is None:
+                return self._draw_fallback_surface(name, *spec.size)
+        else:
+            # 확대/축소본: 이 배율에서 아직 로드하지 않았으므로 로드할 때 사용할 경로로 래스터화
+            path = self.preferred_path(spec)
+        try:
+            size, pixels = self.fetch_raster(path, *spec.size)
+        except Exception as e:
+            print(f"Warning: Could not rasterize {path} for collision mask: {e}")
+            return self._draw_fallback_surface(name, *spec.size)
+        return pygame.image.frombuffer(pixels, size, "RGBA")
+    
+    def target_size(self, spec, scale=None):
+        """
+        주어진 배율에서 래스터화할 크기
+        
+        Args:
+            spec (AssetSpec): 매니페스트 항목
+            scale (float, optional): 배율 (기본값: 현재 배율)
+            
+        Returns:
+            tuple: (너비, 높이) 또는 크기가 정해지지 않았으면 (None, None)
+        """
+        if not spec.size:
+            return None, None
+        scale = self.scale if scale is None else scale
+        width, height = spec.size
+        if scale == 1:
+            return width, height
+        return max(1, round(width * scale)), max(1, round(height * scale))
+    
+    def set_scale(self, scale):
+        """
+        래스터화 배율 변경
+        
+        지금까지 로드한 애셋은 배율별 버킷에 보관해 두었다가 같은 배율로 돌아오면 그대로 사용합니다.
+        새 배율에 아직 없는 애셋은 다시 래스터화될 때까지 이전 표면을 확대/축소해 대신 사용합니다.
+        
+        Args:
+            scale (float): 새 배율
+            
+        Returns:
+            list: 새 배율로 다시 래스터화해야 하는 애셋 이름 (이전 배율에서 로드했던 것)
+        """
+        if scale == self.scale:
+            return []
+        previous = self.assets
+        self._scale_buckets[self.scale] = (self.assets, self._sources, self._resolved, self.atlas)
+        self.assets, self._sources, self._resolved, self.atlas = self._scale_buckets.pop(
+            scale, ({}, {}, set(), None))
+        self.scale = scale
+        
+        self._stand_ins = {}
+        for name, surface in previous.items():
+            if name in self.assets:
+                continue
+            spec = self.manifest.get(name)
+            width, height = self.target_size(spec) if spec else (None, None)
+            if width is None:
+                width, height = (max(1, round(length * scale)) for length in surface.get_size())
+            self._stand_ins[name] = pygame.transform.smoothscale(surface, (width, height))
+        return list(self._stand_ins)
+    
+    def build_masks(self, names):
+        """
+        여러 애셋의 충돌 마스크를 미리 만들기 (게임 중에 만들지 않도록)
+        
+        Args:
+            names (list): 애셋 이름 목록
+        """
+        for name in names:
+            self.get_mask(name)
+    
+    def register_assets(self, specs):
+        """
+        지연 로딩할 애셋을 매니페스트에 등록
+        
+        Args:
+            specs (list): AssetSpec 목록
+        """
+        for spec in specs:
+            self.manifest[spec.name] = spec
+            self._resolved.discard(spec.name)
+    
+    def resolve(self, name):
+        """
+        매니페스트 항목 하나를 래스터화
+        
+        Args:
+            name (str): 애셋 이름
+            
+        Returns:
+            bool: 로드 성공 여부
+        """
+        spec = self.manifest[name]
+        self._resolved.add(name)
+        self._stand_ins.pop(name, None)
+        width, height = self.target_size(spec)
+        
+        path = self.preferred_path(spec)
+        if self.load_svg(name, path, width, height):
+            return True
+        if spec.fallback_path and path != spec.fallback_path:
+            print(f"Loading fallback asset for {name}")
+            self._fall_back(spec)
+            return self.load_svg(name, spec.fallback_path, width, height)
+        return False
+    
+    def resolve_all(self, names=None, max_workers=None):
+        """
+        매니페스트 항목을 한 번에 래스터화 (병렬 처리)
+        
+        Args:
+            names (list, optional): 로드할 애셋 이름 목록 (기본값: 매니페스트 전체)
+            max_workers (int, optional): 최대 작업자 프로세스 수
+        """
+        if names is None:
+            names = list(self.manifest)
+        specs = [self.manifest[name] for name in names
+                 if name not in self._resolved and name in self.manifest]
+        
+        results = self.load_svg_batch(
+            [(spec.name, self.preferred_path(spec)) + self.target_size(spec) for spec in specs],
+            max_workers=max_workers
+        )
+        self._resolved.update(spec.name for spec in specs)
+        
+        # 실패한 항목은 대체 경로로 다시 로드 (같은 묶음의 이미 로드된 애셋도 함께 바꿈)
+        failed = [spec for spec in specs if not results.get(spec.name) and spec.fallback_path
+                  and self.preferred_path(spec) != spec.fallback_path]
+        if failed:
+            print("Loading fallback assets: " + ", ".join(spec.name for spec in failed))
+            for spec in failed:
+                self._fall_back(spec)
+            self.load_svg_batch([(spec.name, spec.fallback_path) + self.target_size(spec) for spec in failed],
+                                max_workers=max_workers)
+    
+    def prefetch(self, state):
+        """
+        게임 상태에 필요한 애셋을 미리 로드하도록 예약
+        
+        Args:
+            state: prefetch_hints의 키로 사용되는 게임 상태
+        """
+        for name in self.prefetch_hints.get(state, ()):
+            if name not in self.assets and name not in self._prefetch_queue:
+                self._prefetch_queue.append(name)
+    
+    def prefetch_step(self, max_items=1):
+        """
+        예약된 애셋을 일부 로드 (남는 프레임 시간에 호출)
+        
+        Args:
+            max_items (int): 이번에 로드할 최대 애셋 수
+            
+        Returns:
+            bool: 아직 로드할 애셋이 남아 있으면 True
+        """
+        while max_items > 0 and self._prefetch_queue:
+            name = self._prefetch_queue.popleft()
+            if name in self.assets or name in self._resolved or name not in self.manifest:
+                continue
+            self.resolve(name)
+            max_items -= 1
+        return bool(self._prefetch_queue)
+    
+    def build_default_manifest(self, screen_size=(800, 600), base_path="assets/svg"):
+        """
+        게임 기본 애셋 매니페스트 생성
+        
+        Args:
+            screen_size (tuple): 배경 크기 (너비, 높이)
+            base_path (str): SVG 애셋 루트 디렉토리
+            
+        Returns:
+            list: AssetSpec 목록
+        """
+        requests = (self.player_asset_requests(f"{base_path}/player")
+                    + self.obstacle_asset_requests(f"{base_path}/obstacles")
+                    + self.ui_asset_requests(f"{base_path}/ui")
+                    + self.background_asset_requests(f"{base_path}/background", screen_size))
+        
+        # 한글 버튼을 하나라도 로드할 수 없으면 두 버튼 모두 영어 버튼 사용
+        fallback_paths = {
+            "start_button": f"{base_path}/ui/start_button_en.svg",
+            "restart_button": f"{base_path}/ui/restart_button_en.svg",
+        }
+        return [AssetSpec(name, path, (width, height), fallback_paths.get(name),
+                          "buttons" if name in fallback_paths else None)
+                for name, path, width, height in requests]
+    
+    def build_atlas(self, names, max_width=DEFAULT_ATLAS_WIDTH):
+        """
+        애셋들을 하나의 텍스처 아틀라스로 묶기
+        
+        아틀라스에 들어간 애셋은 이후 get_asset에서 아틀라스의 서브서피스로 반환됩니다.
+        대체 이미지처럼 SVG에서 로드하지 않은 애셋은 제외합니다.
+        
+        Args:
+            names (list): 아틀라스에 넣을 애셋 이름 목록
+            max_width (int): 아틀라스 최대 너비
+            
+        Returns:
+            TextureAtlas: 생성된 아틀라스
+        """
+        surfaces = {}
+        sources = {}
+        for name in names:
+            surface = self.get_asset(name)
+            source = self._sources.get(name)
+            if surface is None or source is None:
+                continue
+            filepath, width, height = source
+            surfaces[name] = surface
+            sources[name] = {
+                "path": filepath,
+                "key": content_key(filepath, width, height, self.rasterizer.version),
+            }
+        
+        self.atlas = TextureAtlas.build(surfaces, sources, max_width)
+        self._use_atlas_regions()
+        return self.atlas
+    
+    def _atlas_paths(self, directory=None):
+        """아틀라스 이미지와 색인 파일 경로"""
+        directory = directory or os.path.join(self.cache_dir, "atlas")
+        return os.path.join(directory, "sprites.png"), os.path.join(directory, "sprites.json")
+    
+    def save_atlas(self, directory=None):
+        """
+        현재 아틀라스를 파일로 저장
+        
+        Args:
+            directory (str, optional): 저장 디렉토리 (기본값: 캐시 디렉토리 아래 atlas)
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if self.atlas is None:
+            return False
+        try:
+            self.atlas.save(*self._atlas_paths(directory))
+            return True
+        except (OSError, pygame.error) as e:
+            print(f"Warning: Could not save sprite atlas: {e}")
+            return False
+    
+    def load_atlas(self, directory=None):
+        """
+        저장된 아틀라스를 불러와 애셋으로 사용
+        
+        매니페스트의 SVG 내용이나 크기가 바뀌었으면 아틀라스를 사용하지 않습니다.
+        저장된 아틀라스는 배율 1 기준이므로 다른 배율에서는 사용하지 않습니다.
+        
+        Args:
+            directory (str, optional): 저장 디렉토리 (기본값: 캐시 디렉토리 아래 atlas)
+            
+        Returns:
+            bool: 아틀라스를 사용하게 되었으면 True
+        """
+        if self.scale != 1:
+            return False
+        atlas = TextureAtlas.load(*self._atlas_paths(directory))
+        if atlas is None:
+            return False
+        
+        for name in atlas.regions:
+            spec = self.manifest.get(name)
+            source = atlas.sources.get(name)
+            if spec is None or source is None:
+                return False
+            if source.get("path") not in (spec.path, spec.fallback_path):
+                return False
+            width, height = spec.size if spec.size else (None, None)
+            if source.get("key") != content_key(source["path"], width, height, self.rasterizer.version):
+                return False
+            if tuple(atlas.regions[name].size) != tuple(spec.size or atlas.regions[name].size):
+                return False
+        
+        # 같은 묶음의 애셋은 모두 원래 경로이거나 모두 대체 경로여야 함
+        groups = {}
+        for name, source in atlas.sources.items():
+            spec = self.manifest[name]
+            if spec.fallback_group is not None:
+                groups.setdefault(spec.fallback_group, set()).add(source["path"] == spec.fallback_path)
+        if any(len(kinds) > 1 for kinds in groups.values()):
+            return False
+        self._fallback_groups.update(group for group, kinds in groups.items() if True in kinds)
+        
+        self.atlas = atlas
+        self._use_atlas_regions()
+        for name, source in atlas.sources.items():
+            spec = self.manifest[name]
+            width, height = spec.size if spec.size else (None, None)
+            self._sources[name] = (source["path"], width, height)
+            self._resolved.add(name)
+        return True
+    
+    def _use_atlas_regions(self):
+        """아틀라스에 들어간 애셋을 서브서피스로 교체"""
+        for name in self.atlas.regions:
+            self.assets[name] = self.atlas.subsurface(name)
+            
+            # 픽셀이 같으므로 이미 만든 마스크는 그대로 사용
+            cached = self._masks.get(name)
+            if cached is not None:
+                self._masks[name] = (self.assets[name], cached[1])
+    
+    def get_asset_region(self, name):
+        """
+        애셋이 그려진 원본 표면과 영역 가져오기
+        
+        Args:
+            name (str): 애셋 이름
+            
+        Returns:
+            tuple: (pygame.Surface, pygame.Rect) 또는 애셋이 없으면 None
+        """
+        if self.atlas is not None and name in self.atlas:
+            return self.atlas.get_region(name)
+        asset = self.get_asset(name)
+        if asset is None:
+            return None
+        return asset, asset.get_rect()
+    
+    def player_asset_requests(self, base_path="assets/svg/player", size=(50, 50)):
+        """플레이어 관련 SVG 로드 요청 목록"""
+        return [
+            ("player_normal", f"{base_path}/player_normal.svg", size[0], size[1]),
+            ("player_left", f"{base_path}/player_left.svg", size[0], size[1]),
+            ("player_right", f"{base_path}/player_right.svg", size[0], size[1]),
+        ]
+    
+    def obstacle_asset_requests(self, base_path="assets/svg/obstacles"):
+        """장애물(똥) 관련 SVG 로드 요청 목록"""
+        return [
+            ("poop_small", f"{base_path}/poop_small.svg", 30, 30),
+            ("poop_medium", f"{base_path}/poop_medium.svg", 40, 40),
+            ("poop_large", f"{base_path}/poop_large.svg", 50, 50),
+        ]
+    
+    def ui_asset_requests(self, base_path="assets/svg/ui"):
+        """UI 관련 SVG 로드 요청 목록 (한글 버튼 포함)"""
+        return [
+            ("start_button", f"{base_path}/start_button.svg", 200, 60),
+            ("restart_button", f"{base_path}/restart_button.svg", 200, 60),
+            ("pause_button", f"{base_path}/pause_button.svg", 40, 40),
+            ("life_icon", f"{base_path}/life_icon.svg", 30, 30),
+            ("score_icon", f"{base_path}/score_icon.svg", 30, 30),
+        ]
+    
+    def background_asset_requests(self, base_path="assets/svg/background", screen_size=(800, 600)):
+        """배경 관련 SVG 로드 요청 목록"""
+        return [
+            ("background", f"{base_path}/background_elements.svg",
+             screen_size[0], screen_size[1]),
+            ("background_pattern", f"{base_path}/background_pattern.svg", 100, 100),
+        ]
+    
+    def load_all_assets(self, screen_size=(800, 600), parallel=True, max_workers=None):
+        """
+        모든 SVG 애셋 로드
+        
+        Args:
+            screen_size (tuple): 배경 크기 (너비, 높이)
+            parallel (bool): 프로세스 풀로 병렬 래스터화할지 여부
+            max_workers (int, optional): 최대 작업자 프로세스 수
+        """
+        if not self.manifest:
+            self.register_assets(self.build_default_manifest(screen_size))
+        
+        if not parallel:
+            max_workers = 1
+        self.resolve_all(max_workers=max_workers)
+
+
+def load_sprite_masks(asset_manager=None, rasterizer=None):
+    """
+    게임과 같은 스프라이트로 충돌 마스크 만들기
+    
+    애셋 관리자가 없으면 기본 매니페스트로 새로 만들므로 화면 없이 실행하는 시뮬레이션에서도
+    게임 화면과 같은 픽셀 단위 충돌 검사를 사용할 수 있습니다.
+    
+    Args:
+        asset_manager (SVGAssetManager, optional): 애셋 관리자 (없으면 새로 생성)
+        rasterizer (str, optional): 새로 만들 애셋 관리자의 래스터화 백엔드 이름
+    
+    Returns:
+        SpriteMasks: 플레이어 방향별, 똥 크기별 충돌 마스크
+    """
+    if asset_manager is None:
+        asset_manager = SVGAssetManager(rasterizer=rasterizer)
+        asset_manager.register_assets(asset_manager.build_default_manifest((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    return SpriteMasks.from_assets(asset_manager, PLAYER_DIRECTION_SPRITES, POOP_ASSET_NAMES)
@@ -0,0 +1,115 @@
+"""
+렌더링한 텍스트 표면을 재사용하는 LRU 캐시 모듈
+
+점수, HP, 제목처럼 매 프레임 같은 글자를 그리는 경우 FreeType 래스터화를 건너뜁니다.
+점수처럼 자주 바뀌는 숫자는 글자 단위(글리프)로 캐시해 조합합니다.
+"""
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024  # 4MB
+
+
+class TextCache:
+    """(글꼴, 문자열, 색상, 안티앨리어싱) 키로 텍스트 표면을 캐시하는 클래스"""
+
+    def __init__(self, max_bytes=DEFAULT_TEXT_CACHE_MAX_BYTES):
+        """
+        텍스트 캐시 초기화
+
+        Args:
+            max_bytes (int): 캐시할 표면의 최대 총 크기 (바이트)
+        """
+        self.max_bytes = max_bytes
+        self._surfaces = OrderedDict()  # 키 -> (표면, 바이트 수), 오래 사용하지 않은 것부터
+        self.total_bytes = 0
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, font, text, antialias, color):
+        """
+        텍스트 렌더링 (Font.render와 같은 인자 순서)
+
+        반환된 표면은 캐시와 공유되므로 수정하지 말아야 합니다.
+
+        Args:
+            font (pygame.font.Font): 글꼴
+            text (str): 문자열
+            antialias (bool): 안티앨리어싱 사용 여부
+            color (tuple): 글자 색상
+
+        Returns:
+            pygame.Surface: 렌더링된 텍스트 표면
+        """
+        key = (font, text, tuple(color), antialias)
+        entry = self._surfaces.get(key)
+        if entry is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        size = surface.get_pitch() * surface.get_height()
+        self._surfaces[key] = (surface, size)
+        self.total_bytes += size
+        self._evict()
+        return surface
+
+    def glyph_items(self, font, text, pos, antialias, color):
+        """
+        글자별로 캐시한 글리프를 이어 붙일 (표면, 위치) 목록
+
+        점수처럼 매번 다른 문자열이 되는 숫자에 사용합니다.
+        문자열 전체 대신 글자 단위로 캐시하므로 숫자 10개만 래스터화하면 됩니다.
+        (글자 사이 커닝은 적용되지 않음)
+
+        Args:
+            font (pygame.font.Font): 글꼴
+            text (str): 문자열
+            pos (tuple): 왼쪽 위 좌표
+            antialias (bool): 안티앨리어싱 사용 여부
+            color (tuple): 글자 색상
+
+        Returns:
+            list: Surface.blits에 넘길 (표면, (x, y)) 목록
+        """
+        x, y = pos
+        items = []
+        for char in text:
+            glyph = self.render(font, char, antialias, color)
+            items.append((glyph, (x, y)))
+            x += glyph.get_width()
+        return items
+
+    def _evict(self):
+        """용량을 넘으면 가장 오래 사용하지 않은 표면부터 삭제"""
+        while self.total_bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, (_, size) = self._surfaces.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """캐시 비우기 (글꼴을 바꿀 때 사용)"""
+        self._surfaces.clear()
+        self.total_bytes = 0
+
+    def hit_rate(self):
+        """
+        캐시 적중률
+
+        Returns:
+            float: 적중 비율 (0~1)
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,121 @@
+"""
+게임 논리 좌표를 창 크기에 맞는 화면 좌표로 바꾸는 모듈
+
+게임 로직은 항상 논리 해상도(SCREEN_WIDTH x SCREEN_HEIGHT)에서 진행하고,
+화면에 그릴 때만 배율을 곱합니다. 배율은 정해진 단계(버킷)로 맞춰
+애셋을 배율마다 한 번만 래스터화하면 되도록 하고, 남는 부분은 검은 여백으로 둡니다.
+"""
+import math
+
+import pygame
+
+SCALE_BUCKET_STEP = 0.25  # 배율 버킷 간격
+MIN_SCALE = 0.5  # 가장 작은 배율
+
+
+def scale_bucket(scale, step=SCALE_BUCKET_STEP, minimum=MIN_SCALE):
+    """
+    배율을 창 안에 들어가는 가장 큰 버킷으로 내림
+
+    Args:
+        scale (float): 창에 딱 맞는 배율
+        step (float): 버킷 간격
+        minimum (float): 가장 작은 배율
+
+    Returns:
+        float: 버킷 배율
+    """
+    return max(minimum, math.floor(scale / step + 1e-9) * step)
+
+
+class Viewport:
+    """논리 좌표와 창 안의 그리기 영역(캔버스) 좌표를 변환하는 클래스"""
+
+    def __init__(self, logical_size, window_size, step=SCALE_BUCKET_STEP):
+        """
+        뷰포트 초기화
+
+        Args:
+            logical_size (tuple): 게임 로직 해상도 (너비, 높이)
+            window_size (tuple): 창 크기 (너비, 높이)
+            step (float): 배율 버킷 간격
+        """
+        self.logical_size = tuple(logical_size)
+        self.window_size = tuple(window_size)
+        fit = min(window_size[0] / logical_size[0], window_size[1] / logical_size[1])
+        self.scale = scale_bucket(fit, step)
+        self.identity = self.scale == 1
+
+        # 창 가운데에 놓인 캔버스 영역 (창이 너무 작으면 창 밖으로 넘침)
+        self.width = round(logical_size[0] * self.scale)
+        self.height = round(logical_size[1] * self.scale)
+        self.canvas_rect = pygame.Rect((window_size[0] - self.width) // 2,
+                                       (window_size[1] - self.height) // 2,
+                                       self.width, self.height)
+
+    def length(self, value):
+        """
+        논리 길이를 화면 픽셀 수로 변환
+
+        Args:
+            value (float): 논리 길이
+
+        Returns:
+            int: 화면 픽셀 수
+        """
+        return round(value * self.scale)
+
+    def size(self, size):
+        """
+        논리 크기를 화면 크기로 변환
+
+        Args:
+            size (tuple): 논리 크기 (너비, 높이)
+
+        Returns:
+            tuple: 화면 크기 (너비, 높이)
+        """
+        return max(1, round(size[0] * self.scale)), max(1, round(size[1] * self.scale))
+
+    def point(self, pos):
+        """
+        논리 좌표를 캔버스 좌표로 변환
+
+        Args:
+            pos (tuple): 논리 좌표 (x, y)
+
+        Returns:
+            tuple: 캔버스 좌표 (x, y)
+        """
+        if self.identity:
+            return pos
+        return round(pos[0] * self.scale), round(pos[1] * self.scale)
+
+    def place(self, items):
+        """
+        (표면, 논리 위치) 목록을 Surface.blits에 넘길 (표면, 캔버스 좌표) 목록으로 변환
+
+        Args:
+            items (list): (표면, 논리 좌표 또는 pygame.Rect) 목록
+
+        Returns:
+            list: (표면, 캔버스 좌표) 목록 (배율이 1이면 받은 목록 그대로)
+        """
+        if self.identity:
+            return items
+        scale = self.scale
+        return [(surface, (round(dest[0] * scale), round(dest[1] * scale))) for surface, dest in items]
+
+    def to_logical(self, window_pos):
+        """
+        창 좌표(마우스 위치 등)를 논리 좌표로 변환
+
+        Args:
+            window_pos (tuple): 창 좌표 (x, y)
+
+        Returns:
+            tuple: 논리 좌표 (x, y)
+        """
+        x = (window_pos[0] - self.canvas_rect.x) / self.scale
+        y = (window_pos[1] - self.canvas_rect.y) / self.scale
+        return int(x), int(y)
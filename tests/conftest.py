@@ -0,0 +1,23 @@
+"""
+테스트 공통 설정
+
+src의 모듈을 바로 import할 수 있게 하고, 창과 소리 장치 없이 실행되도록 SDL 더미 드라이버를 사용합니다.
+애셋 경로는 저장소 루트 기준이므로 테스트는 저장소 루트에서 실행합니다.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+@pytest.fixture
+def repo_root(monkeypatch):
+    """저장소 루트를 현재 디렉토리로 (매니페스트의 assets/... 상대 경로용)"""
+    monkeypatch.chdir(ROOT)
+    return ROOT
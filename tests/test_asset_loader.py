@@ -0,0 +1,61 @@
+"""백그라운드 로더가 애셋 관리자와 같은 경로(대체 묶음 포함)로 래스터화하는지 확인"""
+import os
+import shutil
+import threading
+
+import pytest
+
+import svg_utils
+from asset_loader import AssetLoader
+from svg_utils import SVGAssetManager
+
+BUTTONS = ["start_button", "restart_button"]
+
+
+@pytest.fixture
+def svg_root(repo_root, tmp_path):
+    root = tmp_path / "svg"
+    shutil.copytree(os.path.join(repo_root, "assets", "svg"), root)
+    return root
+
+
+def load_buttons(svg_root, cache_dir):
+    manager = SVGAssetManager(cache_dir=str(cache_dir))
+    manager.register_assets(manager.build_default_manifest((800, 600), str(svg_root)))
+    main_thread_loads = []
+    load_svg = manager.load_svg
+    manager.load_svg = lambda name, path, *size: main_thread_loads.append(name) or load_svg(name, path, *size)
+
+    loader = AssetLoader(manager, BUTTONS, max_workers=1)
+    loader.start()
+    loader.wait()
+    return manager, main_thread_loads
+
+
+def test_missing_button_switches_group_in_loader(svg_root, tmp_path):
+    os.remove(svg_root / "ui" / "restart_button.svg")
+    manager, main_thread_loads = load_buttons(svg_root, tmp_path / "cache")
+
+    assert main_thread_loads == []  # 메인 스레드에서 다시 래스터화하지 않음
+    for name in BUTTONS:
+        assert manager.source_path(name) == str(svg_root / "ui" / f"{name}_en.svg")
+
+
+def test_broken_button_fallback_is_warm(svg_root, tmp_path, monkeypatch):
+    (svg_root / "ui" / "restart_button.svg").write_bytes(b"\x00not an svg")
+    main_thread_rasterized = []
+    rasterize_svg = svg_utils.rasterize_svg
+
+    def record(filepath, *args):
+        if threading.current_thread() is threading.main_thread():
+            main_thread_rasterized.append(filepath)
+        return rasterize_svg(filepath, *args)
+
+    monkeypatch.setattr(svg_utils, "rasterize_svg", record)
+    manager, main_thread_loads = load_buttons(svg_root, tmp_path / "cache")
+
+    # 이미 보낸 한글 시작 버튼은 메인 스레드가 바꾸지만 로더가 미리 채운 캐시에서 읽음
+    for name in BUTTONS:
+        assert manager.source_path(name) == str(svg_root / "ui" / f"{name}_en.svg")
+    assert main_thread_loads == ["start_button"]
+    assert main_thread_rasterized == []
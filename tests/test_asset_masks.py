@@ -0,0 +1,45 @@
+"""충돌 마스크가 창 배율과 관계없이 배율 1 래스터에서 만들어지는지 확인"""
+import pytest
+
+from svg_utils import SVGAssetManager
+
+NAMES = ["player_normal", "player_left", "poop_large", "poop_small"]
+
+
+def same_mask(a, b):
+    return a.get_size() == b.get_size() and a.count() == b.count() == a.overlap_area(b, (0, 0))
+
+
+@pytest.fixture
+def manager(repo_root, tmp_path):
+    manager = SVGAssetManager(cache_dir=str(tmp_path))
+    manager.register_assets(manager.build_default_manifest((800, 600)))
+    return manager
+
+
+@pytest.mark.parametrize("scale", [2.0, 0.5, 1.5])
+def test_stand_in_and_rescaled_masks_match_scale_one(manager, scale):
+    reference = {name: manager.get_mask(name) for name in NAMES}
+    manager.set_scale(scale)
+
+    for name in NAMES:
+        # 새 배율로 래스터화하기 전에는 확대/축소본을 쓰지만 마스크는 배율 1 래스터에서 만듦
+        assert manager.get_asset(name) is not manager.assets.get(name)
+        stand_in_mask = manager.get_mask(name)
+        assert same_mask(stand_in_mask, reference[name])
+
+        # 실제 애셋으로 바뀌면 마스크를 다시 만들고 결과는 같음
+        manager.resolve(name)
+        mask = manager.get_mask(name)
+        assert mask is not stand_in_mask
+        assert same_mask(mask, reference[name])
+
+
+def test_returning_to_scale_one_keeps_masks(manager):
+    reference = {name: manager.get_mask(name) for name in NAMES}
+    manager.set_scale(2.0)
+    manager.resolve_all(NAMES, max_workers=1)
+    manager.set_scale(1.0)
+
+    for name in NAMES:
+        assert same_mask(manager.get_mask(name), reference[name])
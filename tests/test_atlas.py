@@ -0,0 +1,76 @@
+"""선반 방식 아틀라스 배치와 저장/불러오기 확인"""
+import itertools
+
+import pygame
+import pytest
+
+from atlas import TextureAtlas, pack_shelves
+
+
+def assert_valid_packing(regions, size, sizes, max_width, padding):
+    for name, rect in regions.items():
+        assert rect.size == tuple(sizes[name])
+        assert rect.left >= 0 and rect.top >= 0
+        assert rect.right <= min(size[0], max_width) and rect.bottom <= size[1]
+    # 오른쪽/아래 여백까지 넓힌 영역도 다른 스프라이트와 겹치지 않음
+    for a, b in itertools.permutations(regions.values(), 2):
+        assert not pygame.Rect(a.x, a.y, a.w + padding, a.h + padding).colliderect(b)
+
+
+def test_single_shelf():
+    regions, size = pack_shelves({"a": (30, 30), "b": (50, 50), "c": (40, 40)}, max_width=512, padding=1)
+
+    # 높이가 큰 순서로 한 줄에 배치
+    assert [regions[name].x for name in "bca"] == [0, 51, 92]
+    assert all(rect.y == 0 for rect in regions.values())
+    assert size == (122, 50)
+
+
+def test_wraps_to_next_shelf():
+    sizes = {"a": (60, 50), "b": (60, 40), "c": (60, 30)}
+    regions, size = pack_shelves(sizes, max_width=130, padding=2)
+
+    assert (regions["a"].topleft, regions["b"].topleft) == ((0, 0), (62, 0))
+    assert regions["c"].topleft == (0, 52)  # 첫 줄 높이(가장 큰 스프라이트) + 여백
+    assert size == (122, 82)
+    assert_valid_packing(regions, size, sizes, 130, 2)
+
+
+def test_many_sprites_do_not_overlap():
+    sizes = {f"s{index}": (10 + index * 7 % 53, 8 + index * 11 % 41) for index in range(40)}
+    regions, size = pack_shelves(sizes, max_width=200, padding=1)
+
+    assert set(regions) == set(sizes)
+    assert_valid_packing(regions, size, sizes, 200, 1)
+
+
+def test_rejects_sprite_wider_than_atlas():
+    with pytest.raises(ValueError):
+        pack_shelves({"wide": (600, 10)}, max_width=512)
+
+
+def test_build_save_and_load(tmp_path):
+    surfaces = {}
+    for name, color in (("red", (255, 0, 0, 255)), ("green", (0, 255, 0, 128))):
+        surface = pygame.Surface((20, 10), pygame.SRCALPHA)
+        surface.fill(color)
+        surfaces[name] = surface
+    atlas = TextureAtlas.build(surfaces, sources={"red": {"path": "red.svg"}})
+    image_path, index_path = str(tmp_path / "atlas.png"), str(tmp_path / "atlas.json")
+    atlas.save(image_path, index_path)
+    loaded = TextureAtlas.load(image_path, index_path)
+
+    assert loaded.regions == atlas.regions
+    assert loaded.sources == {"red": {"path": "red.svg"}}
+    assert loaded.subsurface("red").get_at((5, 5)) == (255, 0, 0, 255)
+    assert loaded.subsurface("green").get_at((5, 5)) == (0, 255, 0, 128)
+
+
+def test_load_missing_or_mismatched(tmp_path):
+    assert TextureAtlas.load(str(tmp_path / "none.png"), str(tmp_path / "none.json")) is None
+
+    atlas = TextureAtlas.build({"a": pygame.Surface((4, 4), pygame.SRCALPHA)})
+    image_path, index_path = str(tmp_path / "atlas.png"), str(tmp_path / "atlas.json")
+    atlas.save(image_path, index_path)
+    pygame.image.save(pygame.Surface((8, 8)), image_path)  # 색인과 크기가 다른 이미지
+    assert TextureAtlas.load(image_path, index_path) is None
@@ -0,0 +1,57 @@
+"""스윕 광역 단계 충돌 검사가 Rect.collidelistall과 같은 결과를 내는지 확인"""
+import random
+
+import pygame
+import pytest
+
+from collision import CollisionWorld
+
+
+def random_rects(rng, count, max_size=60):
+    return [pygame.Rect(rng.randint(-50, 800), rng.randint(-50, 600),
+                        rng.randint(0, max_size), rng.randint(0, max_size)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sweep_matches_collidelistall(seed):
+    rng = random.Random(seed)
+    colliders = random_rects(rng, 50, max_size=120)
+    rects = random_rects(rng, 300)
+    world = CollisionWorld(sweep_min_colliders=1, sweep_min_obstacles=1)
+
+    assert world.find_collisions(colliders, rects) == [c.collidelistall(rects) for c in colliders]
+
+
+def test_sweep_edges_and_empty_rects():
+    # 모서리만 맞닿은 경우와 크기가 0인 사각형은 Rect.colliderect처럼 충돌하지 않음
+    collider = pygame.Rect(100, 100, 50, 50)
+    rects = [pygame.Rect(150, 100, 10, 10), pygame.Rect(90, 150, 10, 10),
+             pygame.Rect(149, 149, 10, 10), pygame.Rect(120, 120, 0, 0),
+             pygame.Rect(0, 0, 400, 400), pygame.Rect(60, 110, 41, 5)]
+    world = CollisionWorld(sweep_min_colliders=1, sweep_min_obstacles=1)
+
+    assert world.find_collisions([collider], rects) == [collider.collidelistall(rects)]
+
+
+def test_small_inputs_use_collidelistall():
+    rng = random.Random(1)
+    colliders = random_rects(rng, 3, max_size=120)
+    rects = random_rects(rng, 10)
+    world = CollisionWorld()
+
+    assert world.find_collisions(colliders, rects) == [c.collidelistall(rects) for c in colliders]
+    assert world.candidates_tested == len(colliders) * len(rects)
+    assert world.find_collisions(colliders, []) == [[], [], []]
+
+
+def test_masks_overlap():
+    solid = pygame.mask.Mask((10, 10), fill=True)
+    corner = pygame.mask.Mask((10, 10))
+    corner.set_at((9, 9))
+    world = CollisionWorld()
+    a = pygame.Rect(0, 0, 10, 10)
+
+    assert world.masks_overlap(a, solid, pygame.Rect(9, 9, 10, 10), corner) is False
+    assert world.masks_overlap(a, solid, pygame.Rect(-9, -9, 10, 10), corner) is True
+    assert world.masks_overlap(a, None, pygame.Rect(9, 9, 10, 10), corner) is True  # 마스크 없으면 사각형 기준
+    assert (world.masks_tested, world.masks_rejected) == (2, 1)
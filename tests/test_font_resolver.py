@@ -0,0 +1,46 @@
+"""폰트 검색 결과 캐시가 폰트 디렉토리 변경(하위 디렉토리 포함) 시 무효화되는지 확인"""
+import os
+
+from font_resolver import FontResolver
+
+
+def make_resolver(tmp_path):
+    font_dir = tmp_path / "fonts"
+    sub_dir = font_dir / "truetype" / "noto"
+    sub_dir.mkdir(parents=True)
+    font = sub_dir / "Font.ttf"
+    font.write_bytes(b"font")
+    # 같은 시각 안에 파일을 추가해도 수정 시각이 바뀌도록 과거 시각으로 설정
+    for path in (sub_dir, sub_dir.parent, font_dir):
+        os.utime(path, (1, 1))
+    resolver = FontResolver(cache_dir=str(tmp_path / "cache"), preferred_paths=[str(font)],
+                            font_dirs=[str(font_dir)])
+    return resolver, sub_dir
+
+
+def test_cached_result_is_reused(tmp_path):
+    resolver, _ = make_resolver(tmp_path)
+    first = resolver.resolve()
+    assert not resolver.from_cache
+
+    assert resolver.resolve() == first
+    assert resolver.from_cache
+
+
+def test_font_added_in_subdirectory_invalidates_cache(tmp_path):
+    resolver, sub_dir = make_resolver(tmp_path)
+    resolver.resolve()
+
+    (sub_dir / "NewFont.ttf").write_bytes(b"new")
+
+    resolver.resolve()
+    assert not resolver.from_cache
+
+
+def test_missing_font_dirs_are_ignored(tmp_path):
+    resolver, _ = make_resolver(tmp_path)
+    resolver.font_dirs = resolver.font_dirs + [str(tmp_path / "missing")]
+    resolver.resolve()
+
+    resolver.resolve()
+    assert resolver.from_cache
@@ -0,0 +1,50 @@
+"""화면 게임과 헤드리스 시뮬레이션이 같은 시드와 입력으로 같은 점수를 내는지 확인"""
+import pytest
+
+from replay import Replay, ReplayInput, FLAG_LEFT, FLAG_RIGHT, FLAG_START
+from simulation import run_headless
+
+SEED = 1
+FRAMES = 1800  # 게임 시간 30초
+
+
+class SteppingReplayInput(ReplayInput):
+    """틱마다 다음 프레임으로 넘어가는 입력 재생기 (run_headless용, Game은 직접 end_frame 호출)"""
+
+    def read(self, sim):
+        inputs = super().read(sim)
+        self.end_frame()
+        return inputs
+
+
+def make_replay(seed=SEED, frames=FRAMES):
+    """왼쪽/오른쪽/정지를 번갈아 누르는 입력 기록 (첫 프레임에 시작 요청)"""
+    pattern = (FLAG_LEFT, FLAG_RIGHT, 0, 0)
+    replay = Replay(seed, bytes(pattern[(frame // 45) % len(pattern)] for frame in range(frames)))
+    replay.frames[0] |= FLAG_START
+    return replay
+
+
+@pytest.fixture
+def game(repo_root):
+    main = pytest.importorskip("main")
+    return main.Game(seed=SEED, background_loading=False, adaptive_quality=False)
+
+
+def test_game_and_headless_scores_match(game):
+    replay = make_replay()
+    result = game.play_replay(replay)
+    stats = run_headless(FRAMES, SEED, input_source=SteppingReplayInput(replay))
+
+    assert not game.sim.game_over
+    assert stats["games"] == 0
+    assert stats["unfinished_score"] == result["score"]
+
+
+def test_headless_uses_pixel_collision(repo_root):
+    # 같은 입력이라도 사각형만 검사하면 투명한 모서리에 맞아 결과가 달라짐
+    replay = make_replay()
+    pixel = run_headless(FRAMES, SEED, input_source=SteppingReplayInput(replay))
+    rect = run_headless(FRAMES, SEED, input_source=SteppingReplayInput(replay), pixel_collision=False)
+
+    assert (pixel["games"], pixel["unfinished_score"]) != (rect["games"], rect["unfinished_score"])
@@ -0,0 +1,72 @@
+"""래스터 캐시 저장/조회, 손상된 항목 처리, LRU 삭제 확인"""
+import os
+
+from raster_cache import RasterCache, content_key
+
+SIZE = (4, 4)
+PIXELS = bytes(range(64))
+ENTRY_BYTES = 8 + len(PIXELS)  # 헤더(너비, 높이) + RGBA
+
+
+def set_last_used(cache, key, timestamp):
+    os.utime(cache._entry_path(key), (timestamp, timestamp))
+
+
+def test_put_and_get(tmp_path):
+    cache = RasterCache(str(tmp_path))
+    assert cache.get("a") is None
+    cache.put("a", SIZE, PIXELS)
+
+    assert cache.get("a") == (SIZE, PIXELS)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_corrupt_entry_is_discarded(tmp_path):
+    cache = RasterCache(str(tmp_path))
+    cache.put("a", SIZE, PIXELS)
+    path = cache._entry_path("a")
+    with open(path, "r+b") as f:
+        f.truncate(ENTRY_BYTES - 1)
+
+    assert cache.get("a") is None
+    assert not os.path.exists(path)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = RasterCache(str(tmp_path), max_bytes=2 * ENTRY_BYTES)
+    cache.put("a", SIZE, PIXELS)
+    set_last_used(cache, "a", 1000)
+    cache.put("b", SIZE, PIXELS)
+    set_last_used(cache, "b", 2000)
+
+    # a를 읽으면 마지막 사용 시각이 갱신되어 b가 가장 오래된 항목이 됨
+    assert cache.get("a") is not None
+    cache.put("c", SIZE, PIXELS)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == (SIZE, PIXELS)
+    assert cache.get("c") == (SIZE, PIXELS)
+
+
+def test_evicts_until_under_limit(tmp_path):
+    cache = RasterCache(str(tmp_path), max_bytes=3 * ENTRY_BYTES)
+    for index, key in enumerate("abcd"):
+        cache.put(key, SIZE, PIXELS)
+        set_last_used(cache, key, 1000 + index)
+    cache.max_bytes = ENTRY_BYTES
+    cache.evict()
+
+    assert [key for key in "abcd" if cache.get(key) is not None] == ["d"]
+
+
+def test_content_key_changes_with_inputs(tmp_path):
+    svg = tmp_path / "sprite.svg"
+    svg.write_text("<svg/>")
+    key = content_key(str(svg), 30, 30, "r-1")
+
+    assert key == content_key(str(svg), 30, 30, "r-1")
+    assert key != content_key(str(svg), 60, 60, "r-1")
+    assert key != content_key(str(svg), 30, 30, "r-2")
+    svg.write_text("<svg></svg>")
+    assert key != content_key(str(svg), 30, 30, "r-1")
+    assert content_key(str(tmp_path / "missing.svg"), 30, 30, "r-1") is None
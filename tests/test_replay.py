@@ -0,0 +1,86 @@
+"""입력 기록 런 길이 부호화(LEB128 반복 횟수)와 파일 형식 왕복 확인"""
+import random
+
+import pytest
+
+from replay import (Replay, ReplayRecorder, ReplayInput, encode_runs, decode_runs,
+                    FLAG_LEFT, FLAG_RIGHT, FLAG_START)
+
+
+@pytest.mark.parametrize("frames", [
+    b"",
+    b"\x00",
+    bytes([FLAG_LEFT]) * 127,  # 반복 횟수 1바이트의 최댓값
+    bytes([FLAG_LEFT]) * 128,  # 2바이트로 넘어가는 경계
+    bytes([FLAG_RIGHT]) * 16384,  # 3바이트로 넘어가는 경계
+    bytes([FLAG_START, 0, 0, FLAG_LEFT, FLAG_LEFT | FLAG_RIGHT]),
+])
+def test_runs_round_trip(frames):
+    assert decode_runs(encode_runs(frames), len(frames)) == frames
+
+
+def test_runs_round_trip_random():
+    rng = random.Random(0)
+    frames = bytearray()
+    for _ in range(500):
+        frames.extend(bytes([rng.choice((0, FLAG_LEFT, FLAG_RIGHT, FLAG_START))]) * rng.randint(1, 400))
+    assert decode_runs(encode_runs(frames), len(frames)) == frames
+
+
+def test_run_length_encoding():
+    # (플래그, 반복 횟수) 쌍, 300 = 0b10_0101100 -> 0xAC 0x02
+    assert encode_runs(bytes([FLAG_LEFT]) * 300 + b"\x00") == bytes([FLAG_LEFT, 0xAC, 0x02, 0x00, 0x01])
+
+
+def test_decode_rejects_corrupt_data():
+    data = encode_runs(bytes([FLAG_LEFT]) * 300)
+    with pytest.raises(ValueError):
+        decode_runs(data[:-1], 300)
+    with pytest.raises(ValueError):
+        decode_runs(data, 299)
+
+
+def test_file_round_trip(tmp_path):
+    replay = Replay(-1234, bytes([FLAG_START]) + bytes([FLAG_LEFT]) * 200 + bytes([0, FLAG_RIGHT]) * 50)
+    path = tmp_path / "session.pdrp"
+    replay.save(str(path))
+    loaded = Replay.load(str(path))
+
+    assert loaded.seed == replay.seed
+    assert loaded.frames == replay.frames
+
+
+def test_from_bytes_rejects_other_files():
+    data = bytearray(Replay(1, b"\x00").to_bytes())
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b"PDRP")
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b"XXXX" + bytes(data[4:]))
+    data[4] += 1  # 버전
+    with pytest.raises(ValueError):
+        Replay.from_bytes(bytes(data))
+
+
+class ScriptedInput:
+    def __init__(self, inputs):
+        self.inputs = iter(inputs)
+
+    def read(self, sim):
+        return next(self.inputs)
+
+
+def test_recorder_and_player_agree():
+    inputs = [(True, False), (False, True), (True, True), (False, False)] * 10
+    recorder = ReplayRecorder(ScriptedInput(inputs), seed=7)
+    recorder.mark_start()
+    for _ in inputs:
+        recorder.read(None)
+        recorder.end_frame()
+
+    player = ReplayInput(Replay.from_bytes(recorder.replay.to_bytes()))
+    assert player.start_requested()
+    played = []
+    while not player.finished():
+        played.append(player.read(None))
+        player.end_frame()
+    assert played == inputs